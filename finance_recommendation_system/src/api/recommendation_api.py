@@ -91,13 +91,12 @@ def get_recommender():
                 # 예시 상품 데이터 생성
                 create_sample_product_data()
             
-            # 추천 엔진 초기화
-            recommender = FinancialRecommender(model_dir=MODEL_DIR, product_db_path=PRODUCT_DB_PATH)
-            
-            # 모델 로드 시도
-            for product_type in ['deposit', 'loan', 'fund']:
-                for model_type in ['lightgbm', 'random_forest']:
-                    recommender.load_model(product_type, model_type)
+            # 추천 엔진 초기화 (기본 LightGBM 모델은 미리 로드하고 나머지 모델은 처음 요청될 때 로드)
+            recommender = FinancialRecommender(
+                model_dir=MODEL_DIR,
+                product_db_path=PRODUCT_DB_PATH,
+                preload_models=[(product_type, 'lightgbm') for product_type in ['deposit', 'loan', 'fund']]
+            )
             
             logger.info("추천 엔진 초기화 완료")
         except Exception as e:
@@ -365,9 +364,9 @@ async def recommend_products(
         if 'member_no' not in customer_data.columns:
             customer_data['member_no'] = request.customer_id
         
-        # 모델 확인
+        # 모델 확인 (로드되지 않은 모델은 여기서 로드)
         model_key = f"{product_type}_{model_type}"
-        if model_key not in recommender.models:
+        if recommender.get_model(product_type, model_type) is None:
             # 모델이 없는 경우 샘플 모델 학습
             logger.warning(f"모델이 없습니다: {model_key}. 샘플 모델을 학습합니다.")
             train_sample_models()
@@ -5,15 +5,239 @@
 """
 
 import os
-import glob
+import sys
+import hashlib
+import threading
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from types import MappingProxyType
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple, Iterator
 from datetime import datetime
+from pathlib import Path
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
 
 logger = logging.getLogger(__name__)
 
+# CSV 청크 단위 로드 크기 (행 수)
+CSV_CHUNK_SIZE = 200_000
+
+# 파싱된 파일 캐시 설정 (메모리 LRU 최대 개수, data_dir 하위 Parquet 캐시 디렉토리)
+FILE_CACHE_SIZE = 32
+FILE_CACHE_DIR = ".cache"
+
+
+def _nullable_dtype(dtype: Any) -> Any:
+    """
+    read_csv에 전달할 dtype 변환
+    
+    정수형 컬럼은 결측치가 있으면 파싱에 실패하므로 pandas nullable 정수형(Int64 등)으로 바꿉니다.
+    
+    Args:
+        dtype: 스키마에 정의된 데이터 타입
+        
+    Returns:
+        Any: read_csv용 데이터 타입
+    """
+    if pd.api.types.is_integer_dtype(dtype):
+        return f"Int{np.dtype(dtype).itemsize * 8}"
+    return dtype
+
+
+def _freeze_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    스키마 정의를 불변 구조로 변환
+    
+    컬럼 이름을 intern하여 파싱 결과의 컬럼 이름과 사전 조회 시 동일 객체 비교가 되도록 하고,
+    사용 컬럼은 튜플, 데이터 타입은 읽기 전용 매핑으로 바꿉니다.
+    
+    Args:
+        schema: 사용 컬럼(usecols)과 데이터 타입(dtypes) 정의
+        
+    Returns:
+        Dict[str, Any]: 변환된 스키마
+    """
+    return {
+        "usecols": tuple(sys.intern(col) for col in schema["usecols"]),
+        "dtypes": MappingProxyType({sys.intern(col): dtype for col, dtype in schema["dtypes"].items()})
+    }
+
+
+# 테이블별 스키마 (사용 컬럼 및 데이터 타입, 모듈 로드 시 한 번만 변환)
+_SCHEMAS = MappingProxyType({sys.intern(name): _freeze_schema(schema) for name, schema in {
+    "회원정보": {
+        "usecols": ["job_mon", "member_no", "code_gender", "age", "code_vip", 
+                   "code_topcard_grade", "yn_member_ups", "yn_ca_member_ups", 
+                   "yn_cl_member_ups", "yn_credit_pss"],
+        "dtypes": {
+            "job_mon": str, "member_no": str, "code_gender": str, "age": str,
+            "code_vip": str, "code_topcard_grade": str, "yn_member_ups": str,
+            "yn_ca_member_ups": str, "yn_cl_member_ups": str, "yn_credit_pss": str
+        }
+    },
+    "신용정보": {
+        "usecols": ["job_mon", "member_no", "amt_limit_1st", "amt_credit_limit_use", 
+                   "amt_ca_limit", "amt_cl_limit_fpbl", "amt_cl_limit_mpbl", 
+                   "rate_ca_interest_dis_bf", "rate_cl_interest_dis_bf", "rate_rv_interest_dis_bf"],
+        "dtypes": {
+            "job_mon": str, "member_no": str, "amt_limit_1st": float, 
+            "amt_credit_limit_use": float, "amt_ca_limit": float, "amt_cl_limit_fpbl": float,
+            "amt_cl_limit_mpbl": float, "rate_ca_interest_dis_bf": "float32",
+            "rate_cl_interest_dis_bf": "float32", "rate_rv_interest_dis_bf": "float32"
+        }
+    },
+    "승인매출정보": {
+        "usecols": ["job_mon", "member_no", "day_max_base", "day_max_crsl", 
+                   "day_max_ca", "day_max_cl", "day_max_chk", "day_max_pif", 
+                   "day_max_int", "cnt_ccd_b0m"],
+        "dtypes": {
+            "job_mon": str, "member_no": str, "day_max_base": str, "day_max_crsl": str,
+            "day_max_ca": str, "day_max_cl": str, "day_max_chk": str, "day_max_pif": str,
+            "day_max_int": str, "cnt_ccd_b0m": "int16"
+        }
+    },
+    "청구입금정보": {
+        "usecols": ["job_mon", "member_no", "date_pay", "code_pay", 
+                   "code_address_billing", "code_billing", "code_billing2", 
+                   "YN_billing_B0M", "YN_billing_R3M", "YN_billing_R6M"],
+        "dtypes": {
+            "job_mon": str, "member_no": str, "date_pay": str, "code_pay": str,
+            "code_address_billing": str, "code_billing": str, "code_billing2": str,
+            "YN_billing_B0M": str, "YN_billing_R3M": str, "YN_billing_R6M": str
+        }
+    },
+    "잔액정보": {
+        "usecols": ["job_mon", "member_no", "bal_B0M", "bal_pif_B0M", 
+                   "bal_int_B0M", "bal_ca_B0M", "bal_RV_pif_B0M", 
+                   "bal_RV_ca_B0M", "bal_cl_B0M", "avg_bal_pif_B0M"],
+        "dtypes": {
+            "job_mon": str, "member_no": str, "bal_B0M": float, "bal_pif_B0M": float,
+            "bal_int_B0M": float, "bal_ca_B0M": float, "bal_RV_pif_B0M": float,
+            "bal_RV_ca_B0M": float, "bal_cl_B0M": float, "avg_bal_pif_B0M": float
+        }
+    },
+    "채널정보": {
+        "usecols": ["job_mon", "member_no", "cnt_ARS_R6M", "cnt_ARS_menu_R6M", 
+                   "day_ARS_R6M", "mn_ARS_R6M", "mn_elapsed_ARS_R6M", 
+                   "cnt_ARS_B0M", "cnt_menu_ARS_B0M", "day_ARS_B0M"],
+        "dtypes": {
+            "job_mon": str, "member_no": str, "cnt_ARS_R6M": "int16", "cnt_ARS_menu_R6M": "int16",
+            "day_ARS_R6M": "int16", "mn_ARS_R6M": "int32", "mn_elapsed_ARS_R6M": "int32",
+            "cnt_ARS_B0M": "int16", "cnt_menu_ARS_B0M": "int16", "day_ARS_B0M": "int16"
+        }
+    },
+    "마케팅정보": {
+        "usecols": ["job_mon", "member_no", "cnt_CL_TM_B0M", "cnt_RV_TM_B0M", 
+                   "cnt_CA_TM_B0M", "cnt_promotion_TM_B0M", "cnt_card_Issue_TM_B0M", 
+                   "cnt_ETC_TM_B0M", "cnt_point_TM_B0M", "cnt_Insurance_TM_B0M"],
+        "dtypes": {
+            "job_mon": str, "member_no": str, "cnt_CL_TM_B0M": "int16", "cnt_RV_TM_B0M": "int16",
+            "cnt_CA_TM_B0M": "int16", "cnt_promotion_TM_B0M": "int16", "cnt_card_Issue_TM_B0M": "int16",
+            "cnt_ETC_TM_B0M": "int16", "cnt_point_TM_B0M": "int16", "cnt_Insurance_TM_B0M": "int16"
+        }
+    },
+    "성과정보": {
+        "usecols": ["job_mon", "member_no", "ratio_CNT_ccd_B1M", "ratio_CNT_crsl_B1M", 
+                   "ratio_CNT_pif_B1M", "ratio_CNT_int_B1M", "ratio_CNT_ca_B1M", 
+                   "ratio_CNT_chk_B1M", "ratio_CNT_cl_B1M", "ratio_amt_ccd_B1M"],
+        "dtypes": {
+            "job_mon": str, "member_no": str, "ratio_CNT_ccd_B1M": "float32", "ratio_CNT_crsl_B1M": "float32",
+            "ratio_CNT_pif_B1M": "float32", "ratio_CNT_int_B1M": "float32", "ratio_CNT_ca_B1M": "float32",
+            "ratio_CNT_chk_B1M": "float32", "ratio_CNT_cl_B1M": "float32", "ratio_amt_ccd_B1M": "float32"
+        }
+    },
+    "개인CB정보": {
+        "usecols": ["STDT", "ID", "GENDER", "AGE_BAND", "C1Z001373", 
+                   "C1M2B4W03", "C1M2B5W03", "C1Z001386", "C1M210000", "C1M210001"],
+        "dtypes": {
+            "STDT": str, "ID": str, "GENDER": str, "AGE_BAND": str, "C1Z001373": float,
+            "C1M2B4W03": float, "C1M2B5W03": float, "C1Z001386": float,
+            "C1M210000": "int32", "C1M210001": "int32"
+        }
+    },
+    "기업CB정보": {
+        "usecols": ["BS_DT", "ID", "SIC_CD_3", "WG_GB", "FNDT_DT", 
+                   "EMPE_CNT", "CT_CNTY_GU_CD", "LISTD_DT", "LISTD_ABOL_DT", "FN1_1"],
+        "dtypes": {
+            "BS_DT": str, "ID": str, "SIC_CD_3": str, "WG_GB": str, "FNDT_DT": str,
+            "EMPE_CNT": "int32", "CT_CNTY_GU_CD": str, "LISTD_DT": str,
+            "LISTD_ABOL_DT": str, "FN1_1": float
+        }
+    },
+    "통신카드CB결합정보": {
+        "usecols": ["BASE_YM", "CUST_ID", "SEX", "AGE", "JB_TP", 
+                   "HOME_ADM", "COM_ADM", "HIGHEND_CD1", "HIGHEND_CD2", "HIGHEND_CD3"],
+        "dtypes": {
+            "BASE_YM": str, "CUST_ID": str, "SEX": str, "AGE": str, "JB_TP": str,
+            "HOME_ADM": str, "COM_ADM": str, "HIGHEND_CD1": str,
+            "HIGHEND_CD2": str, "HIGHEND_CD3": str
+        }
+    }
+}.items()})
+
+# 스키마별 read_csv 인자 (파서 단계에서 컬럼 선택 및 타입 지정)
+_READ_KWARGS = MappingProxyType({
+    name: {
+        "usecols": frozenset(schema["usecols"]).__contains__,
+        "dtype": {col: _nullable_dtype(dtype) for col, dtype in schema["dtypes"].items()}
+    }
+    for name, schema in _SCHEMAS.items()
+})
+
+# 테이블별 필수 컬럼 (정의되지 않은 테이블은 기본 키 컬럼 사용)
+_REQUIRED_COLS = MappingProxyType({
+    '개인CB정보': ('STDT', 'ID'),
+    '기업CB정보': ('BS_DT', 'ID'),
+    '통신카드CB결합정보': ('BASE_YM', 'CUST_ID'),
+    '금융상품': ('상품코드', '상품명', '상품종류')
+})
+_DEFAULT_REQUIRED_COLS = ('job_mon', 'member_no')
+
+# 테이블 유형 식별용 컬럼 시그니처 (기존 식별 우선순위 유지)
+_SIGNATURES = MappingProxyType({
+    frozenset({'STDT', 'ID', 'GENDER'}): '개인CB정보',
+    frozenset({'BS_DT', 'ID', 'SIC_CD_3'}): '기업CB정보',
+    frozenset({'BASE_YM', 'CUST_ID', 'HIGHEND_CD1'}): '통신카드CB결합정보',
+    frozenset({'code_gender', 'code_vip'}): '회원정보',
+    frozenset({'amt_credit_limit_use'}): '신용정보',
+    frozenset({'bal_B0M', 'bal_ca_B0M'}): '잔액정보',
+    frozenset({'day_max_base'}): '승인매출정보',
+    frozenset({'code_pay', 'code_billing'}): '청구입금정보',
+    frozenset({'cnt_ARS_R6M'}): '채널정보',
+    frozenset({'cnt_CL_TM_B0M'}): '마케팅정보',
+    frozenset({'ratio_CNT_ccd_B1M'}): '성과정보',
+    frozenset({'상품코드', '상품명'}): '금융상품'
+})
+_SIGNATURE_COLS = frozenset().union(*_SIGNATURES)
+
+
+@lru_cache(maxsize=128)
+def _identify_table_type_by_cols(columns: Tuple[str, ...]) -> str:
+    """
+    컬럼 구성으로 테이블 유형 식별
+    
+    Args:
+        columns: 데이터프레임 컬럼 튜플
+        
+    Returns:
+        str: 테이블 유형 (일치하는 시그니처가 없으면 'unknown')
+    """
+    cols = _SIGNATURE_COLS.intersection(columns)
+    for signature, table_type in _SIGNATURES.items():
+        if signature <= cols:
+            return table_type
+    return 'unknown'
+
+
 class FinancialDataLoader:
     """금융 데이터 로더 클래스"""
     
@@ -25,115 +249,27 @@ class FinancialDataLoader:
             data_dir: 데이터 디렉토리 경로
         """
         self.data_dir = data_dir
-        self.schemas = {
-            "회원정보": {
-                "usecols": ["job_mon", "member_no", "code_gender", "age", "code_vip", 
-                           "code_topcard_grade", "yn_member_ups", "yn_ca_member_ups", 
-                           "yn_cl_member_ups", "yn_credit_pss"],
-                "dtypes": {
-                    "job_mon": str, "member_no": str, "code_gender": str, "age": str,
-                    "code_vip": str, "code_topcard_grade": str, "yn_member_ups": str,
-                    "yn_ca_member_ups": str, "yn_cl_member_ups": str, "yn_credit_pss": str
-                }
-            },
-            "신용정보": {
-                "usecols": ["job_mon", "member_no", "amt_limit_1st", "amt_credit_limit_use", 
-                           "amt_ca_limit", "amt_cl_limit_fpbl", "amt_cl_limit_mpbl", 
-                           "rate_ca_interest_dis_bf", "rate_cl_interest_dis_bf", "rate_rv_interest_dis_bf"],
-                "dtypes": {
-                    "job_mon": str, "member_no": str, "amt_limit_1st": float, 
-                    "amt_credit_limit_use": float, "amt_ca_limit": float, "amt_cl_limit_fpbl": float,
-                    "amt_cl_limit_mpbl": float, "rate_ca_interest_dis_bf": float,
-                    "rate_cl_interest_dis_bf": float, "rate_rv_interest_dis_bf": float
-                }
-            },
-            "승인매출정보": {
-                "usecols": ["job_mon", "member_no", "day_max_base", "day_max_crsl", 
-                           "day_max_ca", "day_max_cl", "day_max_chk", "day_max_pif", 
-                           "day_max_int", "cnt_ccd_b0m"],
-                "dtypes": {
-                    "job_mon": str, "member_no": str, "day_max_base": str, "day_max_crsl": str,
-                    "day_max_ca": str, "day_max_cl": str, "day_max_chk": str, "day_max_pif": str,
-                    "day_max_int": str, "cnt_ccd_b0m": int
-                }
-            },
-            "청구입금정보": {
-                "usecols": ["job_mon", "member_no", "date_pay", "code_pay", 
-                           "code_address_billing", "code_billing", "code_billing2", 
-                           "YN_billing_B0M", "YN_billing_R3M", "YN_billing_R6M"],
-                "dtypes": {
-                    "job_mon": str, "member_no": str, "date_pay": str, "code_pay": str,
-                    "code_address_billing": str, "code_billing": str, "code_billing2": str,
-                    "YN_billing_B0M": str, "YN_billing_R3M": str, "YN_billing_R6M": str
-                }
-            },
-            "잔액정보": {
-                "usecols": ["job_mon", "member_no", "bal_B0M", "bal_pif_B0M", 
-                           "bal_int_B0M", "bal_ca_B0M", "bal_RV_pif_B0M", 
-                           "bal_RV_ca_B0M", "bal_cl_B0M", "avg_bal_pif_B0M"],
-                "dtypes": {
-                    "job_mon": str, "member_no": str, "bal_B0M": float, "bal_pif_B0M": float,
-                    "bal_int_B0M": float, "bal_ca_B0M": float, "bal_RV_pif_B0M": float,
-                    "bal_RV_ca_B0M": float, "bal_cl_B0M": float, "avg_bal_pif_B0M": float
-                }
-            },
-            "채널정보": {
-                "usecols": ["job_mon", "member_no", "cnt_ARS_R6M", "cnt_ARS_menu_R6M", 
-                           "day_ARS_R6M", "mn_ARS_R6M", "mn_elapsed_ARS_R6M", 
-                           "cnt_ARS_B0M", "cnt_menu_ARS_B0M", "day_ARS_B0M"],
-                "dtypes": {
-                    "job_mon": str, "member_no": str, "cnt_ARS_R6M": int, "cnt_ARS_menu_R6M": int,
-                    "day_ARS_R6M": int, "mn_ARS_R6M": int, "mn_elapsed_ARS_R6M": int,
-                    "cnt_ARS_B0M": int, "cnt_menu_ARS_B0M": int, "day_ARS_B0M": int
-                }
-            },
-            "마케팅정보": {
-                "usecols": ["job_mon", "member_no", "cnt_CL_TM_B0M", "cnt_RV_TM_B0M", 
-                           "cnt_CA_TM_B0M", "cnt_promotion_TM_B0M", "cnt_card_Issue_TM_B0M", 
-                           "cnt_ETC_TM_B0M", "cnt_point_TM_B0M", "cnt_Insurance_TM_B0M"],
-                "dtypes": {
-                    "job_mon": str, "member_no": str, "cnt_CL_TM_B0M": int, "cnt_RV_TM_B0M": int,
-                    "cnt_CA_TM_B0M": int, "cnt_promotion_TM_B0M": int, "cnt_card_Issue_TM_B0M": int,
-                    "cnt_ETC_TM_B0M": int, "cnt_point_TM_B0M": int, "cnt_Insurance_TM_B0M": int
-                }
-            },
-            "성과정보": {
-                "usecols": ["job_mon", "member_no", "ratio_CNT_ccd_B1M", "ratio_CNT_crsl_B1M", 
-                           "ratio_CNT_pif_B1M", "ratio_CNT_int_B1M", "ratio_CNT_ca_B1M", 
-                           "ratio_CNT_chk_B1M", "ratio_CNT_cl_B1M", "ratio_amt_ccd_B1M"],
-                "dtypes": {
-                    "job_mon": str, "member_no": str, "ratio_CNT_ccd_B1M": float, "ratio_CNT_crsl_B1M": float,
-                    "ratio_CNT_pif_B1M": float, "ratio_CNT_int_B1M": float, "ratio_CNT_ca_B1M": float,
-                    "ratio_CNT_chk_B1M": float, "ratio_CNT_cl_B1M": float, "ratio_amt_ccd_B1M": float
-                }
-            },
-            "개인CB정보": {
-                "usecols": ["STDT", "ID", "GENDER", "AGE_BAND", "C1Z001373", 
-                           "C1M2B4W03", "C1M2B5W03", "C1Z001386", "C1M210000", "C1M210001"],
-                "dtypes": {
-                    "STDT": str, "ID": str, "GENDER": str, "AGE_BAND": str, "C1Z001373": float,
-                    "C1M2B4W03": float, "C1M2B5W03": float, "C1Z001386": float,
-                    "C1M210000": int, "C1M210001": int
-                }
-            },
-            "기업CB정보": {
-                "usecols": ["BS_DT", "ID", "SIC_CD_3", "WG_GB", "FNDT_DT", 
-                           "EMPE_CNT", "CT_CNTY_GU_CD", "LISTD_DT", "LISTD_ABOL_DT", "FN1_1"],
-                "dtypes": {
-                    "BS_DT": str, "ID": str, "SIC_CD_3": str, "WG_GB": str, "FNDT_DT": str,
-                    "EMPE_CNT": int, "CT_CNTY_GU_CD": str, "LISTD_DT": str,
-                    "LISTD_ABOL_DT": str, "FN1_1": float
-                }
-            },
-            "통신카드CB결합정보": {
-                "usecols": ["BASE_YM", "CUST_ID", "SEX", "AGE", "JB_TP", 
-                           "HOME_ADM", "COM_ADM", "HIGHEND_CD1", "HIGHEND_CD2", "HIGHEND_CD3"],
-                "dtypes": {
-                    "BASE_YM": str, "CUST_ID": str, "SEX": str, "AGE": str, "JB_TP": str,
-                    "HOME_ADM": str, "COM_ADM": str, "HIGHEND_CD1": str,
-                    "HIGHEND_CD2": str, "HIGHEND_CD3": str
-                }
-            }
+        
+        # 모듈 수준에서 한 번만 생성된 스키마 및 파생 구조 참조
+        self.schemas = _SCHEMAS
+        self._read_kwargs = _READ_KWARGS
+        self._required_cols = _REQUIRED_COLS
+        
+        # 디렉토리 목록 캐시 (경로 -> (mtime, 파일 목록))
+        self._dir_cache: Dict[str, Tuple[float, List[str]]] = {}
+        
+        # 파싱된 데이터프레임 LRU 캐시 ((경로, mtime_ns, 크기) -> 데이터프레임)
+        self._mem_cache: "OrderedDict[Tuple[str, int, int], pd.DataFrame]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # 확장자별 청크 리더 디스패치 테이블
+        self._readers = {
+            '.csv': self._read_csv,
+            '.xlsx': self._read_excel,
+            '.xls': self._read_excel,
+            '.parquet': self._read_parquet,
+            '.feather': self._read_feather,
+            '.arrow': self._read_feather,
         }
     
     def validate_schema(self) -> bool:
@@ -147,31 +283,62 @@ class FinancialDataLoader:
         is_valid = True
         
         for name, schema in self.schemas.items():
-            folder = os.path.join(self.base_dir, name)
-            files = sorted(glob.glob(f"{folder}/*.csv"))
+            folder = os.path.join(self.data_dir, name)
+            files = sorted(os.path.join(folder, f) for f in self._listdir(folder) if f.endswith('.csv'))
             
             if not files:
                 print(f"[WARNING] '{name}' 폴더에 CSV 없음")
                 continue
                 
             try:
-                hdr = pd.read_csv(files[0], nrows=0).columns.tolist()
+                # 헤더 블록만 읽어 컬럼 이름 확인 (행 데이터는 변환하지 않음)
+                reader = pa_csv.open_csv(files[0])
+                try:
+                    hdr = set(reader.schema.names)
+                finally:
+                    reader.close()
+                
                 missing = [c for c in schema["usecols"] if c not in hdr]
-                extra = [c for c in hdr if c not in schema["usecols"]]
+                if missing:
+                    print(f"[ERROR] '{name}' 누락 컬럼: {missing}")
+                    is_valid = False
             except Exception as e:
                 print(f"[ERROR] 스키마 검증 중 오류 발생: {str(e)}")
-                
-            return pd.DataFrame()
-        
-        # 데이터 파일 목록 확인
-        data_files = [f for f in os.listdir(self.data_dir) if f.endswith(('.csv', '.xlsx', '.xls'))]
+                is_valid = False
         
-        if not data_files:
-            logger.warning(f"데이터 파일이 없습니다: {self.data_dir}")
-            return pd.DataFrame()
+        print(f"=== Schema Validation 완료: {'성공' if is_valid else '실패'} ===")
+        return is_valid
+    
+    def _listdir(self, path: str) -> List[str]:
+        """
+        디렉토리 파일 목록 조회 (mtime 기반 캐시)
         
-        # 데이터 로드 및 병합
+        디렉토리의 mtime이 바뀌지 않았으면 이전 목록을 재사용하여 반복 로드 시 디렉토리 스캔을 생략합니다.
         
+        Args:
+            path: 디렉토리 경로
+            
+        Returns:
+            List[str]: 파일 이름 목록 (디렉토리가 없으면 빈 목록)
+        """
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            self._dir_cache.pop(path, None)
+            return []
+        
+        cached = self._dir_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        files = os.listdir(path)
+        self._dir_cache[path] = (mtime, files)
+        return files
+    
+    def refresh(self) -> None:
+        """디렉토리 목록 캐시 초기화"""
+        self._dir_cache.clear()
+    
     def load_data(self):
         """
         금융 데이터 로드
@@ -185,7 +352,7 @@ class FinancialDataLoader:
             return self._generate_sample_data()
         
         # 데이터 파일 목록 확인
-        data_files = [f for f in os.listdir(self.data_dir) if f.endswith(('.csv', '.xlsx', '.xls'))]
+        data_files = [f for f in self._listdir(self.data_dir) if Path(f).suffix.lower() in self._readers]
         
         if not data_files:
             print(f"[INFO] 데이터 파일이 없습니다: {self.data_dir}. 샘플 데이터를 생성합니다.")
@@ -195,12 +362,11 @@ class FinancialDataLoader:
         try:
             # 여기에 실제 데이터 로드 로직 구현
             # 예시: 모든 CSV 파일 로드 및 병합
-            dfs = []
-            for file in data_files:
-                file_path = os.path.join(self.data_dir, file)
-                df = self.load_data_from_file(file_path)
-                if not df.empty:
-                    dfs.append(df)
+            # 파일별 로드를 스레드 풀로 병렬 수행 (C 파서는 GIL을 해제함)
+            file_paths = [os.path.join(self.data_dir, file) for file in data_files]
+            max_workers = min(len(file_paths), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                dfs = [df for df in executor.map(self.load_data_from_file, file_paths) if not df.empty]
             
             if dfs:
                 return self.merge_data(dfs)
@@ -224,7 +390,7 @@ class FinancialDataLoader:
         n_samples = 1000
         
         # 고객 ID 생성
-        customer_ids = [f"CUST{i:06d}" for i in range(1, n_samples + 1)]
+        customer_ids = np.char.add("CUST", np.char.zfill(np.arange(1, n_samples + 1).astype(str), 6))
         
         # 기본 정보
         np.random.seed(42)  # 재현성을 위한 시드 설정
@@ -240,40 +406,26 @@ class FinancialDataLoader:
         payment_history = np.random.uniform(0.7, 1.0, size=n_samples)
         
         # VIP 상태 (소득과 계좌 잔액에 기반)
-        vip_status = ["VIP" if income > 100000 and balance > 50000 else "REGULAR" 
-                     for income, balance in zip(incomes, account_balances)]
-        
-        # 데이터프레임 생성
-        df = pd.DataFrame({
-            "customer_id": customer_ids,
-            "gender": genders,
-            "age": ages,
-            "income": incomes,
-            "credit_score": credit_scores,
-            "account_balance": account_balances,
-            "credit_limit": credit_card_limits,
-            "credit_utilization": credit_utilization,
-            "payment_history": payment_history,
-            "vip_status": vip_status
+        vip_status = np.where((incomes > 100_000) & (account_balances > 50_000), "VIP", "REGULAR")
+        
+        # Arrow 테이블로 생성 후 Arrow 기반 데이터프레임으로 변환 (문자열 컬럼을 객체 배열 대신 UTF-8 버퍼로 저장)
+        category_type = pa.dictionary(pa.int8(), pa.string())
+        table = pa.table({
+            "customer_id": pa.array(customer_ids, type=pa.string()),
+            "gender": pa.array(genders, type=pa.string()).cast(category_type),
+            "age": pa.array(ages, type=pa.int16()),
+            "income": pa.array(incomes, type=pa.int32()),
+            "credit_score": pa.array(credit_scores, type=pa.int16()),
+            "account_balance": pa.array(account_balances, type=pa.int32()),
+            "credit_limit": pa.array(credit_card_limits, type=pa.int32()),
+            "credit_utilization": pa.array(credit_utilization, type=pa.float64()),
+            "payment_history": pa.array(payment_history, type=pa.float64()),
+            "vip_status": pa.array(vip_status, type=pa.string()).cast(category_type)
         })
+        df = table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
         
         print(f"[INFO] {n_samples}개의 샘플 금융 데이터가 생성되었습니다.")
         return df
-        dfs = []
-        for file in data_files:
-            file_path = os.path.join(self.data_dir, file)
-            df = self.load_data_from_file(file_path)
-            if not df.empty:
-                dfs.append(df)
-        
-        if not dfs:
-            logger.warning("로드된 데이터가 없습니다.")
-            return pd.DataFrame()
-        
-        # 데이터 병합
-        merged_df = self.merge_data(dfs)
-        
-        return merged_df
     
     def load_data_from_file(self, file_path: str) -> pd.DataFrame:
         """파일에서 데이터 로드
@@ -290,23 +442,18 @@ class FinancialDataLoader:
                 logger.warning(f"파일이 존재하지 않습니다: {file_path}")
                 return pd.DataFrame()
             
-            # 파일 타입 확인
-            file_name = os.path.basename(file_path)
-            file_type = file_name.split('.')[-1].lower()
-            
-            # CSV 파일 로드
-            if file_type == 'csv':
-                df = pd.read_csv(file_path, encoding='utf-8', low_memory=False)
-            # Excel 파일 로드
-            elif file_type in ['xlsx', 'xls']:
-                df = pd.read_excel(file_path)
-            else:
-                logger.warning(f"지원되지 않는 파일 형식입니다: {file_type}")
-                return pd.DataFrame()
+            # 파일 경로, 수정 시각, 크기로 캐시 조회
+            stat = os.stat(file_path)
+            cache_key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+            df = self._get_cached_frame(cache_key)
             
-            # 스키마 검증 및 변환
-            schema_key = file_name.split('.')[0]
-            df = self._validate_and_convert_schema(df, schema_key)
+            if df is None:
+                # 청크 단위로 읽은 뒤 한 번만 결합
+                chunks = list(self.iter_chunks(file_path))
+                if not chunks:
+                    return pd.DataFrame()
+                df = chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
+                self._put_cached_frame(cache_key, df)
             
             logger.info(f"데이터 로드 완료: {file_path}, {df.shape[0]} 행, {df.shape[1]} 열")
             return df
@@ -315,48 +462,148 @@ class FinancialDataLoader:
             logger.error(f"데이터 로드 중 오류 발생: {str(e)}")
             return pd.DataFrame()
     
+    def _parquet_cache_path(self, cache_key: Tuple[str, int, int]) -> str:
+        """
+        Parquet 캐시 파일 경로
+        
+        Args:
+            cache_key: (절대 경로, mtime_ns, 파일 크기)
+            
+        Returns:
+            str: <data_dir>/.cache/<해시>.parquet 경로
+        """
+        digest = hashlib.sha1(repr(cache_key).encode()).hexdigest()
+        return os.path.join(self.data_dir, FILE_CACHE_DIR, f"{digest}.parquet")
+    
+    def _get_cached_frame(self, cache_key: Tuple[str, int, int]) -> Optional[pd.DataFrame]:
+        """
+        캐시된 데이터프레임 조회 (메모리 LRU -> Parquet 순)
+        
+        Args:
+            cache_key: (절대 경로, mtime_ns, 파일 크기)
+            
+        Returns:
+            Optional[pd.DataFrame]: 캐시된 데이터프레임 (없으면 None)
+        """
+        with self._cache_lock:
+            df = self._mem_cache.get(cache_key)
+            if df is not None:
+                self._mem_cache.move_to_end(cache_key)
+                return df.copy(deep=False)
+        
+        parquet_path = self._parquet_cache_path(cache_key)
+        if not os.path.exists(parquet_path):
+            return None
+        
+        try:
+            df = pd.read_parquet(parquet_path, engine='pyarrow')
+        except Exception as e:
+            logger.warning(f"Parquet 캐시 로드 중 오류 발생: {parquet_path}, {str(e)}")
+            return None
+        
+        self._remember_frame(cache_key, df)
+        return df.copy(deep=False)
+    
+    def _put_cached_frame(self, cache_key: Tuple[str, int, int], df: pd.DataFrame) -> None:
+        """
+        데이터프레임을 메모리 LRU와 Parquet 캐시에 저장
+        
+        Args:
+            cache_key: (절대 경로, mtime_ns, 파일 크기)
+            df: 저장할 데이터프레임
+        """
+        self._remember_frame(cache_key, df)
+        
+        parquet_path = self._parquet_cache_path(cache_key)
+        try:
+            os.makedirs(os.path.dirname(parquet_path), exist_ok=True)
+            df.to_parquet(parquet_path, engine='pyarrow', compression='zstd')
+        except Exception as e:
+            logger.warning(f"Parquet 캐시 저장 중 오류 발생: {parquet_path}, {str(e)}")
+    
+    def _remember_frame(self, cache_key: Tuple[str, int, int], df: pd.DataFrame) -> None:
+        """
+        메모리 LRU 캐시에 데이터프레임 저장 (최대 개수 초과 시 가장 오래된 항목 제거)
+        
+        Args:
+            cache_key: (절대 경로, mtime_ns, 파일 크기)
+            df: 저장할 데이터프레임
+        """
+        with self._cache_lock:
+            self._mem_cache[cache_key] = df
+            self._mem_cache.move_to_end(cache_key)
+            while len(self._mem_cache) > FILE_CACHE_SIZE:
+                self._mem_cache.popitem(last=False)
+    
+    def iter_chunks(self, file_path: str, chunksize: int = CSV_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """파일을 청크 단위로 읽어 스키마가 적용된 데이터프레임을 순차 반환
+        
+        CSV 파일은 chunksize 행 단위로 스트리밍하므로 최대 메모리 사용량이 청크 하나로 제한됩니다.
+        Excel, Parquet, Feather 파일은 전체를 한 번에 읽어 하나의 청크로 반환합니다.
+        
+        Args:
+            file_path: 데이터 파일 경로
+            chunksize: CSV 청크 크기 (행 수)
+            
+        Yields:
+            pd.DataFrame: 스키마 변환된 데이터 청크
+        """
+        # 확장자로 리더 선택
+        path = Path(file_path)
+        reader = self._readers.get(path.suffix.lower())
+        if reader is None:
+            logger.warning(f"지원되지 않는 파일 형식입니다: {path.suffix}")
+            return
+        
+        schema_key = path.name.split('.')[0]
+        read_kwargs = self._read_kwargs.get(schema_key, {})
+        
+        for chunk in reader(file_path, read_kwargs, chunksize):
+            yield self._validate_and_convert_schema(chunk, schema_key)
+    
+    def _read_csv(self, file_path: str, read_kwargs: Dict[str, Any], chunksize: int) -> Iterator[pd.DataFrame]:
+        """CSV 파일을 청크 단위로 읽기"""
+        with pd.read_csv(file_path, encoding='utf-8', engine='c', chunksize=chunksize, **read_kwargs) as reader:
+            yield from reader
+    
+    def _read_excel(self, file_path: str, read_kwargs: Dict[str, Any], chunksize: int) -> Iterator[pd.DataFrame]:
+        """Excel 파일 전체 읽기 (청크 읽기 미지원)"""
+        yield pd.read_excel(file_path, **read_kwargs)
+    
+    def _read_parquet(self, file_path: str, read_kwargs: Dict[str, Any], chunksize: int) -> Iterator[pd.DataFrame]:
+        """Parquet 파일 읽기 (파일에 저장된 타입을 그대로 사용하고 스키마 컬럼만 선택)"""
+        yield self._select_columns(pd.read_parquet(file_path, engine='pyarrow'), read_kwargs)
+    
+    def _read_feather(self, file_path: str, read_kwargs: Dict[str, Any], chunksize: int) -> Iterator[pd.DataFrame]:
+        """Feather/Arrow IPC 파일 읽기 (파일에 저장된 타입을 그대로 사용하고 스키마 컬럼만 선택)"""
+        yield self._select_columns(pd.read_feather(file_path), read_kwargs)
+    
+    @staticmethod
+    def _select_columns(df: pd.DataFrame, read_kwargs: Dict[str, Any]) -> pd.DataFrame:
+        """read_csv의 usecols 조건을 컬럼형 파일에 동일하게 적용"""
+        usecols = read_kwargs.get("usecols")
+        if usecols is None:
+            return df
+        return df[[c for c in df.columns if usecols(c)]]
+    
     def _validate_and_convert_schema(self, df: pd.DataFrame, schema_key: str) -> pd.DataFrame:
-        """스키마 검증 및 변환
+        """스키마 검증
+        
+        컬럼 선택과 데이터 타입 변환은 read_csv 단계에서 처리되므로 필수 컬럼 존재 여부만 확인합니다.
         
         Args:
             df: 데이터프레임
             schema_key: 스키마 키
             
         Returns:
-            pd.DataFrame: 스키마 변환된 데이터프레임
+            pd.DataFrame: 검증된 데이터프레임
         """
-        # 스키마 가져오기
-        schema = self.schemas.get(schema_key, self.schemas.get('default', {}))
-        
         # 필수 컬럼 확인 (테이블별로 다를 수 있음)
-        if schema_key == '개인CB정보':
-            required_cols = ['STDT', 'ID']
-        elif schema_key == '기업CB정보':
-            required_cols = ['BS_DT', 'ID']
-        elif schema_key == '통신카드CB결합정보':
-            required_cols = ['BASE_YM', 'CUST_ID']
-        elif schema_key == '금융상품':
-            required_cols = ['상품코드', '상품명', '상품종류']
-        else:
-            required_cols = ['job_mon', 'member_no']
-            
+        required_cols = self._required_cols.get(schema_key, _DEFAULT_REQUIRED_COLS)
         for col in required_cols:
             if col not in df.columns:
                 logger.warning(f"필수 컬럼이 없습니다: {col}, {schema_key}")
         
-        # 데이터 타입 변환
-        for col, dtype in schema.items():
-            if col in df.columns:
-                try:
-                    if dtype == 'str':
-                        df[col] = df[col].astype(str)
-                    elif dtype == 'int':
-                        df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0).astype(int)
-                    elif dtype == 'float':
-                        df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0).astype(float)
-                except Exception as e:
-                    logger.warning(f"데이터 타입 변환 중 오류 발생: {col}, {dtype}, {str(e)}")
-        
         return df
     
     def merge_data(self, dfs: List[pd.DataFrame]) -> pd.DataFrame:
@@ -380,11 +627,16 @@ class FinancialDataLoader:
         
         # 회원 정보 테이블이 없으면 첫 번째 데이터프레임 사용
         if member_df is None:
-            member_df = dfs[0].copy()
+            member_df = dfs[0]
+            dfs = dfs[1:]
         else:
             # 회원 정보 테이블을 리스트에서 제거
             dfs = [df for df in dfs if id(df) != id(member_df)]
         
+        if 'member_no' not in member_df.columns:
+            logger.warning("기준 테이블에 병합 키(member_no)가 없어 병합하지 않습니다.")
+            return member_df
+        
         # 병합 키 매핑 (테이블별 다른 키 컬럼 처리)
         key_mapping = {
             '개인CB정보': {'STDT': 'job_mon', 'ID': 'member_no'},
@@ -392,38 +644,103 @@ class FinancialDataLoader:
             '통신카드CB결합정보': {'BASE_YM': 'job_mon', 'CUST_ID': 'member_no'}
         }
         
-        # 각 데이터프레임 병합
-        merged_df = member_df.copy()
+        base_keys = ['member_no', 'job_mon'] if 'job_mon' in member_df.columns else ['member_no']
+        
+        # 병합 키별로 데이터프레임 그룹화 (중복 컬럼은 미리 접미사 부여)
+        merged_cols = set(member_df.columns)
+        groups: Dict[Tuple[str, ...], List[pd.DataFrame]] = {}
         
         for df in dfs:
             # 테이블 유형 식별
             table_type = self._identify_table_type(df)
             
-            # 병합 키 설정
+            # 병합 키 설정 (키 컬럼 이름 매핑)
+            renames = dict(key_mapping.get(table_type, {}))
+            columns = [renames.get(col, col) for col in df.columns]
             if table_type in key_mapping:
-                # 키 컬럼 이름 변경
-                df_copy = df.copy()
-                for src_col, dst_col in key_mapping[table_type].items():
-                    if src_col in df_copy.columns:
-                        df_copy[dst_col] = df_copy[src_col]
                 merge_keys = ['member_no']
             else:
-                df_copy = df
-                merge_keys = ['member_no', 'job_mon'] if 'job_mon' in df.columns and 'job_mon' in merged_df.columns else ['member_no']
+                merge_keys = ['member_no', 'job_mon'] if 'job_mon' in columns and 'job_mon' in base_keys else ['member_no']
             
             # 병합 키가 있는지 확인
-            if all(key in df_copy.columns for key in merge_keys) and all(key in merged_df.columns for key in merge_keys):
-                # 중복 컬럼 처리 (키 컬럼 제외)
-                duplicate_cols = [col for col in df_copy.columns if col in merged_df.columns and col not in merge_keys]
-                for col in duplicate_cols:
-                    df_copy = df_copy.rename(columns={col: f"{col}_{table_type}"})
-                
-                # 데이터프레임 병합
-                merged_df = pd.merge(merged_df, df_copy, on=merge_keys, how='outer')
-            else:
+            if not all(key in columns for key in merge_keys):
                 logger.warning(f"병합 키가 없어 병합하지 않습니다: {merge_keys}")
+                continue
+            
+            # 중복 컬럼 처리 (키 컬럼 제외) - 키 매핑과 함께 한 번에 이름 변경
+            for src_col, col in zip(df.columns, columns):
+                if col in merged_cols and col not in merge_keys:
+                    renames[src_col] = f"{col}_{table_type}"
+            renamed_df = df.rename(columns=renames) if renames else df
+            merged_cols.update(renamed_df.columns)
+            
+            groups.setdefault(tuple(merge_keys), []).append(renamed_df)
+        
+        # DuckDB가 설치되어 있으면 단일 SQL 조인으로 병합
+        if duckdb is not None:
+            try:
+                return self._merge_with_duckdb(member_df, base_keys, groups)
+            except Exception as e:
+                logger.warning(f"DuckDB 병합 중 오류 발생, pandas 조인으로 대체합니다: {str(e)}")
+        
+        return self._merge_with_pandas(member_df, base_keys, groups)
+    
+    def _merge_with_pandas(self, member_df: pd.DataFrame, base_keys: List[str],
+                           groups: Dict[Tuple[str, ...], List[pd.DataFrame]]) -> pd.DataFrame:
+        """pandas 인덱스 조인으로 병합 (키 그룹마다 한 번의 다중 조인)
         
-        return merged_df
+        Args:
+            member_df: 기준 테이블
+            base_keys: 기준 테이블 병합 키
+            groups: 병합 키별 데이터프레임 목록
+            
+        Returns:
+            pd.DataFrame: 병합된 데이터프레임
+        """
+        merged_df = member_df.set_index(base_keys)
+        
+        for merge_keys, frames in groups.items():
+            if list(merged_df.index.names) != list(merge_keys):
+                merged_df = merged_df.reset_index().set_index(list(merge_keys))
+            merged_df = merged_df.join([df.set_index(list(merge_keys)) for df in frames], how='outer')
+        
+        return merged_df.reset_index()
+    
+    def _merge_with_duckdb(self, member_df: pd.DataFrame, base_keys: List[str],
+                           groups: Dict[Tuple[str, ...], List[pd.DataFrame]]) -> pd.DataFrame:
+        """DuckDB로 병합 (모든 테이블을 하나의 FULL OUTER JOIN 쿼리로 처리)
+        
+        Args:
+            member_df: 기준 테이블
+            base_keys: 기준 테이블 병합 키
+            groups: 병합 키별 데이터프레임 목록
+            
+        Returns:
+            pd.DataFrame: 병합된 데이터프레임
+        """
+        frames = [member_df] + [df for group in groups.values() for df in group]
+        
+        con = duckdb.connect()
+        try:
+            con.register("t_0", member_df)
+            query = ["SELECT * FROM t_0"]
+            i = 1
+            for merge_keys, group in groups.items():
+                using = ", ".join(f'"{key}"' for key in merge_keys)
+                for df in group:
+                    con.register(f"t_{i}", df)
+                    query.append(f"FULL OUTER JOIN t_{i} USING ({using})")
+                    i += 1
+            query.append("ORDER BY " + ", ".join(f'"{key}"' for key in base_keys))
+            merged_df = con.execute(" ".join(query)).df()
+        finally:
+            con.close()
+        
+        # pandas 조인 결과와 같도록 키 컬럼을 앞에 두고 확장 타입(nullable 정수 등) 복원
+        merged_df = merged_df[base_keys + [col for col in merged_df.columns if col not in base_keys]]
+        dtypes = {col: dtype for df in frames for col, dtype in df.dtypes.items()
+                  if isinstance(dtype, pd.api.extensions.ExtensionDtype) and col in merged_df.columns}
+        return merged_df.astype(dtypes) if dtypes else merged_df
     
     def _identify_table_type(self, df: pd.DataFrame) -> str:
         """테이블 유형 식별
@@ -434,30 +751,5 @@ class FinancialDataLoader:
         Returns:
             str: 테이블 유형
         """
-        # 컬럼명으로 테이블 유형 식별
-        if 'STDT' in df.columns and 'ID' in df.columns and 'GENDER' in df.columns:
-            return '개인CB정보'
-        elif 'BS_DT' in df.columns and 'ID' in df.columns and 'SIC_CD_3' in df.columns:
-            return '기업CB정보'
-        elif 'BASE_YM' in df.columns and 'CUST_ID' in df.columns and 'HIGHEND_CD1' in df.columns:
-            return '통신카드CB결합정보'
-        elif 'code_gender' in df.columns and 'code_vip' in df.columns:
-            return '회원정보'
-        elif 'amt_credit_limit_use' in df.columns:
-            return '신용정보'
-        elif 'bal_B0M' in df.columns and 'bal_ca_B0M' in df.columns:
-            return '잔액정보'
-        elif 'day_max_base' in df.columns:
-            return '승인매출정보'
-        elif 'code_pay' in df.columns and 'code_billing' in df.columns:
-            return '청구입금정보'
-        elif 'cnt_ARS_R6M' in df.columns:
-            return '채널정보'
-        elif 'cnt_CL_TM_B0M' in df.columns:
-            return '마케팅정보'
-        elif 'ratio_CNT_ccd_B1M' in df.columns:
-            return '성과정보'
-        elif '상품코드' in df.columns and '상품명' in df.columns:
-            return '금융상품'
-        else:
-            return 'unknown'
+        # 컬럼명으로 테이블 유형 식별 (컬럼 구성별 결과 캐시)
+        return _identify_table_type_by_cols(tuple(df.columns))
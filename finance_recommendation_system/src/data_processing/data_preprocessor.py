@@ -4,24 +4,145 @@
 로드된 금융 데이터를 전처리하고 머신러닝 모델에 사용할 수 있는 형태로 변환하는 기능을 제공합니다.
 """
 
+import os
+import hashlib
+import joblib
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import logging
-from sklearn.preprocessing import StandardScaler, OneHotEncoder, LabelEncoder
-from sklearn.impute import SimpleImputer
+from sklearn.preprocessing import StandardScaler
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
 
 logger = logging.getLogger(__name__)
 
+# numba 커널을 사용할 최소 행 수 (작은 데이터는 NumPy 경로가 더 빠름)
+_NUMBA_MIN_ROWS = 50_000
+
+# 비율 파생 변수 정의 (변수명, 분자 컬럼 목록, 분모 컬럼)
+_RATIO_FEATURES = (
+    ('credit_utilization_ratio', ('bal_B0M',), 'amt_credit_limit_use'),   # 1. 신용 한도 대비 잔액 비율
+    ('installment_ratio', ('bal_int_B0M',), 'bal_B0M'),                   # 2. 할부 이용 비중
+    ('cash_advance_ratio', ('bal_ca_B0M',), 'bal_B0M'),                   # 3. 현금서비스 이용 비중
+    ('revolving_ratio', ('bal_RV_pif_B0M', 'bal_RV_ca_B0M'), 'bal_B0M'),  # 4. 리볼빙 이용 비중
+    ('card_loan_ratio', ('bal_cl_B0M',), 'bal_B0M'),                      # 5. 카드론 이용 비중
+)
+
+# 날짜 변수별 형식 (정의되지 않은 컬럼은 YYYYMMDD)
+_DEFAULT_DATE_FORMAT = '%Y%m%d'
+_DATE_FORMATS = {'job_mon': '%Y%m'}
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _ratio_kernel(numerators: np.ndarray, denominators: np.ndarray, denom_index: np.ndarray) -> np.ndarray:
+        """
+        비율 변수 일괄 계산 (행 단위 병렬, 분모가 0이면 분자 값 유지)
+        
+        Args:
+            numerators: (변수 수, 행 수) 분자 행렬
+            denominators: (분모 수, 행 수) 분모 행렬
+            denom_index: 변수별 분모 행 인덱스
+            
+        Returns:
+            np.ndarray: (변수 수, 행 수) 비율 행렬
+        """
+        n_features, n_rows = numerators.shape
+        out = np.empty_like(numerators)
+        for i in prange(n_rows):
+            for j in range(n_features):
+                denom = denominators[denom_index[j], i]
+                out[j, i] = numerators[j, i] / denom if denom != 0.0 else numerators[j, i]
+        return out
+else:
+    _ratio_kernel = None
+
+# 등급 코드별 점수 (표에 없는 코드는 VIP 1점, 카드 등급 0점)
+_VIP_SCORES = {
+    '01': 10, '02': 10, '03': 10,
+    '04': 7, '05': 7, '06': 7, '07': 7,
+    '08': 3, '09': 3, '10': 3
+}
+_CARD_GRADE_SCORES = {'1': 1, '2': 2, '3': 3, '4': 4}
+
+# 집계 파생 변수 정의 (변수명, 집계 방식, 컬럼별 가중치)
+# sum: 결측 제외 합계, mean: 결측 제외 평균, weighted: 가중 합 (가중 컬럼에 결측이 있으면 결측)
+_AGGREGATE_FEATURES = (
+    # 8. 마케팅 반응 지수
+    ('marketing_exposure_total', 'sum', {
+        'cnt_CL_TM_B0M': 1.0, 'cnt_RV_TM_B0M': 1.0, 'cnt_CA_TM_B0M': 1.0, 'cnt_promotion_TM_B0M': 1.0,
+        'cnt_card_Issue_TM_B0M': 1.0, 'cnt_ETC_TM_B0M': 1.0, 'cnt_point_TM_B0M': 1.0, 'cnt_Insurance_TM_B0M': 1.0
+    }),
+    # 9. 채널 활동성 지수
+    ('channel_activity_index', 'weighted', {
+        'cnt_ARS_R6M': 0.2, 'cnt_ARS_menu_R6M': 0.0, 'day_ARS_R6M': 0.1, 'mn_ARS_R6M': 0.0,
+        'cnt_ARS_B0M': 0.4, 'cnt_menu_ARS_B0M': 0.0, 'day_ARS_B0M': 0.3
+    }),
+    # 10. 성장률 평균
+    ('avg_growth_rate', 'mean', {
+        'ratio_CNT_ccd_B1M': 1.0, 'ratio_CNT_crsl_B1M': 1.0, 'ratio_CNT_pif_B1M': 1.0,
+        'ratio_CNT_int_B1M': 1.0, 'ratio_CNT_ca_B1M': 1.0, 'ratio_CNT_chk_B1M': 1.0,
+        'ratio_CNT_cl_B1M': 1.0, 'ratio_amt_ccd_B1M': 1.0
+    }),
+)
+
+
+def _preprocess_cached(preprocessor: "FinancialDataPreprocessor", df: pd.DataFrame,
+                       frame_key: str, state_key: str) -> pd.DataFrame:
+    """
+    추론용 전처리 (joblib.Memory 캐시 대상)
+    
+    캐시 키는 frame_key와 state_key만 사용하며 preprocessor와 df는 해시하지 않습니다.
+    """
+    return preprocessor._preprocess(df, is_training=False)
+
 class FinancialDataPreprocessor:
     """금융 데이터 전처리 클래스"""
     
-    def __init__(self):
-        """금융 데이터 전처리기 초기화"""
+    def __init__(self, cache_dir: Optional[str] = None, for_tree_model: bool = False, use_polars: bool = False):
+        """
+        금융 데이터 전처리기 초기화
+        
+        Args:
+            cache_dir: 추론용 전처리 결과 캐시 디렉토리 (None이면 캐시 미사용)
+            for_tree_model: 트리 기반 모델용 여부 (True이면 스케일링 생략)
+            use_polars: 결측치/날짜 처리를 polars 쿼리로 실행할지 여부 (polars 미설치 시 pandas 사용)
+        """
         self.encoders = {}
         self.scalers = {}
-        self.imputers = {}
+        
+        # 트리 기반 모델은 단조 변환에 영향을 받지 않으므로 스케일링 단계를 생략
+        self.for_tree_model = for_tree_model
+        
+        # polars 엔진 사용 여부 (멀티코어 환경의 대용량 데이터에서 유리)
+        if use_polars and pl is None:
+            logger.warning("polars가 설치되어 있지 않아 pandas로 전처리합니다.")
+        self.use_polars = use_polars and pl is not None
+        
+        # 수치형 변수 결측치 대체값 (컬럼별 중앙값)
+        self.num_medians: Optional[pd.Series] = None
+        
+        # 스케일링 대상 수치형 컬럼 (학습 시 결정)
+        self.scaled_features: List[str] = []
+        
+        # 추론용 전처리 결과 캐시 (입력 데이터와 학습된 상태가 같으면 재사용)
+        self._memory = joblib.Memory(cache_dir, verbose=0) if cache_dir else None
+        self._cached_preprocess = (
+            self._memory.cache(_preprocess_cached, ignore=['preprocessor', 'df']) if self._memory else None
+        )
+        self._state_key: Optional[str] = None
+        
+        # 컬럼 구성별 전처리 대상 컬럼 캐시 (컬럼 튜플 -> 유형별 컬럼 목록)
+        self._present_cache: Dict[Tuple[str, ...], Dict[str, List[str]]] = {}
         
         # 범주형 변수 목록
         self.categorical_features = [
@@ -70,18 +191,23 @@ class FinancialDataPreprocessor:
             print("[WARNING] 전처리할 데이터가 없습니다.")
             return df
         
-        # 데이터 복사본 생성
+        # 데이터 복사본 생성 (각 전처리 단계는 이 복사본을 직접 수정)
         processed_df = df.copy()
         
         try:
+            # 0. PyArrow 기반 타입 및 범주형 category 타입으로 변환
+            processed_df = processed_df.convert_dtypes(dtype_backend='pyarrow', convert_integer=False)
+            processed_df = self.convert_categorical_dtypes(processed_df)
+            
             # 1. 결측치 처리
             processed_df = self.handle_missing_values(processed_df)
             
             # 2. 범주형 변수 인코딩
             processed_df = self.encode_categorical_features(processed_df)
             
-            # 3. 수치형 변수 스케일링
-            processed_df = self.scale_numerical_features(processed_df)
+            # 3. 수치형 변수 스케일링 (트리 기반 모델용이면 생략)
+            if not self.for_tree_model:
+                processed_df = self.scale_numerical_features(processed_df)
             
             # 4. 날짜 변수 처리
             processed_df = self.process_date_features(processed_df)
@@ -89,6 +215,9 @@ class FinancialDataPreprocessor:
             # 5. 불필요한 컬럼 제거
             processed_df = self.remove_unnecessary_columns(processed_df)
             
+            # 6. 수치형 컬럼 타입 축소
+            processed_df = self.downcast_numeric_features(processed_df)
+            
             print(f"[INFO] 금융 데이터 전처리가 완료되었습니다. 처리된 데이터 크기: {processed_df.shape}")
             return processed_df
             
@@ -97,200 +226,199 @@ class FinancialDataPreprocessor:
             # 오류 발생 시 원본 데이터 반환
             return df
     
-    def handle_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
+    def remove_unnecessary_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        결측치 처리
+        불필요한 컬럼 제거
         
         Args:
             df: 데이터프레임
             
         Returns:
-            pd.DataFrame: 결측치가 처리된 데이터프레임
+            pd.DataFrame: 불필요한 컬럼이 제거된 데이터프레임
         """
-        # 데이터 복사본 생성
-        result_df = df.copy()
+        result_df = df
         
-        # 수치형 변수 결측치 처리 (중앙값으로 대체)
-        num_features = [col for col in self.numerical_features if col in result_df.columns]
-        if num_features:
-            for col in num_features:
-                if result_df[col].isnull().sum() > 0:
-                    if col not in self.imputers:
-                        self.imputers[col] = SimpleImputer(strategy='median')
-                        self.imputers[col].fit(result_df[[col]])
-                    
-                    result_df[col] = self.imputers[col].transform(result_df[[col]])
+        # 제거할 컬럼 목록 (ID 컬럼 등)
+        columns_to_remove = [
+            # 여기에 제거할 컬럼 추가
+        ]
         
-        # 범주형 변수 결측치 처리 (최빈값으로 대체)
-        cat_features = [col for col in self.categorical_features if col in result_df.columns]
-        if cat_features:
-            for col in cat_features:
-                if result_df[col].isnull().sum() > 0:
-                    if col not in self.imputers:
-                        self.imputers[col] = SimpleImputer(strategy='most_frequent')
-                        self.imputers[col].fit(result_df[[col]])
-                    
-                    result_df[col] = self.imputers[col].transform(result_df[[col]])
+        # 존재하는 컬럼만 제거
+        columns_to_remove = [col for col in columns_to_remove if col in result_df.columns]
+        if columns_to_remove:
+            result_df = result_df.drop(columns=columns_to_remove)
         
         return result_df
     
-    def encode_categorical_features(self, df: pd.DataFrame) -> pd.DataFrame:
+    def save(self, path: str) -> None:
         """
-        범주형 변수 인코딩
+        학습된 전처리 상태(중앙값, 인코더, 스케일러) 저장
         
         Args:
-            df: 데이터프레임
+            path: 저장 파일 경로 (.joblib)
+        """
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
             
-        Returns:
-            pd.DataFrame: 인코딩된 데이터프레임
+            # 압축하지 않고 저장하여 로드 시 배열을 메모리 매핑할 수 있도록 함
+            state = {
+                'num_medians': self.num_medians,
+                'encoders': self.encoders,
+                'scalers': self.scalers,
+                'scaled_features': self.scaled_features,
+                'for_tree_model': self.for_tree_model
+            }
+            joblib.dump(state, path, compress=0)
+            logger.info(f"전처리기 저장 완료: {path}")
+            
+        except Exception as e:
+            logger.error(f"전처리기 저장 중 오류 발생: {str(e)}")
+    
+    @classmethod
+    def load(cls, path: str, cache_dir: Optional[str] = None,
+             use_polars: bool = False) -> Optional["FinancialDataPreprocessor"]:
         """
-        # 데이터 복사본 생성
-        result_df = df.copy()
+        저장된 전처리 상태로 전처리기 생성 (다시 학습하지 않음)
         
-        # 범주형 변수 인코딩 (레이블 인코딩)
-        cat_features = [col for col in self.categorical_features if col in result_df.columns]
-        if cat_features:
-            for col in cat_features:
-                if col not in self.encoders:
-                    self.encoders[col] = LabelEncoder()
-                    # 결측치가 있는 경우 처리
-                    non_null_values = result_df[col].dropna()
-                    if len(non_null_values) > 0:
-                        self.encoders[col].fit(non_null_values)
-                
-                # 결측치가 있는 경우 처리
-                non_null_mask = result_df[col].notna()
-                if non_null_mask.any():
-                    result_df.loc[non_null_mask, col] = self.encoders[col].transform(
-                        result_df.loc[non_null_mask, col]
-                    )
+        배열은 읽기 전용 메모리 매핑으로 로드되어 여러 프로세스가 같은 페이지 캐시를 공유합니다.
         
-        return result_df
+        Args:
+            path: 저장 파일 경로 (.joblib)
+            cache_dir: 추론용 전처리 결과 캐시 디렉토리
+            use_polars: 결측치/날짜 처리를 polars 쿼리로 실행할지 여부
+            
+        Returns:
+            Optional[FinancialDataPreprocessor]: 전처리기 (로드 실패 시 None)
+        """
+        try:
+            state = joblib.load(path, mmap_mode='r')
+            
+            preprocessor = cls(cache_dir=cache_dir, for_tree_model=state.get('for_tree_model', False),
+                               use_polars=use_polars)
+            preprocessor.num_medians = state['num_medians']
+            preprocessor.encoders = state['encoders']
+            preprocessor.scalers = state['scalers']
+            preprocessor.scaled_features = state['scaled_features']
+            
+            logger.info(f"전처리기 로드 완료: {path}")
+            return preprocessor
+            
+        except Exception as e:
+            logger.error(f"전처리기 로드 중 오류 발생: {str(e)}")
+            return None
     
-    def scale_numerical_features(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _present_features(self, df: pd.DataFrame) -> Dict[str, List[str]]:
         """
-        수치형 변수 스케일링
+        데이터프레임에 존재하는 유형별 전처리 대상 컬럼 조회 (컬럼 구성별 결과 캐시)
         
         Args:
             df: 데이터프레임
             
         Returns:
-            pd.DataFrame: 스케일링된 데이터프레임
+            Dict[str, List[str]]: 'num', 'cat', 'date' 유형별 컬럼 목록
         """
-        # 데이터 복사본 생성
-        result_df = df.copy()
+        key = tuple(df.columns)
+        present = self._present_cache.get(key)
+        if present is None:
+            columns = set(key)
+            present = {
+                'num': [col for col in self.numerical_features if col in columns],
+                'cat': [col for col in self.categorical_features if col in columns],
+                'date': [col for col in self.date_features if col in columns]
+            }
+            if len(self._present_cache) >= 32:
+                self._present_cache.clear()
+            self._present_cache[key] = present
+        return present
+    
+    @staticmethod
+    def _coerce_numeric_features(df: pd.DataFrame, num_features: List[str]) -> pd.DataFrame:
+        """
+        문자열 등으로 로드된 수치형 컬럼을 실수형으로 변환 (변환할 수 없는 값은 결측치)
         
-        # 수치형 변수 스케일링 (표준화)
-        num_features = [col for col in self.numerical_features if col in result_df.columns]
-        if num_features:
-            if 'numerical' not in self.scalers:
-                self.scalers['numerical'] = StandardScaler()
-                self.scalers['numerical'].fit(result_df[num_features])
+        Args:
+            df: 데이터프레임 (직접 수정)
+            num_features: 수치형 컬럼 목록
             
-            result_df[num_features] = self.scalers['numerical'].transform(result_df[num_features])
-        
-        return result_df
+        Returns:
+            pd.DataFrame: 수치형 컬럼이 모두 숫자 타입인 데이터프레임
+        """
+        for col in num_features:
+            if not pd.api.types.is_numeric_dtype(df[col]):
+                df[col] = pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        return df
     
-    def process_date_features(self, df: pd.DataFrame) -> pd.DataFrame:
+    def convert_categorical_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        날짜 변수 처리
+        범주형 변수를 pandas category 타입으로 변환
         
         Args:
-            df: 데이터프레임
+            df: 입력 데이터프레임
             
         Returns:
-            pd.DataFrame: 날짜 변수가 처리된 데이터프레임
+            pd.DataFrame: 범주형 변수가 category 타입으로 변환된 데이터프레임
         """
-        # 데이터 복사본 생성
-        result_df = df.copy()
-        
-        # 날짜 변수 처리
-        date_features = [col for col in self.date_features if col in result_df.columns]
-        
-        if date_features:
-            for col in date_features:
-                # 날짜 형식 변환 시도
-                try:
-                    result_df[col] = pd.to_datetime(result_df[col])
-                    
-                    # 연도, 월, 일 추출
-                    result_df[f"{col}_year"] = result_df[col].dt.year
-                    result_df[f"{col}_month"] = result_df[col].dt.month
-                    result_df[f"{col}_day"] = result_df[col].dt.day
-                    
-                    # 기준일로부터의 일수 계산 (현재 날짜 기준)
-                    today = datetime.now().date()
-                    result_df[f"{col}_days_from_today"] = (today - result_df[col].dt.date).dt.days
-                    
-                    # 원본 날짜 컬럼 삭제
-                    result_df = result_df.drop(columns=[col])
-                    
-                except Exception as e:
-                    print(f"[WARNING] 날짜 변수 '{col}' 처리 중 오류 발생: {str(e)}")
-        
-        return result_df
+        for col in self._present_features(df)['cat']:
+            if not isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype('category')
+                
+        return df
     
-    def remove_unnecessary_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+    @staticmethod
+    def _columns_with_na(df: pd.DataFrame, columns: List[str]) -> List[str]:
         """
-        불필요한 컬럼 제거
+        결측치가 하나라도 있는 컬럼 목록 반환
         
         Args:
-            df: 데이터프레임
+            df: 입력 데이터프레임
+            columns: 검사할 컬럼 목록
             
         Returns:
-            pd.DataFrame: 불필요한 컬럼이 제거된 데이터프레임
+            List[str]: 결측치가 있는 컬럼 목록
         """
-        # 데이터 복사본 생성
-        result_df = df.copy()
-        
-        # 제거할 컬럼 목록 (ID 컬럼 등)
-        columns_to_remove = [
-            # 여기에 제거할 컬럼 추가
-        ]
-        
-        # 존재하는 컬럼만 제거
-        columns_to_remove = [col for col in columns_to_remove if col in result_df.columns]
-        if columns_to_remove:
-            result_df = result_df.drop(columns=columns_to_remove)
-        
-        return result_df
-        
-        self.date_features = [
-            'day_max_base', 'day_max_crsl', 'day_max_ca', 'day_max_cl',
-            'day_max_chk', 'day_max_pif', 'day_max_int', 'date_pay'
-        ]
-        
-        # 식별자 변수 목록
-        self.id_features = ['member_no', 'job_mon']
+        if not columns:
+            return []
+        has_na = df[columns].isna().any()
+        return has_na.index[has_na].tolist()
     
-    def handle_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
+    def handle_missing_values(self, df: pd.DataFrame, is_training: bool = True) -> pd.DataFrame:
         """
         결측치 처리
         
         Args:
             df: 입력 데이터프레임
+            is_training: 학습 데이터 여부 (학습 시 중앙값을 다시 계산)
             
         Returns:
             pd.DataFrame: 결측치가 처리된 데이터프레임
         """
-        # 수치형 변수 결측치 처리
-        for col in self.numerical_features:
-            if col in df.columns:
-                if col not in self.imputers:
-                    self.imputers[col] = SimpleImputer(strategy='median')
-                    
-                col_values = df[col].values.reshape(-1, 1)
-                df[col] = self.imputers[col].fit_transform(col_values)
+        # 수치형 변수 결측치 처리 (컬럼별 중앙값을 한 번에 계산하여 일괄 대체)
+        present = self._present_features(df)
+        num_features = present['num']
+        if num_features:
+            # 문자열로 로드된 수치형 컬럼(age 등)도 중앙값 대체와 스케일링 대상이 되도록 먼저 숫자로 변환
+            df = self._coerce_numeric_features(df, num_features)
+            if is_training or self.num_medians is None:
+                self.num_medians = df[num_features].median()
+            # 결측치가 있는 컬럼만 대체 (isna().any()는 첫 결측치에서 바로 종료)
+            na_cols = self._columns_with_na(df, num_features)
+            if na_cols:
+                df[na_cols] = df[na_cols].fillna(self.num_medians)
         
         # 범주형 변수 결측치 처리
-        for col in self.categorical_features:
-            if col in df.columns:
-                df[col] = df[col].fillna('UNKNOWN')
+        cat_features = self._columns_with_na(df, present['cat'])
+        if cat_features:
+            # category 타입은 대체값을 범주에 먼저 추가
+            for col in cat_features:
+                if (isinstance(df[col].dtype, pd.CategoricalDtype)
+                        and 'UNKNOWN' not in df[col].cat.categories):
+                    df[col] = df[col].cat.add_categories('UNKNOWN')
+            df[cat_features] = df[cat_features].fillna('UNKNOWN')
         
         # 날짜 변수 결측치 처리
-        for col in self.date_features:
-            if col in df.columns:
-                df[col] = df[col].fillna('00010101')  # 기본값으로 설정
+        date_features = self._columns_with_na(df, present['date'])
+        if date_features:
+            df[date_features] = df[date_features].fillna('00010101')  # 기본값으로 설정
                 
         return df
     
@@ -298,6 +426,9 @@ class FinancialDataPreprocessor:
         """
         범주형 변수 인코딩
         
+        학습 시 컬럼별 정렬된 범주 목록을 encoders에 저장하고, pandas Categorical 코드로 변환합니다.
+        코드는 범주 수에 맞는 가장 작은 정수형(int8 등)으로 생성됩니다.
+        
         Args:
             df: 입력 데이터프레임
             is_training: 학습 데이터 여부
@@ -305,31 +436,41 @@ class FinancialDataPreprocessor:
         Returns:
             pd.DataFrame: 인코딩된 데이터프레임
         """
-        result_df = df.copy()
+        result_df = df
         
-        for col in self.categorical_features:
-            if col in df.columns:
-                if is_training or col not in self.encoders:
-                    self.encoders[col] = LabelEncoder()
-                    result_df[col] = self.encoders[col].fit_transform(df[col])
+        for col in self._present_features(df)['cat']:
+            is_category = isinstance(df[col].dtype, pd.CategoricalDtype)
+            if is_training or col not in self.encoders:
+                if is_category:
+                    categories = df[col].cat.remove_unused_categories().cat.categories
                 else:
-                    # 학습 데이터가 아닌 경우 기존 인코더 사용
-                    # 새로운 카테고리 처리
-                    new_categories = set(df[col].unique()) - set(self.encoders[col].classes_)
-                    if new_categories:
-                        logger.warning(f"열 '{col}'에 새로운 카테고리가 있습니다: {new_categories}")
-                        # 새 카테고리를 가장 빈번한 카테고리로 대체
-                        for cat in new_categories:
-                            df.loc[df[col] == cat, col] = self.encoders[col].classes_[0]
-                    
-                    result_df[col] = self.encoders[col].transform(df[col])
-                    
+                    categories = pd.Index(df[col].dropna().unique())
+                self.encoders[col] = categories.sort_values()
+            
+            # 범주 구성이 같으면 category 코드를 그대로 사용
+            if is_category and df[col].cat.categories.equals(self.encoders[col]):
+                codes = df[col].cat.codes.to_numpy()
+            else:
+                codes = pd.Categorical(df[col], categories=self.encoders[col]).codes
+            
+            # 학습 시 없던 카테고리나 결측치(-1)는 첫 번째 카테고리로 대체
+            unseen = codes < 0
+            if unseen.any():
+                new_categories = set(df[col][unseen & df[col].notna().to_numpy()].unique())
+                if new_categories:
+                    logger.warning(f"열 '{col}'에 새로운 카테고리가 있습니다: {new_categories}")
+                codes = np.where(unseen, 0, codes).astype(codes.dtype)
+            
+            result_df[col] = codes
+                
         return result_df
     
     def scale_numerical_features(self, df: pd.DataFrame, is_training: bool = True) -> pd.DataFrame:
         """
         수치형 변수 스케일링
         
+        수치형 컬럼 전체를 하나의 float32 행렬로 묶어 StandardScaler 한 번으로 표준화합니다.
+        
         Args:
             df: 입력 데이터프레임
             is_training: 학습 데이터 여부
@@ -337,15 +478,22 @@ class FinancialDataPreprocessor:
         Returns:
             pd.DataFrame: 스케일링된 데이터프레임
         """
-        result_df = df.copy()
+        result_df = df
+        
+        if is_training or 'numerical' not in self.scalers:
+            # 숫자 타입인 수치형 컬럼만 스케일링 대상으로 저장
+            self.scaled_features = [
+                col for col in self._present_features(df)['num'] if pd.api.types.is_numeric_dtype(df[col])
+            ]
+            if not self.scaled_features:
+                return result_df
+            
+            self.scalers['numerical'] = StandardScaler()
+            self.scalers['numerical'].fit(df[self.scaled_features].to_numpy(dtype=np.float32, na_value=np.nan))
         
-        for col in self.numerical_features:
-            if col in df.columns:
-                if is_training or col not in self.scalers:
-                    self.scalers[col] = StandardScaler()
-                    result_df[col] = self.scalers[col].fit_transform(df[col].values.reshape(-1, 1))
-                else:
-                    result_df[col] = self.scalers[col].transform(df[col].values.reshape(-1, 1))
+        if self.scaled_features:
+            values = df[self.scaled_features].to_numpy(dtype=np.float32, na_value=np.nan)
+            result_df[self.scaled_features] = self.scalers['numerical'].transform(values)
                     
         return result_df
     
@@ -359,24 +507,58 @@ class FinancialDataPreprocessor:
         Returns:
             pd.DataFrame: 날짜 변수가 처리된 데이터프레임
         """
-        result_df = df.copy()
-        current_date = datetime.now()
+        result_df = df
+        today = np.datetime64(datetime.now().date(), 'D')
+        
+        converted = []
+        for col in self._present_features(df)['date']:
+            # 날짜 형식 변환
+            try:
+                # 형식을 지정하고 중복 값은 한 번만 파싱 (변환 실패 행만 NaT)
+                dt = pd.to_datetime(df[col], format=_DATE_FORMATS.get(col, _DEFAULT_DATE_FORMAT), errors='coerce', cache=True)
+                result_df[f'{col}_dt'] = dt
+                
+                # 날짜 관련 파생 변수 생성 (일 단위 datetime64 정수 연산, 변환 실패 값은 NaN)
+                dt_days = dt.to_numpy(dtype='datetime64[D]')
+                days_diff = (today - dt_days).astype(np.float32)
+                days_diff[np.isnat(dt_days)] = np.nan
+                result_df[f'{col}_days_diff'] = days_diff
+                
+                converted.append(col)
+            except Exception as e:
+                logger.error(f"날짜 처리 중 오류 발생 ({col}): {str(e)}")
+                # 오류 발생 시 원본 컬럼 유지
+        
+        # 변환된 원본 날짜 컬럼을 한 번에 삭제 (오류가 발생한 컬럼은 유지)
+        if converted:
+            result_df = result_df.drop(columns=converted)
+            
+        return result_df
+    
+    def downcast_numeric_features(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        수치형 컬럼 타입 축소
         
-        for col in self.date_features:
-            if col in df.columns:
-                # 날짜 형식 변환
-                try:
-                    result_df[f'{col}_dt'] = pd.to_datetime(df[col], format='%Y%m%d', errors='coerce')
-                    
-                    # 날짜 관련 파생 변수 생성
-                    result_df[f'{col}_days_diff'] = (current_date - result_df[f'{col}_dt']).dt.days
-                    
-                    # 원본 날짜 컬럼 삭제
-                    result_df = result_df.drop(columns=[col])
-                except Exception as e:
-                    logger.error(f"날짜 처리 중 오류 발생 ({col}): {str(e)}")
-                    # 오류 발생 시 원본 컬럼 유지
-                    
+        실수형 컬럼은 float32로, 정수형 컬럼은 값 범위에 맞는 가장 작은 정수형으로 변환합니다.
+        
+        Args:
+            df: 입력 데이터프레임
+            
+        Returns:
+            pd.DataFrame: 타입이 축소된 데이터프레임
+        """
+        result_df = df
+        
+        for col in df.columns:
+            dtype = df[col].dtype
+            if pd.api.types.is_bool_dtype(dtype) or not pd.api.types.is_numeric_dtype(dtype):
+                continue
+            if pd.api.types.is_float_dtype(dtype):
+                if dtype != np.float32:
+                    result_df[col] = df[col].astype(np.float32)
+            else:
+                result_df[col] = pd.to_numeric(df[col], downcast='integer')
+                
         return result_df
     
     def create_derived_features(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -389,77 +571,66 @@ class FinancialDataPreprocessor:
         Returns:
             pd.DataFrame: 파생 변수가 추가된 데이터프레임
         """
-        result_df = df.copy()
+        result_df = df
         
-        # 1. 신용 한도 대비 잔액 비율
-        if 'amt_credit_limit_use' in df.columns and 'bal_B0M' in df.columns:
-            result_df['credit_utilization_ratio'] = df['bal_B0M'] / df['amt_credit_limit_use'].replace(0, 1)
-            
-        # 2. 할부 이용 비중
-        if 'bal_int_B0M' in df.columns and 'bal_B0M' in df.columns:
-            result_df['installment_ratio'] = df['bal_int_B0M'] / df['bal_B0M'].replace(0, 1)
-            
-        # 3. 현금서비스 이용 비중
-        if 'bal_ca_B0M' in df.columns and 'bal_B0M' in df.columns:
-            result_df['cash_advance_ratio'] = df['bal_ca_B0M'] / df['bal_B0M'].replace(0, 1)
+        # 1~5. 잔액 비율 (분모가 0이면 기존과 같이 분자 값을 그대로 사용)
+        ratios = [
+            (name, numerator_cols, denominator_col) for name, numerator_cols, denominator_col in _RATIO_FEATURES
+            if denominator_col in df.columns and all(col in df.columns for col in numerator_cols)
+        ]
+        if ratios:
+            denom_cols = list(dict.fromkeys(denominator_col for _, _, denominator_col in ratios))
+            denom_index = np.array([denom_cols.index(denominator_col) for _, _, denominator_col in ratios], dtype=np.int64)
+            denominators = np.vstack([df[col].to_numpy(dtype=np.float64, na_value=np.nan) for col in denom_cols])
+            numerators = np.vstack([
+                df[list(numerator_cols)].to_numpy(dtype=np.float64, na_value=np.nan).sum(axis=1)
+                for _, numerator_cols, _ in ratios
+            ])
             
-        # 4. 리볼빙 이용 비중
-        if 'bal_RV_pif_B0M' in df.columns and 'bal_RV_ca_B0M' in df.columns and 'bal_B0M' in df.columns:
-            result_df['revolving_ratio'] = (df['bal_RV_pif_B0M'] + df['bal_RV_ca_B0M']) / df['bal_B0M'].replace(0, 1)
+            # 대용량 데이터는 numba 커널로 모든 비율을 한 번에 계산
+            if _ratio_kernel is not None and len(df) >= _NUMBA_MIN_ROWS:
+                values = _ratio_kernel(numerators, denominators, denom_index)
+            else:
+                values = numerators.copy()
+                for j, k in enumerate(denom_index):
+                    np.divide(numerators[j], denominators[k], out=values[j], where=denominators[k] != 0)
             
-        # 5. 카드론 이용 비중
-        if 'bal_cl_B0M' in df.columns and 'bal_B0M' in df.columns:
-            result_df['card_loan_ratio'] = df['bal_cl_B0M'] / df['bal_B0M'].replace(0, 1)
+            for j, (name, _, _) in enumerate(ratios):
+                result_df[name] = values[j]
             
         # 6. VIP 등급 수치화
         if 'code_vip' in df.columns:
-            result_df['vip_score'] = df['code_vip'].apply(
-                lambda x: 10 if x in ['01', '02', '03'] else 
-                          (7 if x in ['04', '05', '06', '07'] else 
-                           3 if x in ['08', '09', '10'] else 1)
-            )
+            result_df['vip_score'] = df['code_vip'].map(_VIP_SCORES).fillna(1).astype(np.int8)
             
         # 7. 카드 등급 수치화
         if 'code_topcard_grade' in df.columns:
-            result_df['card_grade_score'] = df['code_topcard_grade'].apply(
-                lambda x: 4 if x == '4' else 
-                          3 if x == '3' else 
-                          2 if x == '2' else 
-                          1 if x == '1' else 0
-            )
+            result_df['card_grade_score'] = df['code_topcard_grade'].map(_CARD_GRADE_SCORES).fillna(0).astype(np.int8)
             
-        # 8. 마케팅 반응 지수
-        marketing_cols = [
-            'cnt_CL_TM_B0M', 'cnt_RV_TM_B0M', 'cnt_CA_TM_B0M', 'cnt_promotion_TM_B0M',
-            'cnt_card_Issue_TM_B0M', 'cnt_ETC_TM_B0M', 'cnt_point_TM_B0M', 'cnt_Insurance_TM_B0M'
-        ]
-        
-        if all(col in df.columns for col in marketing_cols):
-            result_df['marketing_exposure_total'] = df[marketing_cols].sum(axis=1)
+        # 8~10. 집계 지수 (필요한 컬럼을 하나의 행렬로 묶어 행렬 곱 한 번으로 계산)
+        aggregates = [agg for agg in _AGGREGATE_FEATURES if all(col in df.columns for col in agg[2])]
+        if aggregates:
+            agg_cols = list(dict.fromkeys(col for _, _, agg_weights in aggregates for col in agg_weights))
+            col_index = {col: i for i, col in enumerate(agg_cols)}
+            weights = np.zeros((len(agg_cols), len(aggregates)), dtype=np.float32)
+            for j, (_, _, agg_weights) in enumerate(aggregates):
+                for col, weight in agg_weights.items():
+                    weights[col_index[col], j] = weight
             
-        # 9. 채널 활동성 지수
-        channel_cols = [
-            'cnt_ARS_R6M', 'cnt_ARS_menu_R6M', 'day_ARS_R6M', 'mn_ARS_R6M',
-            'cnt_ARS_B0M', 'cnt_menu_ARS_B0M', 'day_ARS_B0M'
-        ]
-        
-        if all(col in df.columns for col in channel_cols):
-            result_df['channel_activity_index'] = (
-                df['cnt_ARS_B0M'] * 0.4 + 
-                df['day_ARS_B0M'] * 0.3 + 
-                df['cnt_ARS_R6M'] * 0.2 + 
-                df['day_ARS_R6M'] * 0.1
-            )
+            block = df[agg_cols].to_numpy(dtype=np.float32, na_value=np.nan)
+            missing = np.isnan(block)
+            used = (weights != 0).astype(np.float32)
+            totals = np.where(missing, 0, block) @ weights
+            counts = (~missing).astype(np.float32) @ used
             
-        # 10. 성장률 평균
-        growth_cols = [
-            'ratio_CNT_ccd_B1M', 'ratio_CNT_crsl_B1M', 'ratio_CNT_pif_B1M',
-            'ratio_CNT_int_B1M', 'ratio_CNT_ca_B1M', 'ratio_CNT_chk_B1M',
-            'ratio_CNT_cl_B1M', 'ratio_amt_ccd_B1M'
-        ]
-        
-        if all(col in df.columns for col in growth_cols):
-            result_df['avg_growth_rate'] = df[growth_cols].mean(axis=1)
+            for j, (name, how, _) in enumerate(aggregates):
+                if how == 'sum':
+                    result_df[name] = totals[:, j]
+                elif how == 'mean':
+                    mean = np.full(len(block), np.nan, dtype=np.float32)
+                    np.divide(totals[:, j], counts[:, j], out=mean, where=counts[:, j] > 0)
+                    result_df[name] = mean
+                else:
+                    result_df[name] = np.where(counts[:, j] == used[:, j].sum(), totals[:, j], np.nan).astype(np.float32)
             
         return result_df
     
@@ -467,6 +638,8 @@ class FinancialDataPreprocessor:
         """
         데이터 전처리 파이프라인
         
+        캐시 디렉토리가 설정되어 있으면 학습이 끝난 전처리기의 추론 결과를 캐시에서 재사용합니다.
+        
         Args:
             df: 입력 데이터프레임
             is_training: 학습 데이터 여부
@@ -474,11 +647,33 @@ class FinancialDataPreprocessor:
         Returns:
             pd.DataFrame: 전처리된 데이터프레임
         """
-        # 1. 결측치 처리
-        df = self.handle_missing_values(df)
+        if is_training:
+            # 학습 시 인코더/스케일러가 다시 학습되므로 상태 키 초기화
+            self._state_key = None
+        elif self._cached_preprocess is not None and self._is_fitted():
+            return self._cached_preprocess(self, df, self._frame_key(df), self._get_state_key())
         
-        # 2. 날짜 변수 처리
-        df = self.process_date_features(df)
+        return self._preprocess(df, is_training)
+    
+    def _preprocess(self, df: pd.DataFrame, is_training: bool) -> pd.DataFrame:
+        """전처리 단계 실행"""
+        # 데이터 복사본 생성 (각 전처리 단계는 이 복사본을 직접 수정)
+        df = df.copy()
+        
+        # 0~2. polars 사용 시 타입 변환, 결측치 처리, 날짜 변수 처리를 하나의 쿼리로 실행
+        polars_df = self._preprocess_polars(df, is_training) if self.use_polars else None
+        if polars_df is not None:
+            df = polars_df
+        else:
+            # 0. PyArrow 기반 타입 및 범주형 category 타입으로 변환
+            df = df.convert_dtypes(dtype_backend='pyarrow', convert_integer=False)
+            df = self.convert_categorical_dtypes(df)
+            
+            # 1. 결측치 처리
+            df = self.handle_missing_values(df, is_training)
+            
+            # 2. 날짜 변수 처리
+            df = self.process_date_features(df)
         
         # 3. 파생 변수 생성
         df = self.create_derived_features(df)
@@ -486,7 +681,105 @@ class FinancialDataPreprocessor:
         # 4. 범주형 변수 인코딩
         df = self.encode_categorical_features(df, is_training)
         
-        # 5. 수치형 변수 스케일링
-        df = self.scale_numerical_features(df, is_training)
+        # 5. 수치형 변수 스케일링 (트리 기반 모델용이면 생략)
+        if not self.for_tree_model:
+            df = self.scale_numerical_features(df, is_training)
+        
+        # 6. 수치형 컬럼 타입 축소
+        df = self.downcast_numeric_features(df)
         
         return df
+    
+    def _preprocess_polars(self, df: pd.DataFrame, is_training: bool) -> Optional[pd.DataFrame]:
+        """
+        polars 지연(lazy) 쿼리로 결측치 처리와 날짜 변수 처리 실행
+        
+        결측치 대체, 날짜 파싱과 경과 일수 계산을 하나의 쿼리 계획으로 묶어 실행한 뒤 PyArrow 기반
+        pandas 데이터프레임으로 변환합니다. 결과는 pandas 경로의 0~2단계와 같습니다.
+        
+        Args:
+            df: 입력 데이터프레임
+            is_training: 학습 데이터 여부 (학습 시 중앙값을 다시 계산)
+            
+        Returns:
+            Optional[pd.DataFrame]: 처리된 데이터프레임 (실패 시 None)
+        """
+        try:
+            present = self._present_features(df)
+            df = self._coerce_numeric_features(df, present['num'])
+            lf = pl.from_pandas(df).lazy()
+            schema = lf.collect_schema()
+            
+            # 1. 결측치 처리 (수치형 컬럼은 위에서 숫자로 변환한 뒤 중앙값으로 대체)
+            # 중앙값은 정렬 없이 선택 알고리즘을 쓰는 pandas로 계산
+            num_features = present['num']
+            if num_features and (is_training or self.num_medians is None):
+                self.num_medians = df[num_features].median()
+            
+            fill_exprs = []
+            if self.num_medians is not None:
+                fill_exprs += [
+                    pl.col(col).fill_null(float(self.num_medians[col])) for col in num_features
+                    if col in self.num_medians.index and pd.notna(self.num_medians[col])
+                ]
+            fill_exprs += [
+                pl.col(col).cast(pl.String).fill_null('UNKNOWN') for col in present['cat']
+                if schema[col] in (pl.String, pl.Categorical)
+            ]
+            fill_exprs += [pl.col(col).cast(pl.String).fill_null('00010101') for col in present['date']]
+            if fill_exprs:
+                lf = lf.with_columns(fill_exprs)
+            
+            # 2. 날짜 변수 처리 (변환 실패 값은 null, 원본 날짜 컬럼은 삭제)
+            today = datetime.now().date()
+            date_exprs = []
+            for col in present['date']:
+                dt = pl.col(col).str.strptime(
+                    pl.Datetime('us'), _DATE_FORMATS.get(col, _DEFAULT_DATE_FORMAT), strict=False
+                )
+                date_exprs.append(dt.alias(f'{col}_dt'))
+                date_exprs.append(
+                    (pl.lit(today) - dt.dt.date()).dt.total_days().cast(pl.Float32).alias(f'{col}_days_diff')
+                )
+            if date_exprs:
+                lf = lf.with_columns(date_exprs).drop(present['date'])
+            
+            result_df = lf.collect().to_pandas().convert_dtypes(dtype_backend='pyarrow', convert_integer=False)
+        except Exception as e:
+            logger.warning(f"polars 전처리 중 오류 발생, pandas 경로로 대체합니다: {str(e)}")
+            return None
+        
+        result_df.index = df.index
+        dt_cols = [f'{col}_dt' for col in present['date']]
+        if dt_cols:
+            result_df[dt_cols] = result_df[dt_cols].astype('datetime64[us]')
+        return self.convert_categorical_dtypes(result_df)
+    
+    def _is_fitted(self) -> bool:
+        """추론에 필요한 상태(중앙값, 인코더, 스케일러)가 학습되었는지 확인"""
+        return (self.num_medians is not None and bool(self.encoders)
+                and (self.for_tree_model or 'numerical' in self.scalers))
+    
+    def _get_state_key(self) -> str:
+        """학습된 상태의 해시 (학습 전까지 재계산하지 않음)"""
+        if self._state_key is None:
+            self._state_key = joblib.hash(
+                (self.num_medians, self.encoders, self.scalers, self.scaled_features, self.for_tree_model)
+            )
+        return self._state_key
+    
+    @staticmethod
+    def _frame_key(df: pd.DataFrame) -> str:
+        """
+        데이터프레임 지문 (행 해시와 컬럼/타입 정보 기반)
+        
+        Args:
+            df: 입력 데이터프레임
+            
+        Returns:
+            str: 해시 문자열
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr(list(zip(df.columns, map(str, df.dtypes)))).encode())
+        digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+        return digest.hexdigest()
@@ -8,86 +8,447 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
 import logging
+import weakref
 from sklearn.feature_selection import SelectKBest, f_classif, mutual_info_classif
 from sklearn.decomposition import PCA
 from sklearn.cluster import KMeans
+from scipy import special
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
 logger = logging.getLogger(__name__)
 
+# numba 커널을 사용할 최소 행 수 (작은 데이터는 NumPy 경로가 더 빠름)
+_NUMBA_MIN_ROWS = 50_000
+
+# numba 커널 사용 전 NumPy 경로와 결과를 대조할 행 수
+_NUMBA_PARITY_ROWS = 1_000
+
+# 채널 활동성 지수 계산에 필요한 컬럼
+_CHANNEL_COLUMNS = (
+    'cnt_ARS_R6M', 'cnt_ARS_menu_R6M', 'day_ARS_R6M', 'mn_ARS_R6M',
+    'cnt_ARS_B0M', 'cnt_menu_ARS_B0M', 'day_ARS_B0M'
+)
+
+# 채널 활동성 지수 가중합 컬럼과 가중치 (최근 활동에 더 높은 가중치)
+_CHANNEL_ACTIVITY_COLUMNS = ['cnt_ARS_B0M', 'day_ARS_B0M', 'cnt_ARS_R6M', 'day_ARS_R6M']
+_CHANNEL_ACTIVITY_WEIGHTS = np.array([0.4, 0.3, 0.2, 0.1], dtype=np.float32)
+
+# 마케팅 반응성 지수 계산에 필요한 컬럼과 유형별 선호도 출력 컬럼 (같은 순서)
+_MARKETING_COLUMNS = [
+    'cnt_CL_TM_B0M', 'cnt_RV_TM_B0M', 'cnt_CA_TM_B0M', 'cnt_promotion_TM_B0M',
+    'cnt_card_Issue_TM_B0M', 'cnt_ETC_TM_B0M', 'cnt_point_TM_B0M', 'cnt_Insurance_TM_B0M'
+]
+_MARKETING_PREFERENCE_COLUMNS = [
+    f"{col.replace('cnt_', '').replace('_TM_B0M', '')}_preference" for col in _MARKETING_COLUMNS
+]
+
+# 통합 커널 입력 컬럼 (순서가 커널의 입력 행 인덱스)
+_FUSED_INPUT_COLUMNS = (
+    'bal_B0M', 'amt_credit_limit_use', 'bal_ca_B0M', 'bal_cl_B0M', 'bal_int_B0M', 'bal_pif_B0M',
+    'vip_score', 'avg_growth_rate', 'cnt_ARS_B0M', 'day_ARS_B0M', 'cnt_ARS_R6M', 'day_ARS_R6M'
+)
+
+# 통합 커널 출력 (순서가 커널의 출력 행 인덱스, 튜플 키는 _safe_ratio의 (분자, 분모) 비율)
+_FUSED_OUTPUT_KEYS = (
+    ('bal_B0M', 'amt_credit_limit_use'), ('bal_ca_B0M', 'bal_B0M'), ('bal_cl_B0M', 'bal_B0M'),
+    'installment_preference', 'channel_activity_index',
+    'financial_health_score', 'credit_risk_score', 'churn_risk_score'
+)
+
+# 특성 블록별 필요 컬럼
+_REQUIRED_COLUMNS = {
+    'credit_utilization': frozenset({'bal_B0M', 'amt_credit_limit_use'}),
+    'cash_advance': frozenset({'bal_ca_B0M', 'bal_B0M'}),
+    'card_loan': frozenset({'bal_cl_B0M', 'bal_B0M'}),
+    'installment': frozenset({'bal_int_B0M', 'bal_pif_B0M'}),
+    'channel': frozenset(_CHANNEL_COLUMNS),
+    'marketing': frozenset(_MARKETING_COLUMNS),
+    'fused': frozenset(_FUSED_INPUT_COLUMNS + _CHANNEL_COLUMNS),
+}
+
+# 결제 방법 원-핫 특성 이름 -> 원본 code_pay 코드
+_PAYMENT_METHOD_CODES = {
+    'payment_method_counter': '1',
+    'payment_method_window': '2',
+    'payment_method_cms': '3'
+}
+
+# 등급/수준 범주형 dtype (호출마다 범주를 다시 검증하지 않도록 한 번만 생성)
+_HEALTH_GRADE_DTYPE = pd.CategoricalDtype(categories=['F', 'D', 'C', 'B', 'A'], ordered=True)
+_RISK_GRADE_DTYPE = pd.CategoricalDtype(categories=['A', 'B', 'C', 'D', 'F'], ordered=True)
+_ACTIVITY_LEVEL_DTYPE = pd.CategoricalDtype(
+    categories=['very_low', 'low', 'medium', 'high', 'very_high'], ordered=True
+)
+
+# 등급 구간 경계
+_HEALTH_GRADE_BINS = [0, 20, 40, 60, 80, 100]
+_RISK_GRADE_BINS = [0, 0.2, 0.4, 0.6, 0.8, 1.0]
+
+
+def _to_float_array(values: Any) -> np.ndarray:
+    """Series 또는 배열을 결측치가 NaN인 float32 배열로 변환 (이미 float32 배열이면 복사하지 않음)"""
+    if isinstance(values, pd.Series):
+        return values.to_numpy(dtype=np.float32, na_value=np.nan)
+    return np.asarray(values, dtype=np.float32)
+
+
+def _safe_divide(numerator: Any, denominator: Any) -> np.ndarray:
+    """
+    분모가 0인 행은 분자 값을 그대로 사용하는 나눗셈 (분모의 0을 1로 바꿔 나눈 것과 같은 결과)
+    
+    Args:
+        numerator: 분자 (Series 또는 배열)
+        denominator: 분모 (Series 또는 배열)
+        
+    Returns:
+        np.ndarray: 나눗셈 결과
+    """
+    numerator = _to_float_array(numerator)
+    denominator = _to_float_array(denominator)
+    return np.divide(numerator, denominator, out=numerator.copy(), where=denominator != 0)
+
+
+def _feature_mean(features: List[np.ndarray]) -> np.ndarray:
+    """
+    특성 배열의 동일 가중치 평균 (2차원 배열로 쌓아 한 번에 합산)
+    
+    Args:
+        features: 같은 길이의 특성 배열 목록
+        
+    Returns:
+        np.ndarray: 행별 평균 (특성 중 하나라도 결측이면 NaN)
+    """
+    return np.add.reduce(np.stack(features), axis=0) / len(features)
+
+
+def _cut_codes(values: np.ndarray, bins: List[float], include_lowest: bool = False) -> np.ndarray:
+    """
+    pd.cut과 같은 오른쪽 닫힌 구간 (a, b] 기준 구간 코드 계산
+    
+    Args:
+        values: 실수 배열
+        bins: 오름차순 구간 경계
+        include_lowest: 첫 구간에 최솟값 경계 포함 여부
+        
+    Returns:
+        np.ndarray: 구간 코드 (범위 밖이거나 결측이면 -1)
+    """
+    # 경계를 값과 같은 정밀도로 맞춰 float32 점수가 경계값(0.2 등)과 같을 때 pd.cut과 같은 구간에 속하도록 함
+    bins = np.asarray(bins, dtype=values.dtype)
+    codes = np.digitize(values, bins[1:-1], right=True).astype(np.int8)
+    in_range = (values >= bins[0] if include_lowest else values > bins[0]) & (values <= bins[-1])
+    codes[~in_range] = -1
+    return codes
+
+
+def _code_label(value: Any) -> str:
+    """범주 값을 원본 코드 문자열로 정규화 (1, 1.0, '1'은 모두 '1')"""
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+def _anova_f_scores(X: np.ndarray, y: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    전체 특성의 일원 분산분석 F 통계량 일괄 계산 (sklearn f_classif와 같은 결과)
+    
+    Args:
+        X: (샘플 수, 특성 수) 실수 행렬
+        y: 클래스 레이블
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: 특성별 F 통계량, p-값 (상수 특성은 NaN)
+    """
+    if not np.isfinite(X).all():
+        raise ValueError("입력 데이터에 NaN 또는 무한대 값이 있습니다.")
+    
+    classes, class_index = np.unique(np.asarray(y), return_inverse=True)
+    n_samples, n_classes = X.shape[0], len(classes)
+    
+    # 전체 평균으로 중심화한 뒤 클래스별 합을 행렬곱 한 번으로 계산
+    centered = X - X.mean(axis=0)
+    onehot = np.zeros((n_samples, n_classes))
+    onehot[np.arange(n_samples), class_index] = 1.0
+    class_counts = onehot.sum(axis=0)
+    class_sums = onehot.T @ centered
+    
+    ss_total = np.einsum('ij,ij->j', centered, centered)
+    ss_between = (class_sums ** 2 / class_counts[:, None]).sum(axis=0)
+    ss_within = ss_total - ss_between
+    
+    df_between = n_classes - 1
+    df_within = n_samples - n_classes
+    with np.errstate(divide='ignore', invalid='ignore'):
+        f_scores = (ss_between / df_between) / (ss_within / df_within)
+    p_values = special.fdtrc(df_between, df_within, f_scores)
+    return f_scores, p_values
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _clip(value, low, high):
+        """범위 제한 (NaN은 그대로 유지)"""
+        if value < low:
+            return low
+        if value > high:
+            return high
+        return value
+
+    @njit(parallel=True, cache=True)
+    def _fused_feature_kernel(inputs: np.ndarray) -> np.ndarray:
+        """
+        비율, 선호도, 활동성 지수, 금융 건강/신용 리스크/이탈 리스크 점수를 행 단위 한 번의 루프로 계산
+        
+        NumPy 경로와 같은 float32 연산 순서를 사용합니다.
+        
+        Args:
+            inputs: _FUSED_INPUT_COLUMNS 순서의 (12, 행 수) float32 행렬
+            
+        Returns:
+            np.ndarray: _FUSED_OUTPUT_KEYS 순서의 (8, 행 수) float32 행렬
+        """
+        n_rows = inputs.shape[1]
+        out = np.empty((8, n_rows), dtype=np.float32)
+        zero = np.float32(0.0)
+        one = np.float32(1.0)
+        half = np.float32(0.5)
+        for i in prange(n_rows):
+            bal = inputs[0, i]
+            limit = inputs[1, i]
+            bal_ca = inputs[2, i]
+            bal_cl = inputs[3, i]
+            bal_int = inputs[4, i]
+            bal_pif = inputs[5, i]
+            vip = inputs[6, i]
+            growth = inputs[7, i]
+            
+            # 비율 (분모가 0이면 분자 값 사용)
+            credit_utilization = bal / limit if limit != zero else bal
+            cash_advance_ratio = bal_ca / bal if bal != zero else bal_ca
+            card_loan_ratio = bal_cl / bal if bal != zero else bal_cl
+            installment_total = bal_int + bal_pif
+            installment_ratio = bal_int / installment_total if installment_total != zero else bal_int
+            
+            # 채널 활동성 지수
+            activity_index = (inputs[8, i] * np.float32(0.4) + inputs[9, i] * np.float32(0.3)
+                              + inputs[10, i] * np.float32(0.2) + inputs[11, i] * np.float32(0.1))
+            
+            credit_risk = _clip(credit_utilization, zero, one)
+            cash_advance_risk = _clip(cash_advance_ratio, zero, one)
+            card_loan_risk = _clip(card_loan_ratio, zero, one)
+            growth_risk = _clip(half - growth / np.float32(2.0), zero, one)
+            
+            # 금융 건강 점수 (0-100)
+            hundred = np.float32(100.0)
+            health = (hundred * (one - credit_risk) + hundred * (one - cash_advance_risk)
+                      + hundred * (one - card_loan_risk) + vip * np.float32(10.0)
+                      + _clip(np.float32(50.0) + growth * np.float32(50.0), zero, hundred))
+            
+            # 신용 리스크 점수
+            risk = credit_risk + cash_advance_risk + card_loan_risk + (one - vip / np.float32(10.0)) + growth_risk
+            
+            # 이탈 리스크 점수
+            churn = (one - _clip(activity_index / np.float32(10.0), zero, one)) + growth_risk
+            
+            out[0, i] = credit_utilization
+            out[1, i] = cash_advance_ratio
+            out[2, i] = card_loan_ratio
+            out[3, i] = _clip(installment_ratio, zero, one)
+            out[4, i] = activity_index
+            out[5, i] = health / np.float32(5.0)
+            out[6, i] = risk / np.float32(5.0)
+            out[7, i] = churn / np.float32(2.0)
+        return out
+else:
+    _fused_feature_kernel = None
+
+
+def _channel_activity_index(activity: np.ndarray) -> np.ndarray:
+    """
+    채널 활동성 지수 가중합 (numba 커널과 같은 float32 곱셈-덧셈 순서 ((a*w0 + b*w1) + c*w2) + d*w3)
+    
+    행렬-벡터 곱(BLAS)은 덧셈 순서가 달라 커널과 결과가 1 ulp씩 달라질 수 있으므로 순서를 명시해 계산합니다.
+    
+    Args:
+        activity: _CHANNEL_ACTIVITY_COLUMNS 순서의 (4, 행 수) float32 행렬
+        
+    Returns:
+        np.ndarray: 행별 채널 활동성 지수 (float32)
+    """
+    index = activity[0] * _CHANNEL_ACTIVITY_WEIGHTS[0]
+    for values, weight in zip(activity[1:], _CHANNEL_ACTIVITY_WEIGHTS[1:]):
+        index += values * weight
+    return index
+
+def _fused_feature_arrays(inputs: np.ndarray) -> np.ndarray:
+    """
+    _fused_feature_kernel과 같은 특성을 NumPy 배열 연산으로 계산 (numba가 없거나 데이터가 작을 때 사용)
+    
+    Args:
+        inputs: _FUSED_INPUT_COLUMNS 순서의 (12, 행 수) float32 행렬
+        
+    Returns:
+        np.ndarray: _FUSED_OUTPUT_KEYS 순서의 (8, 행 수) float32 행렬
+    """
+    bal, limit, bal_ca, bal_cl, bal_int, bal_pif, vip, growth = inputs[:8]
+    out = np.empty((8, inputs.shape[1]), dtype=np.float32)
+    
+    # 비율과 할부 선호도 (분모가 0이면 분자 값 사용)
+    out[0] = _safe_divide(bal, limit)
+    out[1] = _safe_divide(bal_ca, bal)
+    out[2] = _safe_divide(bal_cl, bal)
+    out[3] = np.clip(_safe_divide(bal_int, bal_int + bal_pif), 0, 1)
+    
+    # 채널 활동성 지수
+    out[4] = _channel_activity_index(inputs[8:12])
+    
+    ratio_risks = np.clip(out[:3], 0, 1)
+    growth_risk = np.clip(0.5 - growth / 2, 0, 1)
+    
+    # 금융 건강 점수, 신용 리스크 점수, 이탈 리스크 점수
+    ratio_scores = 100 * (1 - ratio_risks)
+    out[5] = _feature_mean([*ratio_scores, vip * 10, np.clip(50 + growth * 50, 0, 100)])
+    out[6] = _feature_mean([*ratio_risks, 1 - vip / 10, growth_risk])
+    out[7] = _feature_mean([1 - np.clip(out[4] / 10, 0, 1), growth_risk])
+    return out
+
+
 class FinancialFeatureGenerator:
     """금융 특성 생성기 클래스"""
     
-    def __init__(self):
-        """금융 특성 생성기 초기화"""
+    def __init__(self, category_encoders: Optional[Dict[str, pd.Index]] = None):
+        """
+        금융 특성 생성기 초기화
+        
+        Args:
+            category_encoders: 전처리기(FinancialDataPreprocessor.encoders)의 컬럼별 정렬된 범주 목록
+                (라벨 인코딩된 범주형 코드를 원본 값으로 되돌릴 때 사용)
+        """
+        self.category_encoders = category_encoders or {}
         self.feature_selectors = {}
         self.pca_models = {}
         self.cluster_models = {}
+        self.cluster_features = {}  # 클러스터 모델별 학습 특성 컬럼 (모델 재사용 판단용)
+        
+        # 컬럼 비율 캐시 (같은 데이터프레임에 대한 반복 계산 방지, (분자, 분모) -> 비율 배열)
+        self._ratio_cache: Dict[Tuple[str, str], np.ndarray] = {}
+        self._ratio_cache_frame: Optional[weakref.ref] = None
+        
+        # generate_features 실행 중 numba 커널로 미리 계산한 특성 (_FUSED_OUTPUT_KEYS -> 배열)
+        self._fused_features: Dict[Any, np.ndarray] = {}
+        
+        # numba 커널과 NumPy 경로의 결과 일치 여부 (None이면 아직 대조하지 않음)
+        self._kernel_parity: Optional[bool] = None
+        
+    def _safe_ratio(self, df: pd.DataFrame, numerator_col: str, denominator_col: str) -> np.ndarray:
+        """
+        컬럼 비율 계산 (분모가 0이면 분자 값 사용, 같은 데이터프레임이면 이전 결과 재사용)
+        
+        반환 배열은 여러 특성이 공유하므로 읽기 전용입니다.
+        
+        Args:
+            df: 입력 데이터프레임
+            numerator_col: 분자 컬럼
+            denominator_col: 분모 컬럼
+            
+        Returns:
+            np.ndarray: 비율 배열
+        """
+        cached_frame = self._ratio_cache_frame() if self._ratio_cache_frame is not None else None
+        if cached_frame is not df:
+            self._ratio_cache.clear()
+            self._ratio_cache_frame = weakref.ref(df)
+        
+        key = (numerator_col, denominator_col)
+        ratio = self._fused_features.get(key)
+        if ratio is not None:
+            return ratio
         
+        ratio = self._ratio_cache.get(key)
+        if ratio is None:
+            ratio = _safe_divide(df[numerator_col], df[denominator_col])
+            ratio.flags.writeable = False
+            self._ratio_cache[key] = ratio
+        return ratio
+    
     def generate_financial_health_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         금융 건강 관련 특성 생성
         
         Args:
-            df: 입력 데이터프레임
+            df: 입력 데이터프레임 (특성 컬럼이 직접 추가됨)
             
         Returns:
             pd.DataFrame: 특성이 추가된 데이터프레임
         """
-        result_df = df.copy()
+        result_df = df
+        columns = set(df.columns)  # 컬럼 존재 여부 확인용 (한 번만 생성)
         
         # 1. 부채 비율 (Debt Ratio)
-        if all(col in df.columns for col in ['bal_B0M', 'amt_credit_limit_use']):
-            result_df['debt_ratio'] = df['bal_B0M'] / df['amt_credit_limit_use'].replace(0, 1)
-            # 부채 비율 구간화
-            result_df['debt_ratio_level'] = pd.cut(
-                result_df['debt_ratio'], 
-                bins=[0, 0.3, 0.5, 0.7, 1.0, float('inf')],
-                labels=[1, 2, 3, 4, 5]
-            ).astype(int)
+        if _REQUIRED_COLUMNS['credit_utilization'] <= columns:
+            result_df['debt_ratio'] = self._safe_ratio(df, 'bal_B0M', 'amt_credit_limit_use')
+            # 부채 비율 구간화 (0.3 이하 1 ~ 1.0 초과 5, 결측은 0)
+            debt_ratio = result_df['debt_ratio'].to_numpy()
+            debt_ratio_bins = np.array([0.3, 0.5, 0.7, 1.0], dtype=debt_ratio.dtype)
+            debt_ratio_level = np.digitize(debt_ratio, debt_ratio_bins, right=True).astype(np.int8) + 1
+            debt_ratio_level[np.isnan(debt_ratio)] = 0
+            result_df['debt_ratio_level'] = debt_ratio_level
             
         # 2. 금융 건강 점수 (Financial Health Score)
-        # 여러 지표를 결합하여 0-100 사이의 점수 생성
-        health_features = []
-        
-        # 신용 한도 활용도 (낮을수록 좋음)
-        if all(col in df.columns for col in ['bal_B0M', 'amt_credit_limit_use']):
-            credit_utilization = df['bal_B0M'] / df['amt_credit_limit_use'].replace(0, 1)
-            credit_utilization_score = 100 * (1 - np.clip(credit_utilization, 0, 1))
-            health_features.append(credit_utilization_score)
-            
-        # 현금서비스 의존도 (낮을수록 좋음)
-        if all(col in df.columns for col in ['bal_ca_B0M', 'bal_B0M']):
-            cash_advance_ratio = df['bal_ca_B0M'] / df['bal_B0M'].replace(0, 1)
-            cash_advance_score = 100 * (1 - np.clip(cash_advance_ratio, 0, 1))
-            health_features.append(cash_advance_score)
-            
-        # 카드론 의존도 (낮을수록 좋음)
-        if all(col in df.columns for col in ['bal_cl_B0M', 'bal_B0M']):
-            card_loan_ratio = df['bal_cl_B0M'] / df['bal_B0M'].replace(0, 1)
-            card_loan_score = 100 * (1 - np.clip(card_loan_ratio, 0, 1))
-            health_features.append(card_loan_score)
-            
-        # VIP 등급 (높을수록 좋음)
-        if 'vip_score' in df.columns:
-            vip_score = df['vip_score'] * 10  # 1-10 -> 10-100
-            health_features.append(vip_score)
-            
-        # 성장률 (높을수록 좋음)
-        if 'avg_growth_rate' in df.columns:
-            growth_score = 50 + df['avg_growth_rate'] * 50  # 중앙값 50
-            growth_score = np.clip(growth_score, 0, 100)
-            health_features.append(growth_score)
-            
-        # 금융 건강 점수 계산 (가중 평균)
-        if health_features:
-            # 모든 특성에 동일한 가중치 부여
-            result_df['financial_health_score'] = sum(health_features) / len(health_features)
+        # 여러 지표를 결합하여 0-100 사이의 점수 생성 (numba 커널로 미리 계산했으면 재사용)
+        health_score = self._fused_features.get('financial_health_score')
+        if health_score is None:
+            health_features = []
+            
+            # 신용 한도 활용도 (낮을수록 좋음)
+            if _REQUIRED_COLUMNS['credit_utilization'] <= columns:
+                credit_utilization = self._safe_ratio(df, 'bal_B0M', 'amt_credit_limit_use')
+                credit_utilization_score = np.clip(credit_utilization, 0, 1)
+                np.subtract(1, credit_utilization_score, out=credit_utilization_score)
+                credit_utilization_score *= 100
+                health_features.append(credit_utilization_score)
+            
+            # 현금서비스 의존도 (낮을수록 좋음)
+            if _REQUIRED_COLUMNS['cash_advance'] <= columns:
+                cash_advance_ratio = self._safe_ratio(df, 'bal_ca_B0M', 'bal_B0M')
+                cash_advance_score = np.clip(cash_advance_ratio, 0, 1)
+                np.subtract(1, cash_advance_score, out=cash_advance_score)
+                cash_advance_score *= 100
+                health_features.append(cash_advance_score)
+            
+            # 카드론 의존도 (낮을수록 좋음)
+            if _REQUIRED_COLUMNS['card_loan'] <= columns:
+                card_loan_ratio = self._safe_ratio(df, 'bal_cl_B0M', 'bal_B0M')
+                card_loan_score = np.clip(card_loan_ratio, 0, 1)
+                np.subtract(1, card_loan_score, out=card_loan_score)
+                card_loan_score *= 100
+                health_features.append(card_loan_score)
+            
+            # VIP 등급 (높을수록 좋음)
+            if 'vip_score' in columns:
+                vip_score = _to_float_array(df['vip_score']) * 10  # 1-10 -> 10-100
+                health_features.append(vip_score)
+            
+            # 성장률 (높을수록 좋음)
+            if 'avg_growth_rate' in columns:
+                growth_score = 50 + _to_float_array(df['avg_growth_rate']) * 50  # 중앙값 50
+                np.clip(growth_score, 0, 100, out=growth_score)
+                health_features.append(growth_score)
+            
+            # 금융 건강 점수 계산 (가중 평균, 모든 특성에 동일한 가중치 부여)
+            if health_features:
+                health_score = _feature_mean(health_features)
+        
+        if health_score is not None:
+            result_df['financial_health_score'] = health_score
             
             # 금융 건강 등급 부여
-            result_df['financial_health_grade'] = pd.cut(
-                result_df['financial_health_score'], 
-                bins=[0, 20, 40, 60, 80, 100],
-                labels=['F', 'D', 'C', 'B', 'A']
+            result_df['financial_health_grade'] = pd.Categorical.from_codes(
+                _cut_codes(_to_float_array(result_df['financial_health_score']), _HEALTH_GRADE_BINS),
+                dtype=_HEALTH_GRADE_DTYPE
             )
             
         return result_df
@@ -97,223 +458,273 @@ class FinancialFeatureGenerator:
         행동 패턴 관련 특성 생성
         
         Args:
-            df: 입력 데이터프레임
+            df: 입력 데이터프레임 (특성 컬럼이 직접 추가됨)
             
         Returns:
             pd.DataFrame: 특성이 추가된 데이터프레임
         """
-        result_df = df.copy()
+        result_df = df
+        columns = set(df.columns)  # 컬럼 존재 여부 확인용 (한 번만 생성)
         
         # 1. 할부 선호도 (Installment Preference)
-        if all(col in df.columns for col in ['bal_int_B0M', 'bal_pif_B0M']):
-            installment_pref = df['bal_int_B0M'] / (df['bal_int_B0M'] + df['bal_pif_B0M']).replace(0, 1)
-            result_df['installment_preference'] = np.clip(installment_pref, 0, 1)
+        if 'installment_preference' in self._fused_features:
+            result_df['installment_preference'] = self._fused_features['installment_preference']
+        elif _REQUIRED_COLUMNS['installment'] <= columns:
+            installment_pref = _safe_divide(df['bal_int_B0M'], df['bal_int_B0M'] + df['bal_pif_B0M'])
+            result_df['installment_preference'] = np.clip(installment_pref, 0, 1, out=installment_pref)
             
         # 2. 현금서비스 선호도 (Cash Advance Preference)
-        if all(col in df.columns for col in ['bal_ca_B0M', 'bal_B0M']):
-            ca_pref = df['bal_ca_B0M'] / df['bal_B0M'].replace(0, 1)
+        if _REQUIRED_COLUMNS['cash_advance'] <= columns:
+            ca_pref = self._safe_ratio(df, 'bal_ca_B0M', 'bal_B0M')
             result_df['cash_advance_preference'] = np.clip(ca_pref, 0, 1)
             
         # 3. 채널 활동성 지수 (Channel Activity Index)
-        channel_cols = [
-            'cnt_ARS_R6M', 'cnt_ARS_menu_R6M', 'day_ARS_R6M', 'mn_ARS_R6M',
-            'cnt_ARS_B0M', 'cnt_menu_ARS_B0M', 'day_ARS_B0M'
-        ]
-        
-        if all(col in df.columns for col in channel_cols):
+        if _REQUIRED_COLUMNS['channel'] <= columns:
             # 최근 활동에 더 높은 가중치 부여
-            result_df['channel_activity_index'] = (
-                df['cnt_ARS_B0M'] * 0.4 + 
-                df['day_ARS_B0M'] * 0.3 + 
-                df['cnt_ARS_R6M'] * 0.2 + 
-                df['day_ARS_R6M'] * 0.1
-            )
-            
-            # 활동성 수준 구분
-            result_df['channel_activity_level'] = pd.qcut(
-                result_df['channel_activity_index'].clip(lower=0), 
-                q=5, 
-                labels=['very_low', 'low', 'medium', 'high', 'very_high']
+            activity_index = self._fused_features.get('channel_activity_index')
+            if activity_index is None:
+                # 통합 커널과 같은 float32 연산 순서로 가중합 (데이터 크기에 따라 활동성 수준이 달라지지 않도록)
+                activity_index = _channel_activity_index(
+                    df[_CHANNEL_ACTIVITY_COLUMNS].to_numpy(dtype=np.float32, na_value=np.nan).T
+                )
+            result_df['channel_activity_index'] = activity_index
+            
+            # 활동성 수준 구분 (5분위 경계로 구간화, 경계가 겹쳐도 오류 없이 처리)
+            activity = np.clip(_to_float_array(result_df['channel_activity_index']), 0, None)
+            # 분위 경계는 float64로 보간한 뒤 _cut_codes에서 float32로 맞춤
+            quantiles = np.nanquantile(activity.astype(np.float64), [0, 0.2, 0.4, 0.6, 0.8, 1.0])
+            result_df['channel_activity_level'] = pd.Categorical.from_codes(
+                _cut_codes(activity, quantiles, include_lowest=True), dtype=_ACTIVITY_LEVEL_DTYPE
             )
             
         # 4. 마케팅 반응성 지수 (Marketing Response Index)
-        marketing_cols = [
-            'cnt_CL_TM_B0M', 'cnt_RV_TM_B0M', 'cnt_CA_TM_B0M', 'cnt_promotion_TM_B0M',
-            'cnt_card_Issue_TM_B0M', 'cnt_ETC_TM_B0M', 'cnt_point_TM_B0M', 'cnt_Insurance_TM_B0M'
-        ]
-        
-        if all(col in df.columns for col in marketing_cols):
-            # 총 마케팅 노출 횟수
-            result_df['marketing_exposure_total'] = df[marketing_cols].sum(axis=1)
-            
-            # 마케팅 유형별 선호도
-            for col in marketing_cols:
-                col_name = col.replace('cnt_', '').replace('_TM_B0M', '')
-                result_df[f'{col_name}_preference'] = df[col] / result_df['marketing_exposure_total'].replace(0, 1)
+        if _REQUIRED_COLUMNS['marketing'] <= columns:
+            # 총 마케팅 노출 횟수 (결측은 0으로 보고 합산)
+            marketing = df[_MARKETING_COLUMNS].to_numpy(dtype=np.float32, na_value=np.nan)
+            marketing_total = np.nansum(marketing, axis=1, keepdims=True)
+            result_df['marketing_exposure_total'] = marketing_total[:, 0]
+            
+            # 마케팅 유형별 선호도 (전체 행렬을 한 번에 나눔, 노출 합계가 0이면 원래 값 사용)
+            preferences = np.divide(marketing, marketing_total, out=marketing.copy(), where=marketing_total != 0)
+            result_df[_MARKETING_PREFERENCE_COLUMNS] = preferences
                 
         # 5. 결제 행동 특성 (Payment Behavior)
-        if 'code_pay' in df.columns:
-            # 결제 방법 원-핫 인코딩
-            result_df['payment_method_counter'] = 1
-            result_df['payment_method_window'] = 1
-            result_df['payment_method_cms'] = 1
-            
-            # 결제 방법에 따라 해당 열에 1 설정
-            result_df.loc[df['code_pay'] == '1', 'payment_method_counter'] = 1
-            result_df.loc[df['code_pay'] == '2', 'payment_method_window'] = 1
-            result_df.loc[df['code_pay'] == '3', 'payment_method_cms'] = 1
+        if 'code_pay' in columns:
+            # 결제 방법 원-핫 인코딩 (해당 결제 방법이면 1, 아니면 0)
+            for name, indicator in self._payment_method_indicators(df['code_pay']).items():
+                result_df[name] = indicator
             
         return result_df
     
+    def _payment_method_indicators(self, pay_codes: pd.Series) -> Dict[str, np.ndarray]:
+        """
+        결제 방법 원-핫 지표 계산
+        
+        원본 문자열/숫자 코드와 전처리기에서 라벨 인코딩된 정수 코드를 모두 지원합니다.
+        정수 코드는 category_encoders['code_pay']의 범주로 되돌려 비교하며, 비교는 행이 아닌 범주 단위로 한 번만 수행합니다.
+        
+        Args:
+            pay_codes: code_pay 컬럼
+            
+        Returns:
+            Dict[str, np.ndarray]: _PAYMENT_METHOD_CODES 특성별 int8 지표
+        """
+        categories = self.category_encoders.get('code_pay')
+        if categories is not None and pd.api.types.is_integer_dtype(pay_codes.dtype):
+            codes = pay_codes.to_numpy()
+        else:
+            categorical = pd.Categorical(pay_codes)
+            codes, categories = categorical.codes, categorical.categories
+        
+        # 결측치 코드(-1)는 마지막의 빈 레이블로 매핑
+        labels = np.array([_code_label(value) for value in categories] + [''], dtype=object)
+        indicators = {
+            name: (labels == code).astype(np.int8)[codes] for name, code in _PAYMENT_METHOD_CODES.items()
+        }
+        
+        if len(pay_codes) and not any(indicator.any() for indicator in indicators.values()):
+            logger.warning(
+                "code_pay 값이 결제 방법 코드와 일치하지 않아 결제 방법 특성이 모두 0입니다. "
+                "라벨 인코딩된 데이터라면 전처리기의 encoders를 category_encoders로 전달하세요."
+            )
+        return indicators
+    
     def generate_risk_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         리스크 관련 특성 생성
         
         Args:
-            df: 입력 데이터프레임
+            df: 입력 데이터프레임 (특성 컬럼이 직접 추가됨)
             
         Returns:
             pd.DataFrame: 특성이 추가된 데이터프레임
         """
-        result_df = df.copy()
-        
-        # 1. 신용 리스크 점수 (Credit Risk Score)
-        risk_features = []
-        
-        # 신용 한도 활용도 (높을수록 위험)
-        if all(col in df.columns for col in ['bal_B0M', 'amt_credit_limit_use']):
-            credit_utilization = df['bal_B0M'] / df['amt_credit_limit_use'].replace(0, 1)
-            credit_risk = np.clip(credit_utilization, 0, 1)
-            risk_features.append(credit_risk)
-            
-        # 현금서비스 의존도 (높을수록 위험)
-        if all(col in df.columns for col in ['bal_ca_B0M', 'bal_B0M']):
-            cash_advance_ratio = df['bal_ca_B0M'] / df['bal_B0M'].replace(0, 1)
-            cash_advance_risk = np.clip(cash_advance_ratio, 0, 1)
-            risk_features.append(cash_advance_risk)
-            
-        # 카드론 의존도 (높을수록 위험)
-        if all(col in df.columns for col in ['bal_cl_B0M', 'bal_B0M']):
-            card_loan_ratio = df['bal_cl_B0M'] / df['bal_B0M'].replace(0, 1)
-            card_loan_risk = np.clip(card_loan_ratio, 0, 1)
-            risk_features.append(card_loan_risk)
-            
-        # VIP 등급 (낮을수록 위험)
-        if 'vip_score' in df.columns:
-            vip_risk = 1 - (df['vip_score'] / 10)  # 0-1 스케일로 변환
-            risk_features.append(vip_risk)
-            
-        # 성장률 (낮을수록 위험)
-        if 'avg_growth_rate' in df.columns:
-            growth_risk = 0.5 - df['avg_growth_rate'] / 2  # 중앙값 0.5
-            growth_risk = np.clip(growth_risk, 0, 1)
-            risk_features.append(growth_risk)
-            
-        # 신용 리스크 점수 계산 (가중 평균)
-        if risk_features:
-            # 모든 특성에 동일한 가중치 부여
-            result_df['credit_risk_score'] = sum(risk_features) / len(risk_features)
+        result_df = df
+        columns = set(df.columns)  # 컬럼 존재 여부 확인용 (한 번만 생성)
+        
+        # 1. 신용 리스크 점수 (Credit Risk Score, numba 커널로 미리 계산했으면 재사용)
+        credit_risk_score = self._fused_features.get('credit_risk_score')
+        if credit_risk_score is None:
+            risk_features = []
+            
+            # 신용 한도 활용도 (높을수록 위험)
+            if _REQUIRED_COLUMNS['credit_utilization'] <= columns:
+                credit_utilization = self._safe_ratio(df, 'bal_B0M', 'amt_credit_limit_use')
+                credit_risk = np.clip(credit_utilization, 0, 1)
+                risk_features.append(credit_risk)
+            
+            # 현금서비스 의존도 (높을수록 위험)
+            if _REQUIRED_COLUMNS['cash_advance'] <= columns:
+                cash_advance_ratio = self._safe_ratio(df, 'bal_ca_B0M', 'bal_B0M')
+                cash_advance_risk = np.clip(cash_advance_ratio, 0, 1)
+                risk_features.append(cash_advance_risk)
+            
+            # 카드론 의존도 (높을수록 위험)
+            if _REQUIRED_COLUMNS['card_loan'] <= columns:
+                card_loan_ratio = self._safe_ratio(df, 'bal_cl_B0M', 'bal_B0M')
+                card_loan_risk = np.clip(card_loan_ratio, 0, 1)
+                risk_features.append(card_loan_risk)
+            
+            # VIP 등급 (낮을수록 위험)
+            if 'vip_score' in columns:
+                vip_risk = 1 - (_to_float_array(df['vip_score']) / 10)  # 0-1 스케일로 변환
+                risk_features.append(vip_risk)
+            
+            # 성장률 (낮을수록 위험)
+            if 'avg_growth_rate' in columns:
+                growth_risk = 0.5 - _to_float_array(df['avg_growth_rate']) / 2  # 중앙값 0.5
+                np.clip(growth_risk, 0, 1, out=growth_risk)
+                risk_features.append(growth_risk)
+            
+            # 신용 리스크 점수 계산 (가중 평균, 모든 특성에 동일한 가중치 부여)
+            if risk_features:
+                credit_risk_score = _feature_mean(risk_features)
+        
+        if credit_risk_score is not None:
+            result_df['credit_risk_score'] = credit_risk_score
             
             # 리스크 등급 부여
-            result_df['credit_risk_grade'] = pd.cut(
-                result_df['credit_risk_score'], 
-                bins=[0, 0.2, 0.4, 0.6, 0.8, 1.0],
-                labels=['A', 'B', 'C', 'D', 'F']
+            result_df['credit_risk_grade'] = pd.Categorical.from_codes(
+                _cut_codes(_to_float_array(result_df['credit_risk_score']), _RISK_GRADE_BINS),
+                dtype=_RISK_GRADE_DTYPE
             )
             
-        # 2. 이탈 리스크 점수 (Churn Risk Score)
-        churn_features = []
+        # 2. 이탈 리스크 점수 (Churn Risk Score, numba 커널로 미리 계산했으면 재사용)
+        churn_risk_score = self._fused_features.get('churn_risk_score')
+        if churn_risk_score is None:
+            churn_features = []
+            
+            # 최근 활동 여부 (비활동적일수록 위험)
+            if 'channel_activity_index' in columns:
+                activity_risk = _to_float_array(df['channel_activity_index']) / 10
+                np.clip(activity_risk, 0, 1, out=activity_risk)
+                np.subtract(1, activity_risk, out=activity_risk)
+                churn_features.append(activity_risk)
+            
+            # 성장률 (낮을수록 위험)
+            if 'avg_growth_rate' in columns:
+                growth_churn_risk = 0.5 - _to_float_array(df['avg_growth_rate']) / 2  # 중앙값 0.5
+                np.clip(growth_churn_risk, 0, 1, out=growth_churn_risk)
+                churn_features.append(growth_churn_risk)
+            
+            # 이탈 리스크 점수 계산 (가중 평균)
+            if churn_features:
+                churn_risk_score = _feature_mean(churn_features)
         
-        # 최근 활동 여부 (비활동적일수록 위험)
-        if 'channel_activity_index' in df.columns:
-            activity_risk = 1 - np.clip(df['channel_activity_index'] / 10, 0, 1)
-            churn_features.append(activity_risk)
-            
-        # 성장률 (낮을수록 위험)
-        if 'avg_growth_rate' in df.columns:
-            growth_churn_risk = 0.5 - df['avg_growth_rate'] / 2  # 중앙값 0.5
-            growth_churn_risk = np.clip(growth_churn_risk, 0, 1)
-            churn_features.append(growth_churn_risk)
-            
-        # 이탈 리스크 점수 계산 (가중 평균)
-        if churn_features:
-            result_df['churn_risk_score'] = sum(churn_features) / len(churn_features)
+        if churn_risk_score is not None:
+            result_df['churn_risk_score'] = churn_risk_score
             
             # 이탈 리스크 등급 부여
-            result_df['churn_risk_grade'] = pd.cut(
-                result_df['churn_risk_score'], 
-                bins=[0, 0.2, 0.4, 0.6, 0.8, 1.0],
-                labels=['A', 'B', 'C', 'D', 'F']
+            result_df['churn_risk_grade'] = pd.Categorical.from_codes(
+                _cut_codes(_to_float_array(result_df['churn_risk_score']), _RISK_GRADE_BINS),
+                dtype=_RISK_GRADE_DTYPE
             )
             
         return result_df
     
-    def generate_customer_segment_features(self, df: pd.DataFrame, n_clusters: int = 5) -> pd.DataFrame:
+    def generate_customer_segment_features(self, df: pd.DataFrame, n_clusters: int = 5,
+                                           refit: bool = False) -> pd.DataFrame:
         """
         고객 세그먼트 관련 특성 생성
         
+        학습된 K-means 모델이 있고 특성 구성과 클러스터 수가 같으면 다시 학습하지 않고 예측만 수행합니다.
+        
         Args:
-            df: 입력 데이터프레임
+            df: 입력 데이터프레임 (특성 컬럼이 직접 추가됨)
             n_clusters: 클러스터 수
+            refit: 학습된 모델이 있어도 다시 학습할지 여부
             
         Returns:
             pd.DataFrame: 특성이 추가된 데이터프레임
         """
-        result_df = df.copy()
+        result_df = df
+        columns = set(df.columns)  # 컬럼 존재 여부 확인용 (한 번만 생성)
         
         # 클러스터링에 사용할 특성 선택
         clustering_features = []
         
         # 금융 건강 점수
-        if 'financial_health_score' in df.columns:
+        if 'financial_health_score' in columns:
             clustering_features.append('financial_health_score')
             
         # 신용 리스크 점수
-        if 'credit_risk_score' in df.columns:
+        if 'credit_risk_score' in columns:
             clustering_features.append('credit_risk_score')
             
         # 이탈 리스크 점수
-        if 'churn_risk_score' in df.columns:
+        if 'churn_risk_score' in columns:
             clustering_features.append('churn_risk_score')
             
         # 채널 활동성 지수
-        if 'channel_activity_index' in df.columns:
+        if 'channel_activity_index' in columns:
             clustering_features.append('channel_activity_index')
             
         # 마케팅 노출 총계
-        if 'marketing_exposure_total' in df.columns:
+        if 'marketing_exposure_total' in columns:
             clustering_features.append('marketing_exposure_total')
             
         # 할부 선호도
-        if 'installment_preference' in df.columns:
+        if 'installment_preference' in columns:
             clustering_features.append('installment_preference')
             
         # 현금서비스 선호도
-        if 'cash_advance_preference' in df.columns:
+        if 'cash_advance_preference' in columns:
             clustering_features.append('cash_advance_preference')
             
         # VIP 점수
-        if 'vip_score' in df.columns:
+        if 'vip_score' in columns:
             clustering_features.append('vip_score')
             
         # 성장률 평균
-        if 'avg_growth_rate' in df.columns:
+        if 'avg_growth_rate' in columns:
             clustering_features.append('avg_growth_rate')
             
         # 클러스터링 수행
         if clustering_features:
-            # 클러스터링에 사용할 데이터 준비
-            cluster_data = df[clustering_features].copy()
-            
-            # 결측치 처리
-            cluster_data = cluster_data.fillna(cluster_data.mean())
-            
-            # K-means 클러스터링 수행
-            kmeans = KMeans(n_clusters=n_clusters, random_state=42)
-            result_df['customer_segment'] = kmeans.fit_predict(cluster_data)
-            
-            # 클러스터 모델 저장
-            self.cluster_models['customer_segment'] = kmeans
+            # 클러스터링에 사용할 데이터 준비 (float32 특성이 섞여도 K-means는 float64로 수행)
+            cluster_data = df[clustering_features].to_numpy(dtype=np.float64, na_value=np.nan)
+            
+            # 결측치 처리 (컬럼 평균으로 제자리 대체)
+            missing_rows, missing_cols = np.nonzero(np.isnan(cluster_data))
+            if missing_rows.size:
+                if not cluster_data.flags.writeable:
+                    # 원본 데이터프레임의 읽기 전용 뷰인 경우에만 복사
+                    cluster_data = cluster_data.copy()
+                cluster_data[missing_rows, missing_cols] = np.nanmean(cluster_data, axis=0)[missing_cols]
+            
+            # 학습된 모델 재사용 (특성 구성이나 클러스터 수가 바뀌면 다시 학습)
+            kmeans = self.cluster_models.get('customer_segment')
+            if (not refit and kmeans is not None and kmeans.n_clusters == n_clusters
+                    and self.cluster_features.get('customer_segment') == clustering_features):
+                result_df['customer_segment'] = kmeans.predict(cluster_data)
+            else:
+                # K-means 클러스터링 수행
+                kmeans = KMeans(n_clusters=n_clusters, random_state=42)
+                result_df['customer_segment'] = kmeans.fit_predict(cluster_data)
+                
+                # 클러스터 모델 저장
+                self.cluster_models['customer_segment'] = kmeans
+                self.cluster_features['customer_segment'] = clustering_features
             
         return result_df
     
@@ -330,57 +741,73 @@ class FinancialFeatureGenerator:
         Returns:
             pd.DataFrame: 선택된 특성만 포함된 데이터프레임
         """
-        # 특성 선택기 설정
         if method == 'f_classif':
+            # 모든 특성의 F 통계량을 한 번에 계산하고 상위 k개만 부분 정렬로 선택
+            X = df.to_numpy(dtype=np.float64)
+            feature_scores, p_values = _anova_f_scores(X, target)
+            n_selected = min(k, X.shape[1])
+            ranking_scores = np.nan_to_num(feature_scores, nan=-np.inf)
+            selected_indices = np.sort(np.argpartition(-ranking_scores, n_selected - 1)[:n_selected])
+            
+            # sklearn 선택기와 같은 형태로 학습 결과 보관 (transform/get_support 사용 가능)
             selector = SelectKBest(f_classif, k=k)
+            selector.scores_ = feature_scores
+            selector.pvalues_ = p_values
+            selector.n_features_in_ = X.shape[1]
+            selector.feature_names_in_ = np.asarray(df.columns, dtype=object)
         elif method == 'mutual_info':
             selector = SelectKBest(mutual_info_classif, k=k)
+            selector.fit(df, target)
+            selected_indices = selector.get_support(indices=True)
+            feature_scores = selector.scores_
         else:
             raise ValueError(f"지원되지 않는 특성 선택 방법: {method}")
-            
-        # 특성 선택 수행
-        X_new = selector.fit_transform(df, target)
-        
-        # 선택된 특성 인덱스
-        selected_indices = selector.get_support(indices=True)
         
         # 선택된 특성 이름
         selected_features = df.columns[selected_indices].tolist()
         
-        # 특성 중요도
-        feature_scores = selector.scores_
-        
-        # 특성 중요도 저장
+        # 특성 중요도 저장 (특성 이름을 인덱스로 하는 Series)
         self.feature_selectors[method] = {
             'selector': selector,
             'selected_features': selected_features,
-            'feature_scores': {df.columns[i]: feature_scores[i] for i in range(len(df.columns))}
+            'feature_scores': pd.Series(feature_scores, index=df.columns)
         }
         
         # 선택된 특성만 포함된 데이터프레임 반환
         return df[selected_features]
     
-    def apply_pca(self, df: pd.DataFrame, n_components: int = 10, name: str = 'default') -> pd.DataFrame:
+    def apply_pca(self, df: pd.DataFrame, n_components: int = 10, name: str = 'default',
+                  refit: bool = False) -> pd.DataFrame:
         """
         PCA 적용
         
+        같은 이름으로 학습된 PCA 모델이 있고 특성 구성과 주성분 수가 같으면 다시 학습하지 않고 변환만 수행합니다.
+        
         Args:
             df: 입력 데이터프레임
             n_components: 주성분 수
             name: PCA 모델 이름
+            refit: 학습된 모델이 있어도 다시 학습할지 여부
             
         Returns:
             pd.DataFrame: PCA 결과 데이터프레임
         """
-        # PCA 모델 설정
-        pca = PCA(n_components=n_components)
+        # 학습된 모델 재사용 (특성 구성이나 주성분 수가 바뀌면 다시 학습)
+        model_info = self.pca_models.get(name)
+        if (not refit and model_info is not None and model_info['pca'].n_components == n_components
+                and model_info['feature_names'] == df.columns.tolist()):
+            return self.transform_pca(df, name)
+        
+        # PCA 모델 설정 (solver는 sklearn 자동 선택, randomized가 선택될 때도 결과가 재현되도록 시드 고정)
+        pca = PCA(n_components=n_components, random_state=42)
         
-        # PCA 적용
-        pca_result = pca.fit_transform(df)
+        # PCA 적용 (연속된 float32 배열로 변환해 행렬 연산 처리량을 높임)
+        pca_result = pca.fit_transform(np.ascontiguousarray(df.to_numpy(dtype=np.float32)))
         
         # PCA 모델 저장
         self.pca_models[name] = {
             'pca': pca,
+            'feature_names': df.columns.tolist(),
             'explained_variance_ratio': pca.explained_variance_ratio_,
             'components': pca.components_
         }
@@ -393,6 +820,32 @@ class FinancialFeatureGenerator:
         
         return pca_df
     
+    def transform_pca(self, df: pd.DataFrame, name: str = 'default') -> pd.DataFrame:
+        """
+        학습된 PCA 모델로 변환 (추론용, 재학습 없음)
+        
+        Args:
+            df: 입력 데이터프레임 (학습 시와 같은 특성 컬럼 포함)
+            name: PCA 모델 이름
+            
+        Returns:
+            pd.DataFrame: PCA 결과 데이터프레임
+        """
+        if name not in self.pca_models:
+            raise ValueError(f"학습된 PCA 모델이 없습니다: {name}")
+        
+        model_info = self.pca_models[name]
+        pca = model_info['pca']
+        
+        # 학습 시와 같은 컬럼 순서로 변환
+        X = np.ascontiguousarray(df[model_info['feature_names']].to_numpy(dtype=np.float32))
+        pca_result = pca.transform(X)
+        
+        return pd.DataFrame(
+            pca_result,
+            columns=[f'PC{i+1}' for i in range(pca.n_components_)]
+        )
+    
     def generate_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         모든 특성 생성 파이프라인
@@ -403,16 +856,78 @@ class FinancialFeatureGenerator:
         Returns:
             pd.DataFrame: 특성이 추가된 데이터프레임
         """
-        # 1. 금융 건강 관련 특성 생성
-        df = self.generate_financial_health_features(df)
+        # 데이터 복사본 생성 (각 특성 생성 단계는 이 복사본에 컬럼을 직접 추가)
+        df = df.copy()
         
-        # 2. 행동 패턴 관련 특성 생성
-        df = self.generate_behavioral_features(df)
+        # 비율/점수 특성을 입력 컬럼 블록에서 한 번에 미리 계산 (각 단계에서 재사용)
+        self._fused_features = self._compute_fused_features(df)
         
-        # 3. 리스크 관련 특성 생성
-        df = self.generate_risk_features(df)
-        
-        # 4. 고객 세그먼트 관련 특성 생성
-        df = self.generate_customer_segment_features(df)
+        try:
+            # 1. 금융 건강 관련 특성 생성
+            df = self.generate_financial_health_features(df)
+            
+            # 2. 행동 패턴 관련 특성 생성
+            df = self.generate_behavioral_features(df)
+            
+            # 3. 리스크 관련 특성 생성
+            df = self.generate_risk_features(df)
+            
+            # 4. 고객 세그먼트 관련 특성 생성
+            df = self.generate_customer_segment_features(df)
+        finally:
+            # 미리 계산한 특성과 비율 캐시 해제
+            self._fused_features = {}
+            self._ratio_cache.clear()
+            self._ratio_cache_frame = None
         
         return df
+    
+    def _compute_fused_features(self, df: pd.DataFrame) -> Dict[Any, np.ndarray]:
+        """
+        비율/점수 특성을 한 번에 계산
+        
+        필요한 입력 컬럼을 한 번만 추출해 (컬럼 수, 행 수) float32 블록으로 모은 뒤 모든 단계의 특성을 함께 계산합니다.
+        행 수가 충분하고 numba가 있으면 커널을, 아니면 NumPy 배열 연산을 사용합니다.
+        
+        Args:
+            df: 입력 데이터프레임
+            
+        Returns:
+            Dict[Any, np.ndarray]: _FUSED_OUTPUT_KEYS별 읽기 전용 배열 (필요한 컬럼이 없으면 빈 딕셔너리)
+        """
+        if not _REQUIRED_COLUMNS['fused'] <= set(df.columns):
+            return {}
+        
+        inputs = np.vstack([_to_float_array(df[col]) for col in _FUSED_INPUT_COLUMNS])
+        if _fused_feature_kernel is not None and len(df) >= _NUMBA_MIN_ROWS and self._check_kernel_parity(inputs):
+            outputs = _fused_feature_kernel(inputs)
+        else:
+            outputs = _fused_feature_arrays(inputs)
+        outputs.flags.writeable = False
+        return dict(zip(_FUSED_OUTPUT_KEYS, outputs))
+    
+    def _check_kernel_parity(self, inputs: np.ndarray) -> bool:
+        """
+        numba 커널과 NumPy 경로의 결과가 같은 블록에서 비트 단위로 일치하는지 확인 (처음 한 번만 대조)
+        
+        데이터 크기에 따라 경로가 바뀌므로, 결과가 다르면 등급/수준 특성이 배치 크기에 따라 달라집니다.
+        불일치하면 경고 후 NumPy 경로만 사용합니다.
+        
+        Args:
+            inputs: (_FUSED_INPUT_COLUMNS 수, 행 수) float32 입력 블록
+            
+        Returns:
+            bool: 커널 사용 가능 여부
+        """
+        if self._kernel_parity is None:
+            sample = np.ascontiguousarray(inputs[:, :_NUMBA_PARITY_ROWS])
+            kernel_out = _fused_feature_kernel(sample)
+            array_out = _fused_feature_arrays(sample)
+            mismatched = [
+                key for key, kernel_values, array_values in zip(_FUSED_OUTPUT_KEYS, kernel_out, array_out)
+                if not np.array_equal(kernel_values, array_values, equal_nan=True)
+            ]
+            if mismatched:
+                logger.warning(f"numba 커널과 NumPy 경로의 결과가 다릅니다 ({mismatched}). NumPy 경로를 사용합니다.")
+            self._kernel_parity = not mismatched
+        return self._kernel_parity
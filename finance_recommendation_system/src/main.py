@@ -6,10 +6,14 @@
 
 import os
 import sys
+import json
+import hashlib
 import logging
 import pandas as pd
+import pyarrow as pa
 import argparse
 from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 
 # 로깅 설정
 logging.basicConfig(
@@ -23,12 +27,18 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # 모듈 임포트
-from data_processing.data_loader import FinancialDataLoader
+from data_processing.data_loader import FinancialDataLoader, FILE_CACHE_DIR
 from data_processing.data_preprocessor import FinancialDataPreprocessor
 from feature_engineering.feature_generator import FinancialFeatureGenerator
 from model_training.model_trainer import FinancialModelTrainer
 from recommendation_engine.recommender import FinancialRecommender
 
+# 파이프라인 결과 캐시에 영향을 주는 코드 모듈 (수정되면 캐시 무효화, 특성 선택은 학습기의 타겟 정의를 사용)
+_PIPELINE_MODULES = (FinancialDataLoader, FinancialDataPreprocessor, FinancialFeatureGenerator, FinancialModelTrainer)
+
+# 학습/특성 선택 대상 상품 유형
+_PRODUCT_TYPES = ['deposit', 'loan', 'fund']
+
 def setup_directories():
     """필요한 디렉토리 생성"""
     directories = ['data', 'models', 'logs']
@@ -36,10 +46,89 @@ def setup_directories():
         os.makedirs(directory, exist_ok=True)
         logger.info(f"디렉토리 생성: {directory}")
 
-def load_and_process_data(data_dir: str):
-    """데이터 로드 및 전처리"""
+def _pipeline_cache_path(data_dir: str, stage: str) -> Optional[str]:
+    """
+    파이프라인 단계 결과의 Parquet 캐시 경로
+    
+    데이터 디렉토리 파일과 파이프라인 코드의 경로, 수정 시각, 크기로 키를 만들어 입력이 바뀌면 다른 경로가 됩니다.
+    
+    Args:
+        data_dir: 데이터 디렉토리 경로
+        stage: 파이프라인 단계 이름 ('processed' 또는 'features')
+        
+    Returns:
+        Optional[str]: <data_dir>/.cache/<단계>_<해시>.parquet 경로 (데이터 파일이 없으면 None)
+    """
+    try:
+        data_files = sorted(entry.path for entry in os.scandir(data_dir) if entry.is_file())
+    except OSError:
+        return None
+    
+    # 데이터 파일이 없으면 샘플 데이터를 생성하므로 캐시하지 않음
+    if not data_files:
+        return None
+    
+    source_files = [sys.modules[cls.__module__].__file__ for cls in _PIPELINE_MODULES]
+    key = []
+    for path in data_files + source_files:
+        stat = os.stat(path)
+        key.append((os.path.abspath(path), stat.st_mtime_ns, stat.st_size))
+    
+    digest = hashlib.sha1(repr((stage, key)).encode()).hexdigest()
+    return os.path.join(data_dir, FILE_CACHE_DIR, f"{stage}_{digest}.parquet")
+
+def _read_cached_frame(cache_path: Optional[str]) -> Optional[pd.DataFrame]:
+    """Parquet 캐시 로드 (캐시가 없거나 읽을 수 없으면 None)"""
+    if cache_path is None or not os.path.exists(cache_path):
+        return None
+    
+    try:
+        df = pd.read_parquet(cache_path, engine='pyarrow')
+    except Exception as e:
+        logger.warning(f"Parquet 캐시 로드 중 오류 발생: {cache_path}, {str(e)}")
+        return None
+    
+    logger.info(f"캐시에서 로드: {cache_path}, {df.shape[0]} 행, {df.shape[1]} 열")
+    return df
+
+def _write_cached_frame(df: pd.DataFrame, cache_path: Optional[str]) -> None:
+    """Parquet 캐시 저장 (실패해도 파이프라인은 계속 진행)"""
+    if cache_path is None:
+        return
+    
+    # pyarrow dictionary 컬럼은 pandas가 Parquet 메타데이터에서 dtype을 복원하지 못하므로 category 타입으로 저장
+    dictionary_cols = [
+        col for col, dtype in df.dtypes.items()
+        if isinstance(dtype, pd.ArrowDtype) and pa.types.is_dictionary(dtype.pyarrow_dtype)
+    ]
+    if dictionary_cols:
+        df = df.assign(**{col: pd.Categorical(df[col].astype(object)) for col in dictionary_cols})
+    
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        df.to_parquet(cache_path, engine='pyarrow', compression='zstd')
+    except Exception as e:
+        logger.warning(f"Parquet 캐시 저장 중 오류 발생: {cache_path}, {str(e)}")
+
+def load_and_process_data(data_dir: str, use_cache: bool = True) -> Tuple[pd.DataFrame, Dict[str, pd.Index]]:
+    """
+    데이터 로드 및 전처리 (use_cache가 True이면 같은 입력의 이전 결과를 Parquet 캐시에서 로드)
+    
+    Returns:
+        Tuple[pd.DataFrame, Dict[str, pd.Index]]: 전처리된 데이터프레임, 범주형 컬럼별 인코더 범주 목록
+    """
     logger.info("데이터 로드 및 전처리 시작")
     
+    cache_path = _pipeline_cache_path(data_dir, 'processed') if use_cache else None
+    df = _read_cached_frame(cache_path)
+    if df is not None:
+        # 라벨 인코딩 범주는 캐시 옆 전처리기 파일에 저장
+        preprocessor_path = os.path.splitext(cache_path)[0] + '.joblib'
+        preprocessor = FinancialDataPreprocessor.load(preprocessor_path) if os.path.exists(preprocessor_path) else None
+        if preprocessor is not None:
+            return df, preprocessor.encoders
+        logger.warning(f"전처리기 캐시를 읽을 수 없어 데이터를 다시 전처리합니다: {cache_path}")
+    
     # 데이터 로더 초기화
     data_loader = FinancialDataLoader(data_dir=data_dir)
     
@@ -48,18 +137,24 @@ def load_and_process_data(data_dir: str):
     logger.info(f"데이터 로드 완료: {df.shape[0]} 행, {df.shape[1]} 열")
     
     # 데이터 전처리
-    preprocessor = FinancialDataPreprocessor()
+    # 학습 모델이 모두 트리 기반이므로 스케일링 생략
+    preprocessor = FinancialDataPreprocessor(for_tree_model=True)
     df = preprocessor.preprocess_data(df)
     logger.info(f"데이터 전처리 완료: {df.shape[0]} 행, {df.shape[1]} 열")
     
-    return df
+    _write_cached_frame(df, cache_path)
+    if cache_path is not None:
+        preprocessor.save(os.path.splitext(cache_path)[0] + '.joblib')
+    
+    return df, preprocessor.encoders
 
-def generate_features(df: pd.DataFrame):
-    """특성 생성"""
+def generate_features(df: pd.DataFrame, category_encoders: Optional[Dict[str, pd.Index]] = None,
+                      model_dir: str = 'models'):
+    """특성 생성 (category_encoders는 라벨 인코딩된 범주형 코드를 원본 값으로 되돌릴 때 사용)"""
     logger.info("특성 생성 시작")
     
     # 특성 생성기 초기화
-    feature_generator = FinancialFeatureGenerator()
+    feature_generator = FinancialFeatureGenerator(category_encoders=category_encoders)
     
     # 금융 건강 특성 생성
     df = feature_generator.generate_financial_health_features(df)
@@ -68,16 +163,61 @@ def generate_features(df: pd.DataFrame):
     df = feature_generator.generate_behavioral_features(df)
     
     # 고객 세그먼트 생성
-    df = feature_generator.generate_customer_segments(df)
+    df = feature_generator.generate_customer_segment_features(df)
     
-    # 특성 선택
-    selected_features = feature_generator.select_features(df)
+    # 특성 선택 (상품 유형별 타겟으로 선택한 수치형 특성의 합집합, 모델 학습과 같은 타겟 사용)
+    model_trainer = FinancialModelTrainer(model_dir=model_dir)
+    candidates = df.select_dtypes('number').fillna(0)
+    selected_features = []
+    for product_type in _PRODUCT_TYPES:
+        target = model_trainer.create_target_variable(df, product_type=product_type)
+        selected = feature_generator.select_features(candidates, target).columns
+        selected_features.extend(col for col in selected if col not in selected_features)
     
     logger.info(f"특성 생성 완료: {df.shape[0]} 행, {df.shape[1]} 열")
     logger.info(f"선택된 특성: {len(selected_features)} 개")
     
     return df, selected_features
 
+def prepare_features(data_dir: str, use_cache: bool = True,
+                     model_dir: str = 'models') -> Tuple[pd.DataFrame, List[str]]:
+    """
+    데이터 로드, 전처리, 특성 생성 (use_cache가 True이면 같은 입력의 이전 특성 결과를 캐시에서 로드)
+    
+    Args:
+        data_dir: 데이터 디렉토리 경로
+        use_cache: Parquet 캐시 사용 여부
+        model_dir: 모델 디렉토리 경로 (특성 선택용 타겟 생성에 사용하는 학습기)
+        
+    Returns:
+        Tuple[pd.DataFrame, List[str]]: 특성 데이터프레임, 선택된 특성 목록
+    """
+    cache_path = _pipeline_cache_path(data_dir, 'features') if use_cache else None
+    df = _read_cached_frame(cache_path)
+    if df is not None:
+        # 선택된 특성 목록은 캐시 옆 JSON 파일에 저장
+        try:
+            with open(os.path.splitext(cache_path)[0] + '.json', encoding='utf-8') as f:
+                return df, json.load(f)
+        except (OSError, ValueError):
+            logger.warning(f"선택 특성 캐시를 읽을 수 없어 특성을 다시 생성합니다: {cache_path}")
+    
+    # 데이터 로드 및 전처리
+    df, category_encoders = load_and_process_data(data_dir, use_cache=use_cache)
+    
+    # 특성 생성
+    df, selected_features = generate_features(df, category_encoders, model_dir)
+    
+    if cache_path is not None:
+        _write_cached_frame(df, cache_path)
+        try:
+            with open(os.path.splitext(cache_path)[0] + '.json', 'w', encoding='utf-8') as f:
+                json.dump(list(selected_features), f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning(f"선택 특성 캐시 저장 중 오류 발생: {cache_path}, {str(e)}")
+    
+    return df, selected_features
+
 def train_models(df: pd.DataFrame, selected_features: list, model_dir: str):
     """모델 학습"""
     logger.info("모델 학습 시작")
@@ -86,10 +226,9 @@ def train_models(df: pd.DataFrame, selected_features: list, model_dir: str):
     model_trainer = FinancialModelTrainer(model_dir=model_dir)
     
     # 상품 유형별 모델 학습
-    product_types = ['deposit', 'loan', 'fund']
     model_types = ['lightgbm', 'random_forest']
     
-    for product_type in product_types:
+    for product_type in _PRODUCT_TYPES:
         logger.info(f"{product_type} 상품 모델 학습 시작")
         
         # 타겟 변수 생성
@@ -132,33 +271,37 @@ def test_recommendation(df: pd.DataFrame, model_dir: str, product_db_path: str):
     product_types = ['deposit', 'loan', 'fund']
     model_type = 'lightgbm'  # 기본 모델 유형
     
+    # 모델 로드
+    loaded_types = []
     for product_type in product_types:
-        logger.info(f"{product_type} 상품 추천 테스트")
-        
-        # 모델 로드
         if recommender.load_model(product_type, model_type):
-            # 추천 수행
-            recommendations = recommender.recommend_products(
-                customer_data=test_customers,
-                product_type=product_type,
-                model_type=model_type,
-                top_n=3
-            )
-            
-            # 추천 결과 출력
-            if recommendations:
-                logger.info(f"{len(recommendations)} 개의 추천 결과 생성")
-                for i, rec in enumerate(recommendations[:3]):  # 처음 3개만 출력
-                    logger.info(f"추천 {i+1}:")
-                    logger.info(f"  - 고객 ID: {rec['customer_id']}")
-                    logger.info(f"  - 상품명: {rec['product_name']}")
-                    logger.info(f"  - 점수: {rec['score']:.4f}")
-                    logger.info(f"  - 이유: {rec['reasons'][0]}")
-            else:
-                logger.warning(f"{product_type} 상품 추천 결과가 없습니다.")
+            loaded_types.append(product_type)
         else:
             logger.warning(f"{product_type} {model_type} 모델을 로드할 수 없습니다.")
     
+    # 추천 수행 (같은 고객 배치의 특성 행렬을 한 번만 변환해 모든 상품 유형에 재사용)
+    all_recommendations = recommender.recommend_all(
+        customer_data=test_customers,
+        product_types=tuple(loaded_types),
+        model_type=model_type,
+        top_n=3
+    )
+    
+    for product_type, recommendations in all_recommendations.items():
+        logger.info(f"{product_type} 상품 추천 테스트")
+        
+        # 추천 결과 출력
+        if recommendations:
+            logger.info(f"{len(recommendations)} 개의 추천 결과 생성")
+            for i, rec in enumerate(recommendations[:3]):  # 처음 3개만 출력
+                logger.info(f"추천 {i+1}:")
+                logger.info(f"  - 고객 ID: {rec['customer_id']}")
+                logger.info(f"  - 상품명: {rec['product_name']}")
+                logger.info(f"  - 점수: {rec['score']:.4f}")
+                logger.info(f"  - 이유: {rec['reasons'][0]}")
+        else:
+            logger.warning(f"{product_type} 상품 추천 결과가 없습니다.")
+    
     logger.info("추천 엔진 테스트 완료")
 
 def run_api_server():
@@ -184,6 +327,7 @@ def main():
     parser.add_argument('--model_dir', type=str, default='models', help='모델 저장 디렉토리 경로')
     parser.add_argument('--product_db', type=str, default='data/financial_products.csv', help='금융 상품 데이터베이스 경로')
     parser.add_argument('--mode', type=str, choices=['train', 'recommend', 'api'], default='train', help='실행 모드')
+    parser.add_argument('--no_cache', action='store_true', help='전처리/특성 생성 결과 캐시를 사용하지 않음')
     
     args = parser.parse_args()
     
@@ -192,11 +336,8 @@ def main():
         setup_directories()
         
         if args.mode == 'train':
-            # 데이터 로드 및 전처리
-            df = load_and_process_data(args.data_dir)
-            
-            # 특성 생성
-            df, selected_features = generate_features(df)
+            # 데이터 로드, 전처리, 특성 생성 (입력이 같으면 캐시 재사용)
+            df, selected_features = prepare_features(args.data_dir, use_cache=not args.no_cache, model_dir=args.model_dir)
             
             # 모델 학습
             train_models(df, selected_features, args.model_dir)
@@ -207,11 +348,8 @@ def main():
             logger.info("모델 학습 및 테스트 완료")
             
         elif args.mode == 'recommend':
-            # 데이터 로드 및 전처리
-            df = load_and_process_data(args.data_dir)
-            
-            # 특성 생성
-            df, selected_features = generate_features(df)
+            # 데이터 로드, 전처리, 특성 생성 (입력이 같으면 캐시 재사용)
+            df, selected_features = prepare_features(args.data_dir, use_cache=not args.no_cache, model_dir=args.model_dir)
             
             # 추천 엔진 테스트
             test_recommendation(df, args.model_dir, args.product_db)
@@ -9,34 +9,471 @@ import numpy as np
 from typing import Dict, List, Any, Optional, Tuple, Union
 import logging
 import os
+import json
+import pickle
 import joblib
+from joblib import Parallel, delayed
+import weakref
+import inspect
+from functools import lru_cache
 from datetime import datetime
-from sklearn.model_selection import train_test_split, GridSearchCV, RandomizedSearchCV
-from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, roc_auc_score
+from sklearn.model_selection import StratifiedShuffleSplit, GridSearchCV, RandomizedSearchCV, ParameterSampler, check_cv
+from sklearn.metrics import get_scorer
+from sklearn.base import clone
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
 from sklearn.linear_model import LogisticRegression
 import xgboost as xgb
 import lightgbm as lgb
 import shap
+from scipy.stats import rankdata
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+try:
+    import optuna
+except ImportError:
+    optuna = None
+
+try:
+    import lz4
+except ImportError:
+    lz4 = None
+
+try:
+    import treelite
+    import tl2cgen
+except ImportError:
+    treelite = None
+    tl2cgen = None
 
 logger = logging.getLogger(__name__)
 
+# GPU 학습을 사용할 최소 학습 행 수 (작은 데이터는 호스트-디바이스 복사 비용 때문에 CPU가 더 빠름)
+_GPU_MIN_ROWS = 200_000
+
+# GPU 학습을 지원하는 모델 유형
+_GPU_MODEL_TYPES = frozenset({'lightgbm', 'xgboost'})
+
+# 조기 종료를 적용하는 모델 유형, 검증 데이터 비율, 개선이 없을 때 기다리는 라운드 수
+_EARLY_STOPPING_MODEL_TYPES = frozenset({'lightgbm', 'xgboost'})
+_EARLY_STOPPING_VALID_SIZE = 0.1
+_EARLY_STOPPING_ROUNDS = 50
+
+# LightGBM 4.6+는 eval_set 대신 eval_X/eval_y 인자 사용 (이전 버전은 eval_set만 지원)
+_LGBM_EVAL_XY = 'eval_X' in inspect.signature(lgb.LGBMClassifier.fit).parameters
+
+# 스레드 수(n_jobs)를 지정할 수 있는 모델 유형 (병렬 학습 시 프로세스당 스레드 수 제한)
+_THREADED_MODEL_TYPES = frozenset({'lightgbm', 'xgboost', 'random_forest'})
+
+# numba 커널을 사용할 최소 행 수 (작은 데이터는 NumPy 경로가 더 빠름)
+_NUMBA_MIN_ROWS = 50_000
+
+# numexpr로 계산할 최소 행 수와 타겟 조건식 (식 문자열이 같으면 numexpr가 컴파일 결과를 재사용)
+# 단일 코어에서는 numexpr가 NumPy/numba 경로보다 느리므로 멀티 코어에서만 사용
+_NUMEXPR_MIN_ROWS = 50_000
+_USE_NUMEXPR = ne is not None and ne.detect_number_of_cores() > 1
+_RATIO_GREATER_EXPR = 'where(den != 0, num / den, num) > threshold'
+_RATIO_LESS_EXPR = 'where(den != 0, num / den, num) < threshold'
+_BOTH_GREATER_EXPR = '(a > a_threshold) & (b > b_threshold)'
+
+# LightGBM 기본 파라미터 (_get_model과 튜닝용 lgb.cv가 공유)
+_LGBM_DEFAULT_PARAMS = {
+    'objective': 'binary',
+    'metric': 'auc',
+    'boosting_type': 'gbdt',
+    'num_leaves': 31,
+    'learning_rate': 0.05,
+    'feature_fraction': 0.9,
+    'bagging_fraction': 0.8,
+    'bagging_freq': 5,
+    # 특성 구간 수를 줄여 히스토그램 크기와 메모리 대역폭 사용량 감소 (AUC 손실은 미미)
+    'max_bin': 15,
+    'min_data_in_bin': 3,
+    'verbose': -1
+}
+
+# 트리 모델 SHAP 계산 옵션 (모델 해석용이므로 정확한 경로 알고리즘 대신 근사 계산 사용)
+_TREE_SHAP_OPTIONS = {'approximate': True, 'check_additivity': False}
+
+# 모델 파일 압축 설정 (lz4가 있으면 빠른 lz4 압축, 없으면 압축하지 않음, SHAP 파일은 메모리 매핑을 위해 비압축)
+_MODEL_COMPRESS = ('lz4', 3) if lz4 is not None else 0
+
+# 네이티브 부스터 파일 확장자 (LightGBM 텍스트, XGBoost JSON)
+_LGBM_BOOSTER_SUFFIX = '.lgb.txt'
+_XGB_BOOSTER_SUFFIX = '.xgb.json'
+
+# Treelite로 컴파일한 예측 공유 라이브러리 파일 접미사 (네이티브 부스터 파일 옆에 저장)
+_COMPILED_MODEL_SUFFIX = '.so'
+
+# 프로세스 내 모델 파일 로드 캐시 크기
+_MODEL_CACHE_SIZE = 16
+
+# 모델 요약 JSON에 저장할 항목 (모델 객체 없이 지표/중요도만 필요할 때 pickle 로드 생략)
+_MODEL_SUMMARY_KEYS = ('model_type', 'product_type', 'feature_names', 'metrics', 'feature_importances', 'training_date')
+
+# SHAP 계산 샘플 수 (GPU는 고정 비용이 커서 더 큰 샘플에서 행당 비용이 낮아짐)
+_SHAP_SAMPLE_SIZE = 100
+_GPU_SHAP_SAMPLE_SIZE = 5000
+
+# LightGBM Dataset 구간화에 영향을 주는 파라미터 (값이 같으면 구간화된 Dataset 재사용)
+_LGBM_DATASET_PARAMS = ('max_bin', 'min_data_in_bin')
+
+def _column_values(df: pd.DataFrame, column: str) -> np.ndarray:
+    """컬럼을 결측치가 NaN인 float64 배열로 변환 (NaN 비교 결과는 False)"""
+    return df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+
+def _ratio_or_numerator(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """분모가 0인 행은 1로 나눈 것처럼 분자 값을 사용하는 비율"""
+    return np.divide(numerator, denominator, out=numerator.copy(), where=denominator != 0)
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _ratio_threshold_kernel(numerator, denominator, threshold, greater):
+        """비율 계산과 임계값 비교를 행 단위 한 번의 루프로 수행 (NaN 비교는 0)"""
+        n_rows = numerator.shape[0]
+        out = np.empty(n_rows, dtype=np.int8)
+        for i in prange(n_rows):
+            den = denominator[i]
+            ratio = numerator[i] / den if den != 0 else numerator[i]
+            hit = ratio > threshold if greater else ratio < threshold
+            out[i] = 1 if hit else 0
+        return out
+else:
+    _ratio_threshold_kernel = None
+
+def _ratio_threshold(numerator: np.ndarray, denominator: np.ndarray, threshold: float, greater: bool) -> np.ndarray:
+    """
+    분모가 0이면 분자 값을 쓰는 비율을 임계값과 비교 (대용량 데이터는 numba 커널, 없으면 numexpr 사용)
+    
+    Args:
+        numerator: 분자 배열 (float64)
+        denominator: 분모 배열 (float64)
+        threshold: 임계값
+        greater: True이면 비율 > 임계값, False이면 비율 < 임계값
+        
+    Returns:
+        np.ndarray: 0/1 배열
+    """
+    if _ratio_threshold_kernel is not None and numerator.shape[0] >= _NUMBA_MIN_ROWS:
+        return _ratio_threshold_kernel(numerator, denominator, float(threshold), greater)
+    
+    if _USE_NUMEXPR and numerator.shape[0] >= _NUMEXPR_MIN_ROWS:
+        return ne.evaluate(
+            _RATIO_GREATER_EXPR if greater else _RATIO_LESS_EXPR,
+            local_dict={'num': numerator, 'den': denominator, 'threshold': float(threshold)}
+        )
+    
+    ratio = _ratio_or_numerator(numerator, denominator)
+    return ratio > threshold if greater else ratio < threshold
+
+def _both_greater(a: np.ndarray, a_threshold: float, b: np.ndarray, b_threshold: float) -> np.ndarray:
+    """
+    두 컬럼이 각각 임계값보다 큰지 동시에 비교 (대용량 데이터는 numexpr로 한 번에 계산)
+    
+    Args:
+        a: 첫 번째 컬럼 배열 (float64)
+        a_threshold: 첫 번째 임계값
+        b: 두 번째 컬럼 배열 (float64)
+        b_threshold: 두 번째 임계값
+        
+    Returns:
+        np.ndarray: bool 배열
+    """
+    if _USE_NUMEXPR and a.shape[0] >= _NUMEXPR_MIN_ROWS:
+        return ne.evaluate(
+            _BOTH_GREATER_EXPR,
+            local_dict={'a': a, 'a_threshold': float(a_threshold), 'b': b, 'b_threshold': float(b_threshold)}
+        )
+    
+    return (a > a_threshold) & (b > b_threshold)
+
+class NativeBoosterModel:
+    """네이티브 형식으로 저장된 LightGBM/XGBoost 부스터를 scikit-learn 분류기처럼 사용하는 예측 어댑터"""
+    
+    def __init__(self, booster: Union[lgb.Booster, xgb.Booster]):
+        """
+        예측 어댑터 초기화
+        
+        Args:
+            booster: 이진 분류 LightGBM/XGBoost 부스터
+        """
+        self.booster = booster
+        self.classes_ = np.array([0, 1])
+    
+    @classmethod
+    def load(cls, path: str) -> 'NativeBoosterModel':
+        """
+        네이티브 부스터 파일 로드 (LightGBM은 .txt, XGBoost는 .json)
+        
+        Args:
+            path: 부스터 파일 경로
+            
+        Returns:
+            NativeBoosterModel: 예측 어댑터
+        """
+        if path.endswith(_LGBM_BOOSTER_SUFFIX):
+            return cls(lgb.Booster(model_file=path))
+        
+        booster = xgb.Booster()
+        booster.load_model(path)
+        return cls(booster)
+    
+    def predict_proba(self, X: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        """
+        클래스별 확률 예측
+        
+        Args:
+            X: 특성 데이터
+            
+        Returns:
+            np.ndarray: (n, 2) 확률 배열
+        """
+        if isinstance(self.booster, lgb.Booster):
+            prob = self.booster.predict(X)
+        else:
+            prob = self.booster.inplace_predict(X)
+        
+        prob = np.asarray(prob, dtype=np.float64)
+        return np.column_stack([1.0 - prob, prob])
+    
+    def predict(self, X: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        """
+        클래스 예측 (양성 확률 0.5 초과이면 1)
+        
+        Args:
+            X: 특성 데이터
+            
+        Returns:
+            np.ndarray: 0/1 예측 배열
+        """
+        return (self.predict_proba(X)[:, 1] > 0.5).astype(np.int64)
+
+class CompiledBoosterModel:
+    """Treelite로 컴파일한 LightGBM/XGBoost 예측 라이브러리를 scikit-learn 분류기처럼 사용하는 예측 어댑터"""
+    
+    def __init__(self, libpath: str):
+        """
+        예측 어댑터 초기화
+        
+        Args:
+            libpath: 컴파일된 공유 라이브러리 경로
+        """
+        self.predictor = tl2cgen.Predictor(libpath, nthread=os.cpu_count())
+        self.classes_ = np.array([0, 1])
+    
+    def predict_proba(self, X: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        """
+        클래스별 확률 예측
+        
+        Args:
+            X: 특성 데이터 (학습 시 특성 순서)
+            
+        Returns:
+            np.ndarray: (n, 2) 확률 배열
+        """
+        dmat = tl2cgen.DMatrix(np.asarray(X, dtype=self.predictor.threshold_type))
+        prob = self.predictor.predict(dmat).reshape(-1).astype(np.float64)
+        return np.column_stack([1.0 - prob, prob])
+    
+    def predict(self, X: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        """
+        클래스 예측 (양성 확률 0.5 초과이면 1)
+        
+        Args:
+            X: 특성 데이터 (학습 시 특성 순서)
+            
+        Returns:
+            np.ndarray: 0/1 예측 배열
+        """
+        return (self.predict_proba(X)[:, 1] > 0.5).astype(np.int64)
+
+@lru_cache(maxsize=_MODEL_CACHE_SIZE)
+def _load_model_file(model_dir: str, model_key: str, mtime_ns: int, compiled_mtime_ns: int) -> Dict[str, Any]:
+    """
+    모델 파일 로드 (파일 수정 시각이 키에 포함되어 다시 저장/컴파일된 모델은 새로 로드)
+    
+    Args:
+        model_dir: 모델 디렉토리
+        model_key: 모델 키
+        mtime_ns: 모델 파일 수정 시각 (ns)
+        compiled_mtime_ns: 컴파일된 예측 라이브러리 수정 시각 (ns, 없으면 0)
+        
+    Returns:
+        Dict[str, Any]: 모델 정보
+    """
+    # 비압축 모델 파일은 큰 배열(트리 노드, 계수 등)을 메모리 매핑으로 필요할 때만 읽음
+    mmap_mode = 'r' if _MODEL_COMPRESS == 0 else None
+    model_info = joblib.load(os.path.join(model_dir, f"{model_key}.joblib"), mmap_mode=mmap_mode)
+    
+    # 네이티브 형식으로 저장된 부스터 복원 (컴파일된 예측 라이브러리가 있으면 우선 사용)
+    if 'booster_path' in model_info:
+        if compiled_mtime_ns and tl2cgen is not None:
+            model_info['model'] = CompiledBoosterModel(os.path.join(model_dir, f"{model_key}{_COMPILED_MODEL_SUFFIX}"))
+        else:
+            model_info['model'] = NativeBoosterModel.load(os.path.join(model_dir, model_info['booster_path']))
+    
+    # SHAP 값 로드 (배열은 메모리 매핑으로 필요할 때만 읽음)
+    if isinstance(model_info.get('shap_values'), str):
+        shap_path = os.path.join(model_dir, model_info['shap_values'])
+        if os.path.exists(shap_path):
+            model_info['shap_values'] = joblib.load(shap_path, mmap_mode='r')
+        else:
+            model_info['shap_values'] = None
+    
+    return model_info
+
+def load_model_info(model_dir: str, model_key: str) -> Dict[str, Any]:
+    """
+    저장된 모델 정보 로드 (학습기와 추천 엔진이 공유, 같은 파일은 프로세스 내 캐시에서 재사용)
+    
+    Args:
+        model_dir: 모델 디렉토리
+        model_key: 모델 키
+        
+    Returns:
+        Dict[str, Any]: 모델 정보 (LightGBM/XGBoost 모델은 CompiledBoosterModel 또는 NativeBoosterModel)
+    """
+    model_path = os.path.join(model_dir, f"{model_key}.joblib")
+    compiled_path = os.path.join(model_dir, f"{model_key}{_COMPILED_MODEL_SUFFIX}")
+    compiled_mtime_ns = os.stat(compiled_path).st_mtime_ns if os.path.exists(compiled_path) else 0
+    return _load_model_file(model_dir, model_key, os.stat(model_path).st_mtime_ns, compiled_mtime_ns)
+
+def _roc_auc(y_true: np.ndarray, y_score: np.ndarray) -> float:
+    """
+    Mann-Whitney 순위합으로 ROC AUC 계산 (동점은 평균 순위, roc_auc_score와 같은 값)
+    
+    Args:
+        y_true: 0/1 실제 값
+        y_score: 양성 클래스 점수
+        
+    Returns:
+        float: ROC AUC
+    """
+    positive = y_true == 1
+    n_pos = int(np.count_nonzero(positive))
+    n_neg = y_true.size - n_pos
+    if n_pos == 0 or n_neg == 0:
+        raise ValueError("Only one class present in y_true. ROC AUC score is not defined in that case.")
+    
+    ranks = rankdata(y_score)
+    return float((ranks[positive].sum() - n_pos * (n_pos + 1) / 2) / (n_pos * n_neg))
+
+def _train_model_task(
+    model_dir: str,
+    use_gpu: bool,
+    X: pd.DataFrame,
+    y: pd.Series,
+    model_type: str,
+    product_type: str,
+    n_threads: int,
+    hyperparams: Optional[Dict[str, Any]] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    병렬 학습 작업 단위 (작업 프로세스에서 새 학습기로 모델 하나를 학습하고 저장)
+    
+    Args:
+        model_dir: 모델 저장 디렉토리
+        use_gpu: GPU 학습 여부
+        X: 특성 데이터프레임
+        y: 타겟 변수
+        model_type: 모델 유형
+        product_type: 상품 유형
+        n_threads: 모델이 사용할 스레드 수
+        hyperparams: 하이퍼파라미터 (튜닝된 최적 파라미터 재학습 시 사용)
+        
+    Returns:
+        Optional[Dict[str, Any]]: 학습 결과 정보 (실패 시 None)
+    """
+    hyperparams = dict(hyperparams or {})
+    if model_type in _THREADED_MODEL_TYPES:
+        hyperparams['n_jobs'] = n_threads
+    
+    try:
+        trainer = FinancialModelTrainer(model_dir=model_dir, use_gpu=use_gpu)
+        return trainer.train_model(
+            X, y, model_type=model_type, product_type=product_type, hyperparams=hyperparams or None
+        )
+    except Exception as e:
+        logger.error(f"{product_type} {model_type} 모델 학습 중 오류 발생: {str(e)}")
+        return None
+
+def _tune_model_task(
+    model_dir: str,
+    use_gpu: bool,
+    X: pd.DataFrame,
+    y: pd.Series,
+    model_type: str,
+    product_type: str,
+    cv: int,
+    n_iter: int,
+    n_threads: int
+) -> Optional[Dict[str, Any]]:
+    """
+    병렬 튜닝 작업 단위 (작업 프로세스에서 하이퍼파라미터를 튜닝하고 최적 파라미터로 재학습 후 저장)
+    
+    작업마다 새 학습기를 쓰므로 구간화 Dataset 캐시를 공유하지 않습니다 (LightGBM 외 모델 유형에만 사용).
+    
+    Args:
+        model_dir: 모델 저장 디렉토리
+        use_gpu: GPU 학습 여부
+        X: 특성 데이터프레임
+        y: 타겟 변수
+        model_type: 모델 유형
+        product_type: 상품 유형
+        cv: 교차 검증 폴드 수
+        n_iter: 튜닝 시도 횟수
+        n_threads: 재학습 모델이 사용할 스레드 수
+        
+    Returns:
+        Optional[Dict[str, Any]]: 튜닝 결과와 재학습 모델 정보 (실패 시 None)
+    """
+    try:
+        trainer = FinancialModelTrainer(model_dir=model_dir, use_gpu=use_gpu)
+        tuning_result = trainer.tune_hyperparameters(X, y, model_type=model_type, cv=cv, n_iter=n_iter)
+        
+        hyperparams = dict(tuning_result['best_params'])
+        if model_type in _THREADED_MODEL_TYPES:
+            hyperparams['n_jobs'] = n_threads
+        model_info = trainer.train_model(X, y, model_type=model_type, product_type=product_type, hyperparams=hyperparams)
+        
+        return {'tuning_result': tuning_result, 'model_info': model_info}
+    except Exception as e:
+        logger.error(f"{product_type} {model_type} 하이퍼파라미터 튜닝 중 오류 발생: {str(e)}")
+        return None
+
 class FinancialModelTrainer:
     """금융 추천 모델 학습 클래스"""
     
-    def __init__(self, model_dir: str = "models"):
+    def __init__(self, model_dir: str = "models", use_gpu: bool = False):
         """
         금융 추천 모델 학습기 초기화
         
         Args:
             model_dir: 모델 저장 디렉토리
+            use_gpu: LightGBM/XGBoost 모델을 GPU(CUDA)로 학습할지 여부 (학습 데이터가 충분히 클 때만 적용)
         """
         self.model_dir = model_dir
+        self.use_gpu = use_gpu
         self.models = {}
         self.feature_importances = {}
         self.model_metrics = {}
         self.shap_values = {}
         
+        # 튜닝용 구간화 LightGBM Dataset 캐시 (같은 특성 데이터프레임이면 재사용, 구간화 파라미터 -> Dataset)
+        self._lgb_dataset_cache: Dict[Tuple[Any, ...], lgb.Dataset] = {}
+        self._lgb_dataset_frame: Optional[weakref.ref] = None
+        
+        # 층화 분할 인덱스 캐시 ((타겟 해시, 행 수, 테스트 비율, 랜덤 시드) -> (학습 인덱스, 테스트 인덱스))
+        self._split_cache: Dict[Tuple[int, int, float, int], Tuple[np.ndarray, np.ndarray]] = {}
+        
         # 모델 저장 디렉토리 생성
         os.makedirs(self.model_dir, exist_ok=True)
     
@@ -48,7 +485,8 @@ class FinancialModelTrainer:
         product_type: str = 'deposit',
         test_size: float = 0.2,
         random_state: int = 42,
-        hyperparams: Optional[Dict[str, Any]] = None
+        hyperparams: Optional[Dict[str, Any]] = None,
+        use_gpu: Optional[bool] = None
     ) -> Dict[str, Any]:
         """
         모델 학습
@@ -61,38 +499,65 @@ class FinancialModelTrainer:
             test_size: 테스트 데이터 비율
             random_state: 랜덤 시드
             hyperparams: 하이퍼파라미터 (None인 경우 기본값 사용)
+            use_gpu: GPU 학습 여부 (None이면 초기화 시 설정 사용)
             
         Returns:
             Dict[str, Any]: 학습 결과 정보
         """
-        # 학습/테스트 데이터 분할
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=test_size, random_state=random_state, stratify=y
-        )
+        # 연속 float32 배열로 한 번만 변환해 학습/예측에서 재사용 (모델별 DataFrame 변환 생략)
+        feature_names = X.columns.tolist()
+        Xv = np.ascontiguousarray(X.to_numpy(dtype=np.float32))
+        yv = y.to_numpy()
+        
+        # 학습/테스트 데이터 분할 (같은 타겟이면 층화 분할 인덱스 재사용)
+        train_idx, test_idx = self._stratified_split(yv, test_size, random_state)
+        X_train, X_test, y_train, y_test = Xv[train_idx], Xv[test_idx], yv[train_idx], yv[test_idx]
+        
+        # 부스팅 모델은 학습 데이터 일부를 검증용으로 떼어 조기 종료에 사용
+        eval_set = None
+        if model_type in _EARLY_STOPPING_MODEL_TYPES:
+            fit_idx, valid_idx = self._stratified_split(y_train, _EARLY_STOPPING_VALID_SIZE, random_state)
+            X_train, X_valid, y_train, y_valid = X_train[fit_idx], X_train[valid_idx], y_train[fit_idx], y_train[valid_idx]
+            eval_set = (X_valid, y_valid)
+        
+        # GPU 학습 여부 결정 (지원 모델이고 학습 데이터가 충분히 클 때만)
+        if use_gpu is None:
+            use_gpu = self.use_gpu
+        use_gpu = use_gpu and model_type in _GPU_MODEL_TYPES and len(X_train) >= _GPU_MIN_ROWS
         
         # 모델 선택 및 학습
-        model = self._get_model(model_type, hyperparams)
-        model.fit(X_train, y_train)
+        model = self._get_model(model_type, hyperparams, use_gpu=use_gpu)
+        try:
+            self._fit_model(model, X_train, y_train, feature_names, eval_set)
+        except (lgb.basic.LightGBMError, xgb.core.XGBoostError) as e:
+            if not use_gpu:
+                raise
+            # GPU 빌드/장치가 없으면 CPU로 다시 학습
+            logger.warning(f"GPU 학습 실패, CPU로 다시 학습합니다: {str(e)}")
+            model = self._get_model(model_type, hyperparams)
+            self._fit_model(model, X_train, y_train, feature_names, eval_set)
         
-        # 예측 및 평가
-        y_pred = model.predict(X_test)
-        y_prob = model.predict_proba(X_test)[:, 1] if hasattr(model, 'predict_proba') else None
+        # 예측 및 평가 (특성 이름으로 학습된 모델만 이름 있는 프레임으로, 나머지는 학습과 같은 배열로 예측)
+        X_test_frame = pd.DataFrame(X_test, columns=feature_names, copy=False)
+        y_pred, y_prob = self._predict_test(model, X_test_frame if hasattr(model, 'feature_names_in_') else X_test)
         
         # 평가 지표 계산
         metrics = self._calculate_metrics(y_test, y_pred, y_prob)
+        if eval_set is not None:
+            metrics['best_iteration'] = self._best_iteration(model)
         
         # 특성 중요도 계산
-        feature_importances = self._calculate_feature_importance(model, X.columns)
+        feature_importances = self._calculate_feature_importance(model, feature_names)
         
         # SHAP 값 계산
-        shap_values = self._calculate_shap_values(model, X_test)
+        shap_values = self._calculate_shap_values(model, X_test_frame, use_gpu=use_gpu)
         
         # 모델 및 관련 정보 저장
         model_info = {
             'model': model,
             'model_type': model_type,
             'product_type': product_type,
-            'feature_names': X.columns.tolist(),
+            'feature_names': feature_names,
             'metrics': metrics,
             'feature_importances': feature_importances,
             'shap_values': shap_values,
@@ -102,19 +567,268 @@ class FinancialModelTrainer:
         # 모델 저장
         model_key = f"{product_type}_{model_type}"
         self.models[model_key] = model_info
+        self.feature_importances[model_key] = feature_importances
         
         # 모델 파일로 저장
         self._save_model(model_key, model_info)
         
         return model_info
     
-    def _get_model(self, model_type: str, hyperparams: Optional[Dict[str, Any]] = None) -> Any:
+    def _stratified_split(self, y: np.ndarray, test_size: float, random_state: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        층화 학습/테스트 분할 인덱스 (train_test_split(stratify=y)와 같은 분할, 같은 타겟이면 캐시 재사용)
+        
+        Args:
+            y: 타겟 배열
+            test_size: 테스트 데이터 비율
+            random_state: 랜덤 시드
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: 학습 인덱스, 테스트 인덱스
+        """
+        key = (hash(y.tobytes()), len(y), test_size, random_state)
+        split = self._split_cache.get(key)
+        if split is None:
+            splitter = StratifiedShuffleSplit(n_splits=1, test_size=test_size, random_state=random_state)
+            split = next(splitter.split(np.zeros((len(y), 1)), y))
+            self._split_cache[key] = split
+        return split
+    
+    def train_many(
+        self,
+        X: pd.DataFrame,
+        targets: Dict[str, pd.Series],
+        model_types: List[str]
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        상품 유형 x 모델 유형 조합을 CPU 코어에 나누어 병렬 학습
+        
+        Args:
+            X: 특성 데이터프레임
+            targets: 상품 유형별 타겟 변수
+            model_types: 학습할 모델 유형 목록
+            
+        Returns:
+            Dict[str, Dict[str, Dict[str, Any]]]: 상품 유형 -> 모델 유형 -> 학습 결과 정보 (실패한 조합은 제외)
+        """
+        tasks = [(product_type, model_type) for product_type in targets for model_type in model_types]
+        if not tasks:
+            return {}
+        
+        # 작업 수만큼 프로세스를 띄우고 남는 코어를 모델 내부 스레드로 배분 (과다 구독 방지)
+        n_cpus = joblib.cpu_count()
+        n_jobs = min(len(tasks), n_cpus)
+        n_threads = max(1, n_cpus // len(tasks))
+        
+        infos = Parallel(n_jobs=n_jobs, backend='loky')(
+            delayed(_train_model_task)(
+                self.model_dir, self.use_gpu, X, targets[product_type], model_type, product_type, n_threads
+            )
+            for product_type, model_type in tasks
+        )
+        
+        results = {product_type: {} for product_type in targets}
+        for (product_type, model_type), model_info in zip(tasks, infos):
+            if model_info is None:
+                continue
+            results[product_type][model_type] = model_info
+            self.models[f"{product_type}_{model_type}"] = model_info
+            self.feature_importances[f"{product_type}_{model_type}"] = model_info['feature_importances']
+        
+        return results
+    
+    def tune_many(
+        self,
+        X: pd.DataFrame,
+        targets: Dict[str, pd.Series],
+        model_type: str = 'lightgbm',
+        cv: int = 5,
+        n_iter: int = 20
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        상품 유형별 하이퍼파라미터 튜닝과 최적 파라미터 재학습을 CPU 코어에 나누어 병렬 수행
+        
+        LightGBM은 튜닝을 이 학습기에서 상품 유형 순서대로 수행해 구간화한 Dataset을 레이블만 바꿔 재사용하고,
+        최적 파라미터 재학습만 병렬로 수행합니다. 다른 모델 유형은 상품 유형별 튜닝 전체를 병렬로 수행합니다.
+        
+        Args:
+            X: 특성 데이터프레임
+            targets: 상품 유형별 타겟 변수
+            model_type: 튜닝할 모델 유형
+            cv: 교차 검증 폴드 수
+            n_iter: 튜닝 시도 횟수
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: 상품 유형 -> {'tuning_result', 'model_info'} (실패한 상품 유형은 제외)
+        """
+        product_types = list(targets)
+        if not product_types:
+            return {}
+        
+        # 상품 유형 수만큼 프로세스를 띄우고 남는 코어를 모델 내부 스레드로 배분 (과다 구독 방지)
+        n_cpus = joblib.cpu_count()
+        n_jobs = min(len(product_types), n_cpus)
+        n_threads = max(1, n_cpus // len(product_types))
+        
+        if model_type == 'lightgbm':
+            # lgb.cv 튜닝 자체는 LightGBM 내부 스레드로 모든 코어를 사용
+            tuning_results = {}
+            for product_type in product_types:
+                try:
+                    tuning_results[product_type] = self.tune_hyperparameters(
+                        X, targets[product_type], model_type=model_type, cv=cv, n_iter=n_iter
+                    )
+                except Exception as e:
+                    logger.error(f"{product_type} {model_type} 하이퍼파라미터 튜닝 중 오류 발생: {str(e)}")
+            
+            tuned_types = list(tuning_results)
+            model_infos = Parallel(n_jobs=max(1, min(len(tuned_types), n_cpus)), backend='loky')(
+                delayed(_train_model_task)(
+                    self.model_dir, self.use_gpu, X, targets[product_type], model_type, product_type, n_threads,
+                    tuning_results[product_type]['best_params']
+                )
+                for product_type in tuned_types
+            )
+            outputs = [
+                {'tuning_result': tuning_results[product_type], 'model_info': model_info}
+                if model_info is not None else None
+                for product_type, model_info in zip(tuned_types, model_infos)
+            ]
+            product_types = tuned_types
+        else:
+            outputs = Parallel(n_jobs=n_jobs, backend='loky')(
+                delayed(_tune_model_task)(
+                    self.model_dir, self.use_gpu, X, targets[product_type], model_type, product_type, cv, n_iter,
+                    n_threads
+                )
+                for product_type in product_types
+            )
+        
+        results = {}
+        for product_type, output in zip(product_types, outputs):
+            if output is None:
+                continue
+            results[product_type] = output
+            model_info = output['model_info']
+            self.models[f"{product_type}_{model_type}"] = model_info
+            self.feature_importances[f"{product_type}_{model_type}"] = model_info['feature_importances']
+        
+        return results
+    
+    def _fit_model(self, model: Any, X: np.ndarray, y: np.ndarray, feature_names: List[str],
+                   eval_set: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> None:
+        """
+        배열로 모델 학습 (부스터에만 특성 이름을 기록, scikit-learn 모델의 특성 이름은 모델 정보의 feature_names로 보관)
+        
+        Args:
+            model: 모델 인스턴스
+            X: 특성 배열
+            y: 타겟 배열
+            feature_names: 특성 이름
+            eval_set: 조기 종료용 검증 데이터 (LightGBM/XGBoost만 해당, None이면 모든 라운드 학습)
+        """
+        if isinstance(model, lgb.LGBMClassifier):
+            if eval_set is None:
+                model.fit(X, y, feature_name=feature_names)
+            else:
+                if _LGBM_EVAL_XY:
+                    eval_kwargs = {'eval_X': (eval_set[0],), 'eval_y': (eval_set[1],)}
+                else:
+                    eval_kwargs = {'eval_set': [eval_set]}
+                model.fit(X, y, feature_name=feature_names,
+                          callbacks=[lgb.early_stopping(_EARLY_STOPPING_ROUNDS, verbose=False)], **eval_kwargs)
+            return
+        
+        if isinstance(model, xgb.XGBClassifier):
+            if eval_set is None:
+                model.fit(X, y)
+            else:
+                model.set_params(early_stopping_rounds=_EARLY_STOPPING_ROUNDS)
+                model.fit(X, y, eval_set=[eval_set], verbose=False)
+            model.get_booster().feature_names = feature_names
+            return
+        
+        if isinstance(model, LogisticRegression):
+            self._fit_standardized_linear(model, X, y)
+        else:
+            model.fit(X, y)
+    
+    def _fit_standardized_linear(self, model: LogisticRegression, X: np.ndarray, y: np.ndarray) -> None:
+        """
+        표준화한 float32 특성으로 선형 모델 학습 후 계수를 원래 척도로 환산
+        
+        트리 모델용 전처리는 스케일링을 생략하므로 SAGA가 금액 단위 특성에서도 빠르게 수렴하도록
+        학습 시에만 표준화하고, 학습된 모델은 원본 특성을 그대로 입력받음
+        
+        Args:
+            model: 선형 모델 인스턴스
+            X: 특성 배열 (float32)
+            y: 타겟 배열
+        """
+        mean = X.mean(axis=0, dtype=np.float64)
+        scale = X.std(axis=0, dtype=np.float64)
+        scale[scale == 0] = 1.0
+        
+        X_scaled = X - mean.astype(np.float32)
+        X_scaled /= scale.astype(np.float32)
+        model.fit(X_scaled, y)
+        
+        # w·(x - m)/s + b = (w/s)·x + (b - (w/s)·m)
+        model.coef_ = model.coef_ / scale
+        model.intercept_ = model.intercept_ - model.coef_ @ mean
+    
+    def _predict_test(self, model: Any, X: Union[pd.DataFrame, np.ndarray]) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        테스트 데이터 예측 (LightGBM/XGBoost는 원시 점수를 한 번만 계산해 시그모이드로 양성 확률과 클래스 산출)
+        
+        Args:
+            model: 학습된 모델
+            X: 테스트 특성 (데이터프레임 또는 배열)
+            
+        Returns:
+            Tuple[np.ndarray, Optional[np.ndarray]]: 예측 클래스, 양성 확률 (확률 예측을 지원하지 않으면 None)
+        """
+        if isinstance(model, (lgb.LGBMClassifier, xgb.XGBClassifier)):
+            if isinstance(model, lgb.LGBMClassifier):
+                prob = model.predict(X, raw_score=True)
+            else:
+                prob = model.predict(X, output_margin=True)
+            
+            # 1 / (1 + exp(-margin))를 같은 배열에서 계산
+            np.negative(prob, out=prob)
+            np.exp(prob, out=prob)
+            np.add(prob, 1.0, out=prob)
+            np.reciprocal(prob, out=prob)
+            return (prob > 0.5).astype(np.int64), prob
+        
+        y_pred = model.predict(X)
+        y_prob = model.predict_proba(X)[:, 1] if hasattr(model, 'predict_proba') else None
+        return y_pred, y_prob
+    
+    def _best_iteration(self, model: Any) -> int:
+        """
+        조기 종료로 선택된 부스팅 라운드 수
+        
+        Args:
+            model: 조기 종료로 학습된 LightGBM/XGBoost 모델
+            
+        Returns:
+            int: 검증 성능이 가장 좋았던 라운드 수
+        """
+        if isinstance(model, lgb.LGBMClassifier):
+            return int(model.best_iteration_)
+        # XGBoost는 0부터 시작하는 인덱스
+        return int(model.best_iteration) + 1
+    
+    def _get_model(self, model_type: str, hyperparams: Optional[Dict[str, Any]] = None,
+                   use_gpu: bool = False) -> Any:
         """
         모델 인스턴스 생성
         
         Args:
             model_type: 모델 유형
             hyperparams: 하이퍼파라미터
+            use_gpu: GPU(CUDA) 학습 설정 추가 여부 (LightGBM/XGBoost만 해당)
             
         Returns:
             Any: 모델 인스턴스
@@ -123,17 +837,10 @@ class FinancialModelTrainer:
             hyperparams = {}
             
         if model_type == 'lightgbm':
-            default_params = {
-                'objective': 'binary',
-                'metric': 'auc',
-                'boosting_type': 'gbdt',
-                'num_leaves': 31,
-                'learning_rate': 0.05,
-                'feature_fraction': 0.9,
-                'bagging_fraction': 0.8,
-                'bagging_freq': 5,
-                'verbose': -1
-            }
+            default_params = dict(_LGBM_DEFAULT_PARAMS)
+            if use_gpu:
+                # CUDA 빌드는 작은 히스토그램 구간 수(max_bin 63 이하)를 사용하므로 기본값 그대로 사용
+                default_params['device_type'] = 'cuda'
             params = {**default_params, **hyperparams}
             return lgb.LGBMClassifier(**params)
             
@@ -147,6 +854,8 @@ class FinancialModelTrainer:
                 'colsample_bytree': 0.8,
                 'verbosity': 0
             }
+            if use_gpu:
+                default_params.update({'tree_method': 'hist', 'device': 'cuda'})
             params = {**default_params, **hyperparams}
             return xgb.XGBClassifier(**params)
             
@@ -177,7 +886,9 @@ class FinancialModelTrainer:
             default_params = {
                 'C': 1.0,
                 'penalty': 'l2',
-                'solver': 'liblinear',
+                'solver': 'saga',
+                'max_iter': 200,
+                'tol': 1e-3,
                 'random_state': 42
             }
             params = {**default_params, **hyperparams}
@@ -188,80 +899,83 @@ class FinancialModelTrainer:
     
     def _calculate_metrics(
         self, 
-        y_true: pd.Series, 
+        y_true: np.ndarray, 
         y_pred: np.ndarray, 
         y_prob: Optional[np.ndarray] = None
     ) -> Dict[str, float]:
         """
-        평가 지표 계산
+        평가 지표 계산 (혼동 행렬을 한 번에 집계해 정확도/정밀도/재현율/F1 계산, 분모가 0이면 0)
         
         Args:
-            y_true: 실제 값
-            y_pred: 예측 값
+            y_true: 실제 값 (0/1)
+            y_pred: 예측 값 (0/1)
             y_prob: 예측 확률
             
         Returns:
             Dict[str, float]: 평가 지표
         """
+        y_true = np.asarray(y_true, dtype=np.int64)
+        
+        # (실제, 예측) 조합별 개수: tn, fp, fn, tp
+        tn, fp, fn, tp = np.bincount(2 * y_true + np.asarray(y_pred, dtype=np.int64), minlength=4)[:4].tolist()
+        
         metrics = {
-            'accuracy': accuracy_score(y_true, y_pred),
-            'precision': precision_score(y_true, y_pred, zero_division=0),
-            'recall': recall_score(y_true, y_pred, zero_division=0),
-            'f1': f1_score(y_true, y_pred, zero_division=0)
+            'accuracy': (tp + tn) / y_true.size,
+            'precision': tp / (tp + fp) if tp + fp else 0.0,
+            'recall': tp / (tp + fn) if tp + fn else 0.0,
+            'f1': 2 * tp / (2 * tp + fp + fn) if tp else 0.0
         }
         
         if y_prob is not None:
-            metrics['auc'] = roc_auc_score(y_true, y_prob)
+            metrics['auc'] = _roc_auc(y_true, y_prob)
             
         return metrics
     
-    def _calculate_feature_importance(self, model: Any, feature_names: pd.Index) -> Dict[str, float]:
+    def _calculate_feature_importance(self, model: Any, feature_names: List[str]) -> Dict[str, np.ndarray]:
         """
-        특성 중요도 계산
+        특성 중요도 계산 (이름 배열과 중요도 배열을 따로 두는 구조, dict가 필요하면 dict(zip(...))으로 변환)
         
         Args:
             model: 학습된 모델
             feature_names: 특성 이름
             
         Returns:
-            Dict[str, float]: 특성별 중요도
+            Dict[str, np.ndarray]: 'names'(object 배열)와 같은 순서의 'values'(float32 배열)
         """
-        importances = {}
+        importances = np.zeros(len(feature_names), dtype=np.float32)
         
-        if hasattr(model, 'feature_importances_'):
+        if isinstance(model, lgb.LGBMClassifier):
+            # LightGBM은 래퍼 속성을 거치지 않고 부스터에서 바로 계산 (래퍼와 같은 중요도 유형)
+            importances[:] = model.booster_.feature_importance(importance_type=model.importance_type)
+        elif hasattr(model, 'feature_importances_'):
             # Tree 기반 모델
-            importances = dict(zip(feature_names, model.feature_importances_))
+            importances[:] = model.feature_importances_
         elif hasattr(model, 'coef_'):
             # 선형 모델
-            importances = dict(zip(feature_names, np.abs(model.coef_[0])))
-        elif hasattr(model, 'feature_importance'):
-            # LightGBM
-            importances = dict(zip(feature_names, model.feature_importance()))
-        elif hasattr(model, 'get_booster'):
-            # XGBoost
-            importances = dict(zip(feature_names, model.get_booster().get_score(importance_type='gain')))
+            np.abs(model.coef_[0], out=importances, casting='same_kind')
             
-        return importances
+        return {'names': np.asarray(feature_names, dtype=object), 'values': importances}
     
-    def _calculate_shap_values(self, model: Any, X: pd.DataFrame) -> Optional[Dict[str, Any]]:
+    def _calculate_shap_values(self, model: Any, X: pd.DataFrame, use_gpu: bool = False) -> Optional[Dict[str, Any]]:
         """
         SHAP 값 계산
         
         Args:
             model: 학습된 모델
             X: 특성 데이터프레임
+            use_gpu: LightGBM/XGBoost 모델의 SHAP 값을 GPU로 계산할지 여부 (실패 시 CPU)
             
         Returns:
             Optional[Dict[str, Any]]: SHAP 값 정보
         """
         try:
-            # 샘플 수가 많은 경우 일부만 사용
-            sample_size = min(100, len(X))
-            X_sample = X.sample(sample_size, random_state=42)
+            # 샘플 수가 많은 경우 일부만 사용 (테스트 데이터는 분할 시 이미 섞였으므로 무작위 추출 대신 일정 간격 슬라이스)
+            sample_size = min(_GPU_SHAP_SAMPLE_SIZE if use_gpu else _SHAP_SAMPLE_SIZE, len(X))
+            step = max(len(X) // sample_size, 1) if sample_size else 1
+            X_sample = X.iloc[::step][:sample_size]
             
             if isinstance(model, lgb.LGBMClassifier):
-                explainer = shap.TreeExplainer(model)
-                shap_values = explainer.shap_values(X_sample)
+                explainer, shap_values = self._tree_shap_values(model, X_sample, use_gpu)
                 
                 if isinstance(shap_values, list):
                     shap_values = shap_values[1]  # 이진 분류의 경우 양성 클래스 선택
@@ -273,8 +987,7 @@ class FinancialModelTrainer:
                 }
                 
             elif isinstance(model, xgb.XGBClassifier):
-                explainer = shap.TreeExplainer(model)
-                shap_values = explainer.shap_values(X_sample)
+                explainer, shap_values = self._tree_shap_values(model, X_sample, use_gpu)
                 
                 return {
                     'values': shap_values,
@@ -284,7 +997,7 @@ class FinancialModelTrainer:
                 
             elif isinstance(model, (RandomForestClassifier, GradientBoostingClassifier)):
                 explainer = shap.TreeExplainer(model)
-                shap_values = explainer.shap_values(X_sample)
+                shap_values = explainer.shap_values(X_sample, **_TREE_SHAP_OPTIONS)
                 
                 if isinstance(shap_values, list):
                     shap_values = shap_values[1]  # 이진 분류의 경우 양성 클래스 선택
@@ -313,6 +1026,31 @@ class FinancialModelTrainer:
             logger.error(f"SHAP 값 계산 중 오류 발생: {str(e)}")
             return None
     
+    def _tree_shap_values(self, model: Any, X_sample: pd.DataFrame, use_gpu: bool = False) -> Tuple[Any, Any]:
+        """
+        트리 모델 SHAP 값 계산 (use_gpu이면 GPUTree 설명기를 먼저 시도하고, 사용할 수 없으면 CPU TreeExplainer 사용)
+        
+        Args:
+            model: 학습된 트리 모델
+            X_sample: SHAP 계산 샘플
+            use_gpu: GPU 설명기 사용 여부
+            
+        Returns:
+            Tuple[Any, Any]: 설명기, SHAP 값
+        """
+        if use_gpu:
+            try:
+                from shap.explainers import GPUTree
+                
+                # GPU 설명기는 근사 계산을 지원하지 않으므로 가산성 검사만 생략
+                explainer = GPUTree(model)
+                return explainer, explainer.shap_values(X_sample, check_additivity=False)
+            except (ImportError, RuntimeError) as e:
+                logger.warning(f"GPU SHAP 계산 실패, CPU로 계산합니다: {str(e)}")
+        
+        explainer = shap.TreeExplainer(model)
+        return explainer, explainer.shap_values(X_sample, **_TREE_SHAP_OPTIONS)
+    
     def _save_model(self, model_key: str, model_info: Dict[str, Any]) -> None:
         """
         모델 저장
@@ -325,47 +1063,134 @@ class FinancialModelTrainer:
             # 모델 파일 경로
             model_path = os.path.join(self.model_dir, f"{model_key}.joblib")
             
-            # 저장할 정보 복사
-            save_info = model_info.copy()
+            save_info = model_info
+            
+            # 이전 모델로 컴파일된 예측 라이브러리는 더 이상 맞지 않으므로 삭제
+            compiled_path = os.path.join(self.model_dir, f"{model_key}{_COMPILED_MODEL_SUFFIX}")
+            if os.path.exists(compiled_path):
+                os.remove(compiled_path)
             
-            # SHAP 값은 크기가 클 수 있으므로 필요시 제외
-            if 'shap_values' in save_info:
-                # SHAP 값 별도 저장
-                shap_path = os.path.join(self.model_dir, f"{model_key}_shap.joblib")
-                joblib.dump(save_info['shap_values'], shap_path)
-                save_info['shap_values'] = f"{model_key}_shap.joblib"
+            # LightGBM/XGBoost는 파이썬 래퍼를 피클하지 않고 부스터를 네이티브 형식으로 저장
+            booster_file = self._save_native_booster(model_key, model_info['model'])
+            if booster_file is not None:
+                save_info = {key: value for key, value in model_info.items() if key != 'model'}
+                save_info['booster_path'] = booster_file
+            
+            # SHAP 값은 크기가 클 수 있으므로 필요시 제외 (계산하지 못한 경우 이전 SHAP 파일도 삭제)
+            shap_path = os.path.join(self.model_dir, f"{model_key}_shap.joblib")
+            if model_info.get('shap_values') is not None:
+                # SHAP 값 별도 저장 (원본 model_info는 그대로 두고 저장용 딕셔너리에서만 파일 이름으로 교체)
+                # 로드 시 메모리 매핑할 수 있도록 압축하지 않음
+                joblib.dump(model_info['shap_values'], f"{shap_path}.tmp", protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(f"{shap_path}.tmp", shap_path)
+                save_info = {**save_info, 'shap_values': f"{model_key}_shap.joblib"}
+            elif os.path.exists(shap_path):
+                os.remove(shap_path)
+            
+            # 모델 저장 (메모리 매핑 중인 기존 파일을 덮어쓰지 않도록 임시 파일에 쓴 뒤 교체)
+            tmp_path = f"{model_path}.tmp"
+            joblib.dump(save_info, tmp_path, compress=_MODEL_COMPRESS, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, model_path)
+            
+            # 지표/특성 중요도 요약은 JSON으로 별도 저장
+            summary = {key: model_info[key] for key in _MODEL_SUMMARY_KEYS if key in model_info}
+            importances = summary.get('feature_importances')
+            if importances is not None:
+                summary['feature_importances'] = dict(zip(importances['names'].tolist(), importances['values'].tolist()))
+            summary_path = os.path.join(self.model_dir, f"{model_key}_summary.json")
+            with open(summary_path, 'w', encoding='utf-8') as f:
+                json.dump(summary, f, ensure_ascii=False, default=float)
             
-            # 모델 저장
-            joblib.dump(save_info, model_path)
             logger.info(f"모델 저장 완료: {model_path}")
             
         except Exception as e:
             logger.error(f"모델 저장 중 오류 발생: {str(e)}")
     
-    def load_model(self, model_key: str) -> Optional[Dict[str, Any]]:
+    def _save_native_booster(self, model_key: str, model: Any) -> Optional[str]:
         """
-        모델 로드
+        LightGBM/XGBoost 부스터를 네이티브 형식으로 저장 (조기 종료 시 최적 라운드까지만 저장)
         
         Args:
             model_key: 모델 키
+            model: 학습된 모델
             
         Returns:
-            Optional[Dict[str, Any]]: 모델 정보
+            Optional[str]: 모델 디렉토리 기준 부스터 파일 이름 (지원하지 않는 모델이면 None)
+        """
+        if isinstance(model, lgb.LGBMClassifier):
+            booster_file = f"{model_key}{_LGBM_BOOSTER_SUFFIX}"
+            # 최적 라운드가 있으면 LightGBM이 해당 라운드까지만 저장
+            model.booster_.save_model(os.path.join(self.model_dir, booster_file))
+            return booster_file
+        
+        if isinstance(model, xgb.XGBClassifier):
+            booster_file = f"{model_key}{_XGB_BOOSTER_SUFFIX}"
+            booster = model.get_booster()
+            if hasattr(model, 'best_iteration'):
+                booster = booster[:model.best_iteration + 1]
+            booster.save_model(os.path.join(self.model_dir, booster_file))
+            return booster_file
+        
+        return None
+    
+    def compile_model(self, model_key: str) -> Optional[str]:
+        """
+        저장된 LightGBM/XGBoost 부스터를 Treelite로 예측 전용 공유 라이브러리로 컴파일
+        (추천 엔진이 모델을 로드할 때 컴파일된 라이브러리를 우선 사용)
+        
+        Args:
+            model_key: 모델 키
+            
+        Returns:
+            Optional[str]: 컴파일된 라이브러리 경로 (treelite/tl2cgen이 없거나 지원하지 않는 모델이면 None)
         """
+        if treelite is None or tl2cgen is None:
+            logger.warning("treelite/tl2cgen이 설치되어 있지 않아 모델 컴파일을 건너뜁니다.")
+            return None
+        
+        # _save_model이 저장한 네이티브 부스터 파일에서 트리 구조 로드
+        lgb_path = os.path.join(self.model_dir, f"{model_key}{_LGBM_BOOSTER_SUFFIX}")
+        xgb_path = os.path.join(self.model_dir, f"{model_key}{_XGB_BOOSTER_SUFFIX}")
+        
         try:
-            # 모델 파일 경로
-            model_path = os.path.join(self.model_dir, f"{model_key}.joblib")
+            if os.path.exists(lgb_path):
+                tree_model = treelite.frontend.load_lightgbm_model(lgb_path)
+            elif os.path.exists(xgb_path):
+                tree_model = treelite.frontend.load_xgboost_model(xgb_path)
+            else:
+                return None
             
-            # 모델 로드
-            model_info = joblib.load(model_path)
+            libpath = os.path.join(self.model_dir, f"{model_key}{_COMPILED_MODEL_SUFFIX}")
+            tl2cgen.export_lib(
+                tree_model,
+                toolchain='gcc',
+                libpath=libpath,
+                params={'parallel_comp': os.cpu_count()}
+            )
+            logger.info(f"모델 컴파일 완료: {libpath}")
+            return libpath
             
-            # SHAP 값 로드
-            if isinstance(model_info.get('shap_values'), str):
-                shap_path = os.path.join(self.model_dir, model_info['shap_values'])
-                if os.path.exists(shap_path):
-                    model_info['shap_values'] = joblib.load(shap_path)
-                else:
-                    model_info['shap_values'] = None
+        except Exception as e:
+            logger.error(f"모델 컴파일 중 오류 발생: {str(e)}")
+            return None
+    
+    def load_model(self, model_key: str) -> Optional[Dict[str, Any]]:
+        """
+        모델 로드 (이미 학습/로드된 모델은 디스크를 읽지 않고 반환)
+        
+        Args:
+            model_key: 모델 키
+            
+        Returns:
+            Optional[Dict[str, Any]]: 모델 정보
+        """
+        cached = self.models.get(model_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            # 모델 로드 (같은 파일은 프로세스 내 캐시에서 재사용)
+            model_info = load_model_info(self.model_dir, model_key)
             
             # 모델 정보 저장
             self.models[model_key] = model_info
@@ -376,6 +1201,25 @@ class FinancialModelTrainer:
             logger.error(f"모델 로드 중 오류 발생: {str(e)}")
             return None
     
+    def load_model_summary(self, model_key: str) -> Optional[Dict[str, Any]]:
+        """
+        모델 요약 로드 (지표, 특성 중요도 등, 모델 객체는 로드하지 않음)
+        
+        Args:
+            model_key: 모델 키
+            
+        Returns:
+            Optional[Dict[str, Any]]: 모델 요약 정보 (요약 파일이 없으면 None)
+        """
+        summary_path = os.path.join(self.model_dir, f"{model_key}_summary.json")
+        
+        try:
+            with open(summary_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"모델 요약 로드 중 오류 발생: {str(e)}")
+            return None
+    
     def tune_hyperparameters(
         self, 
         X: pd.DataFrame, 
@@ -385,11 +1229,14 @@ class FinancialModelTrainer:
         cv: int = 5,
         scoring: str = 'roc_auc',
         n_iter: int = 20,
-        random_state: int = 42
+        random_state: int = 42,
+        use_optuna: bool = True
     ) -> Dict[str, Any]:
         """
         하이퍼파라미터 튜닝
         
+        optuna가 설치되어 있으면 TPE 탐색과 Hyperband 가지치기를 사용하고, 없으면 랜덤 서치를 수행합니다.
+        
         Args:
             X: 특성 데이터프레임
             y: 타겟 변수
@@ -397,8 +1244,9 @@ class FinancialModelTrainer:
             param_grid: 하이퍼파라미터 그리드
             cv: 교차 검증 폴드 수
             scoring: 평가 지표
-            n_iter: 랜덤 서치 반복 횟수
+            n_iter: 랜덤 서치 반복 횟수 (optuna 사용 시 시도 횟수)
             random_state: 랜덤 시드
+            use_optuna: optuna 사용 여부 (설치되지 않았으면 무시)
             
         Returns:
             Dict[str, Any]: 튜닝 결과
@@ -415,7 +1263,8 @@ class FinancialModelTrainer:
                     'n_estimators': [100, 200, 300],
                     'feature_fraction': [0.7, 0.8, 0.9],
                     'bagging_fraction': [0.7, 0.8, 0.9],
-                    'bagging_freq': [3, 5, 7]
+                    'bagging_freq': [3, 5, 7],
+                    'max_bin': [15, 31, 63]
                 }
             elif model_type == 'xgboost':
                 param_grid = {
@@ -449,6 +1298,15 @@ class FinancialModelTrainer:
             else:
                 raise ValueError(f"지원되지 않는 모델 유형: {model_type}")
         
+        # LightGBM AUC 튜닝은 구간화된 Dataset을 재사용하는 lgb.cv로 수행
+        use_lgb_cv = model_type == 'lightgbm' and scoring == 'roc_auc'
+        
+        if use_optuna and optuna is not None:
+            return self._tune_with_optuna(base_model, X, y, param_grid, cv, scoring, n_iter, random_state, use_lgb_cv)
+        
+        if use_lgb_cv:
+            return self._tune_lightgbm_random(X, y, param_grid, cv, n_iter, random_state)
+        
         # 랜덤 서치 수행
         random_search = RandomizedSearchCV(
             base_model,
@@ -471,6 +1329,163 @@ class FinancialModelTrainer:
         
         return result
     
+    def _tune_with_optuna(
+        self,
+        base_model: Any,
+        X: pd.DataFrame,
+        y: pd.Series,
+        param_grid: Dict[str, List[Any]],
+        cv: int,
+        scoring: str,
+        n_iter: int,
+        random_state: int,
+        use_lgb_cv: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Optuna TPE 탐색과 Hyperband 가지치기로 하이퍼파라미터 튜닝
+        
+        교차 검증 폴드마다 중간 평균 점수를 보고하여 가능성이 낮은 시도는 남은 폴드를 학습하지 않고 중단합니다.
+        use_lgb_cv이면 lgb.cv의 부스팅 라운드마다 점수를 보고합니다.
+        
+        Args:
+            base_model: 기본 모델
+            X: 특성 데이터프레임
+            y: 타겟 변수
+            param_grid: 하이퍼파라미터 후보 (랜덤 서치와 같은 후보에서 선택)
+            cv: 교차 검증 폴드 수
+            scoring: 평가 지표
+            n_iter: 시도 횟수
+            random_state: 랜덤 시드
+            use_lgb_cv: LightGBM을 구간화 Dataset 재사용 lgb.cv로 평가할지 여부
+            
+        Returns:
+            Dict[str, Any]: 튜닝 결과 (랜덤 서치와 같은 키)
+        """
+        # 폴드 분할과 평가 함수는 모든 시도에서 공유
+        folds = list(check_cv(cv, y, classifier=True).split(X, y))
+        scorer = get_scorer(scoring)
+        
+        def objective(trial):
+            params = {name: trial.suggest_categorical(name, values) for name, values in param_grid.items()}
+            
+            if use_lgb_cv:
+                def report_to_trial(env):
+                    # 부스팅 라운드별 평균 AUC 보고 후 가지치기 판단
+                    trial.report(env.evaluation_result_list[0][2], env.iteration)
+                    if trial.should_prune():
+                        raise optuna.TrialPruned()
+                
+                return self._lgb_cv_score(params, X, y, folds, callbacks=[report_to_trial])
+            
+            model = clone(base_model).set_params(**params)
+            
+            scores = []
+            for step, (train_idx, valid_idx) in enumerate(folds):
+                model.fit(X.iloc[train_idx], y.iloc[train_idx])
+                scores.append(scorer(model, X.iloc[valid_idx], y.iloc[valid_idx]))
+                
+                # 중간 점수 보고 후 가지치기 판단
+                trial.report(float(np.mean(scores)), step)
+                if trial.should_prune():
+                    raise optuna.TrialPruned()
+            
+            return float(np.mean(scores))
+        
+        study = optuna.create_study(
+            direction='maximize',
+            sampler=optuna.samplers.TPESampler(seed=random_state),
+            pruner=optuna.pruners.HyperbandPruner()
+        )
+        study.optimize(objective, n_trials=n_iter)
+        
+        result = {
+            'best_params': study.best_params,
+            'best_score': study.best_value,
+            'cv_results': study.trials_dataframe(attrs=('number', 'value', 'params', 'state')).to_dict('list')
+        }
+        
+        return result
+    
+    def _tune_lightgbm_random(
+        self,
+        X: pd.DataFrame,
+        y: pd.Series,
+        param_grid: Dict[str, List[Any]],
+        cv: int,
+        n_iter: int,
+        random_state: int
+    ) -> Dict[str, Any]:
+        """
+        LightGBM 랜덤 서치 (RandomizedSearchCV와 같은 후보 샘플링, 구간화된 Dataset을 재사용하는 lgb.cv로 평가)
+        
+        Args:
+            X: 특성 데이터프레임
+            y: 타겟 변수
+            param_grid: 하이퍼파라미터 후보
+            cv: 교차 검증 폴드 수
+            n_iter: 랜덤 서치 반복 횟수
+            random_state: 랜덤 시드
+            
+        Returns:
+            Dict[str, Any]: 튜닝 결과 (랜덤 서치와 같은 키)
+        """
+        folds = list(check_cv(cv, y, classifier=True).split(X, y))
+        
+        candidates = list(ParameterSampler(param_grid, n_iter=n_iter, random_state=random_state))
+        scores = [self._lgb_cv_score(params, X, y, folds) for params in candidates]
+        best_index = int(np.argmax(scores))
+        
+        result = {
+            'best_params': candidates[best_index],
+            'best_score': scores[best_index],
+            'cv_results': {'params': candidates, 'mean_test_score': scores}
+        }
+        
+        return result
+    
+    def _lgb_cv_score(
+        self,
+        params: Dict[str, Any],
+        X: pd.DataFrame,
+        y: pd.Series,
+        folds: List[Tuple[np.ndarray, np.ndarray]],
+        callbacks: Optional[List[Any]] = None
+    ) -> float:
+        """
+        lgb.cv 교차 검증 평균 AUC
+        
+        같은 특성 데이터프레임과 구간화 파라미터이면 이전에 구간화한 Dataset에 레이블만 바꿔 재사용합니다.
+        
+        Args:
+            params: LGBMClassifier 형식 하이퍼파라미터 (n_estimators는 부스팅 라운드 수로 사용)
+            X: 특성 데이터프레임
+            y: 타겟 변수
+            folds: (학습 인덱스, 검증 인덱스) 목록
+            callbacks: lgb.cv 콜백
+            
+        Returns:
+            float: 마지막 라운드의 폴드 평균 AUC
+        """
+        params = {**_LGBM_DEFAULT_PARAMS, **params}
+        num_boost_round = params.pop('n_estimators', 100)
+        
+        cached_frame = self._lgb_dataset_frame() if self._lgb_dataset_frame is not None else None
+        if cached_frame is not X:
+            self._lgb_dataset_cache.clear()
+            self._lgb_dataset_frame = weakref.ref(X)
+        
+        dataset_params = {name: params[name] for name in _LGBM_DATASET_PARAMS if name in params}
+        dataset_key = tuple(sorted(dataset_params.items()))
+        train_set = self._lgb_dataset_cache.get(dataset_key)
+        if train_set is None:
+            train_set = lgb.Dataset(X, label=y, params=dataset_params, free_raw_data=False)
+            self._lgb_dataset_cache[dataset_key] = train_set
+        else:
+            train_set.set_label(y)
+        
+        cv_results = lgb.cv(params, train_set, num_boost_round=num_boost_round, folds=folds, callbacks=callbacks)
+        return float(cv_results['valid auc-mean'][-1])
+    
     def create_target_variable(
         self, 
         df: pd.DataFrame, 
@@ -490,67 +1505,74 @@ class FinancialModelTrainer:
         """
         if target_config is None:
             target_config = {}
-            
-        # 상품 유형별 타겟 변수 생성 로직
+        
+        columns = df.columns
+        
+        # 상품 유형별 타겟 변수 생성 로직 (NumPy 배열로 계산한 뒤 마지막에 한 번만 Series로 감쌈)
         if product_type == 'deposit':
             # 예금 상품 가입 가능성 타겟
             # 예: 저축 성향이 높은 고객 (잔액 증가율이 높은 고객)
             threshold = target_config.get('threshold', 0.5)
             
-            if 'financial_health_score' in df.columns:
+            if 'financial_health_score' in columns:
                 # 금융 건강 점수가 높은 고객
-                target = (df['financial_health_score'] > 70).astype(int)
-            elif 'vip_score' in df.columns and 'avg_growth_rate' in df.columns:
+                target = _column_values(df, 'financial_health_score') > 70
+            elif 'vip_score' in columns and 'avg_growth_rate' in columns:
                 # VIP 고객이면서 성장률이 높은 고객
-                target = ((df['vip_score'] > 5) & (df['avg_growth_rate'] > 0)).astype(int)
-            elif 'bal_B0M' in df.columns and 'amt_credit_limit_use' in df.columns:
+                target = _both_greater(_column_values(df, 'vip_score'), 5, _column_values(df, 'avg_growth_rate'), 0)
+            elif 'bal_B0M' in columns and 'amt_credit_limit_use' in columns:
                 # 잔액 대비 한도 비율이 낮은 고객 (여유 자금이 있는 고객)
-                ratio = df['bal_B0M'] / df['amt_credit_limit_use'].replace(0, 1)
-                target = (ratio < threshold).astype(int)
+                target = _ratio_threshold(
+                    _column_values(df, 'bal_B0M'), _column_values(df, 'amt_credit_limit_use'), threshold, greater=False
+                )
             else:
                 # 기본값: 랜덤 타겟 (실제 구현에서는 사용하지 않음)
                 logger.warning("적절한 특성이 없어 랜덤 타겟 변수를 생성합니다.")
-                target = pd.Series(np.random.binomial(1, 0.3, size=len(df)), index=df.index)
+                target = np.random.binomial(1, 0.3, size=len(df))
                 
         elif product_type == 'loan':
             # 대출 상품 가입 가능성 타겟
             # 예: 현금서비스 이용률이 높은 고객
             threshold = target_config.get('threshold', 0.3)
             
-            if 'cash_advance_preference' in df.columns:
+            if 'cash_advance_preference' in columns:
                 # 현금서비스 선호도가 높은 고객
-                target = (df['cash_advance_preference'] > threshold).astype(int)
-            elif 'bal_ca_B0M' in df.columns and 'bal_B0M' in df.columns:
+                target = _column_values(df, 'cash_advance_preference') > threshold
+            elif 'bal_ca_B0M' in columns and 'bal_B0M' in columns:
                 # 현금서비스 이용 비중이 높은 고객
-                ratio = df['bal_ca_B0M'] / df['bal_B0M'].replace(0, 1)
-                target = (ratio > threshold).astype(int)
-            elif 'credit_risk_score' in df.columns:
+                target = _ratio_threshold(
+                    _column_values(df, 'bal_ca_B0M'), _column_values(df, 'bal_B0M'), threshold, greater=True
+                )
+            elif 'credit_risk_score' in columns:
                 # 신용 리스크 점수가 중간 이상인 고객
-                target = (df['credit_risk_score'] > 0.4).astype(int)
+                target = _column_values(df, 'credit_risk_score') > 0.4
             else:
                 # 기본값: 랜덤 타겟 (실제 구현에서는 사용하지 않음)
                 logger.warning("적절한 특성이 없어 랜덤 타겟 변수를 생성합니다.")
-                target = pd.Series(np.random.binomial(1, 0.2, size=len(df)), index=df.index)
+                target = np.random.binomial(1, 0.2, size=len(df))
                 
         elif product_type == 'fund':
             # 펀드 상품 가입 가능성 타겟
             # 예: VIP 고객이면서 리스크 감수 성향이 있는 고객
             
-            if 'vip_score' in df.columns and 'financial_health_score' in df.columns:
+            if 'vip_score' in columns and 'financial_health_score' in columns:
                 # VIP 고객이면서 금융 건강 점수가 높은 고객
-                target = ((df['vip_score'] > 5) & (df['financial_health_score'] > 70)).astype(int)
-            elif 'customer_segment' in df.columns:
+                target = _both_greater(_column_values(df, 'vip_score'), 5, _column_values(df, 'financial_health_score'), 70)
+            elif 'customer_segment' in columns:
                 # 특정 고객 세그먼트 (예: 세그먼트 0, 2가 투자 성향이 높다고 가정)
-                target = df['customer_segment'].isin([0, 2]).astype(int)
-            elif 'vip_score' in df.columns and 'age' in df.columns:
+                target = np.isin(_column_values(df, 'customer_segment'), [0, 2])
+            elif 'vip_score' in columns and 'age' in columns:
                 # VIP 고객이면서 젊은 고객 (리스크 감수 성향이 높다고 가정)
-                target = ((df['vip_score'] > 5) & (df['age'].astype(int) < 40)).astype(int)
+                target = (_column_values(df, 'vip_score') > 5) & (df['age'].astype(int).to_numpy() < 40)
             else:
                 # 기본값: 랜덤 타겟 (실제 구현에서는 사용하지 않음)
                 logger.warning("적절한 특성이 없어 랜덤 타겟 변수를 생성합니다.")
-                target = pd.Series(np.random.binomial(1, 0.1, size=len(df)), index=df.index)
+                target = np.random.binomial(1, 0.1, size=len(df))
                 
         else:
             raise ValueError(f"지원되지 않는 상품 유형: {product_type}")
+        
+        # 0/1 타겟은 int8로 저장
+        target = pd.Series(target.astype(np.int8), index=df.index)
             
         return target
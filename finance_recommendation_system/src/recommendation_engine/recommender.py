@@ -9,27 +9,188 @@ import numpy as np
 from typing import Dict, List, Any, Optional, Tuple, Union
 import logging
 import os
-import joblib
+import hashlib
+import threading
+from collections import OrderedDict
 from datetime import datetime
 
+from data_processing.data_loader import FILE_CACHE_DIR
+from model_training.model_trainer import load_model_info
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 logger = logging.getLogger(__name__)
 
+# 점수 행렬 계산에 numba 커널을 사용할 최소 셀 수 (고객 수 x 상품 수)
+_NUMBA_MIN_CELLS = 100_000
+
+# 추천 엔진이 메모리에 유지할 최대 모델 수 (가장 오래 사용하지 않은 모델부터 제거)
+_MODEL_CACHE_SIZE = 16
+
+# 상품 점수/추천 이유 계산과 결과 조립에 쓰는 고객 컬럼 (추천 대상 고객은 이 컬럼만 잘라 사용)
+_CUSTOMER_COLUMNS = (
+    'member_no', 'financial_health_score', 'bal_B0M', 'vip_score',
+    'credit_risk_score', 'cash_advance_preference', 'age'
+)
+
+# 문자열로 저장될 수 있어 상품 로드 시 한 번만 숫자로 변환하는 상품 컬럼
+_NUMERIC_PRODUCT_COLUMNS = ('계약기간개월수_최대구간', '가입금액_최소구간')
+
+def _customer_values(customers: pd.DataFrame, column: str) -> np.ndarray:
+    """고객 컬럼을 float64 배열로 변환 (결측치는 NaN, NaN 비교 결과는 False)"""
+    return customers[column].astype(float).to_numpy(dtype=np.float64, na_value=np.nan)
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _score_rules_kernel(customer_conditions, product_conditions, weights, n_products):
+        """고객별로 모든 점수 규칙을 순서대로 누적 (셀마다 한 번만 쓰기)"""
+        n_customers = customer_conditions.shape[1]
+        scores = np.empty((n_customers, n_products))
+        for i in prange(n_customers):
+            for j in range(n_products):
+                score = 0.5
+                for r in range(weights.shape[0]):
+                    if customer_conditions[r, i] and product_conditions[r, j]:
+                        score += weights[r]
+                scores[i, j] = score
+        return scores
+else:
+    _score_rules_kernel = None
+
+def _score_table(
+    customer_conditions: np.ndarray, 
+    product_conditions: np.ndarray, 
+    weights: np.ndarray
+) -> np.ndarray:
+    """
+    고객 조건 행렬과 상품 조건 행렬로 기본 점수 0.5에서 시작하는 점수 행렬 계산
+    (큰 행렬은 numba 커널로 셀마다 한 번에 누적, 그 외에는 NumPy 브로드캐스트)
+    
+    Args:
+        customer_conditions: (규칙 수, 고객 수) bool 배열
+        product_conditions: (규칙 수, 상품 수) bool 배열
+        weights: 규칙별 가산점 (규칙 순서대로 누적)
+        
+    Returns:
+        np.ndarray: (고객 수, 상품 수) 점수 행렬
+    """
+    n_customers = customer_conditions.shape[1]
+    n_products = product_conditions.shape[1]
+    
+    if _score_rules_kernel is not None and n_customers * n_products >= _NUMBA_MIN_CELLS:
+        return _score_rules_kernel(customer_conditions, product_conditions, weights, n_products)
+    
+    scores = np.full((n_customers, n_products), 0.5)
+    for customer_condition, product_condition, weight in zip(customer_conditions, product_conditions, weights):
+        scores += weight * (customer_condition[:, None] & product_condition)
+    return scores
+
+def _apply_score_rules(
+    rules: List[Tuple[np.ndarray, np.ndarray, float]], 
+    n_customers: int, 
+    n_products: int
+) -> np.ndarray:
+    """
+    점수 규칙 목록으로 기본 점수 0.5에서 시작하는 고객 x 상품 점수 행렬 계산
+    
+    고객은 규칙별 고객 조건 충족 여부로만 구분되므로, 조건 조합(비트 코드)이 같은 고객끼리 묶어
+    조합별 점수 행을 한 번만 계산한 뒤 고객마다 해당 행을 가져옵니다.
+    
+    Args:
+        rules: (고객 조건 bool 배열, 상품 조건 bool 배열, 가산점) 목록 (목록 순서대로 누적)
+        n_customers: 고객 수
+        n_products: 상품 수
+        
+    Returns:
+        np.ndarray: (고객 수, 상품 수) 점수 행렬
+    """
+    if not rules:
+        return np.full((n_customers, n_products), 0.5)
+    
+    customer_conditions = np.stack([rule[0] for rule in rules])
+    product_conditions = np.stack([rule[1] for rule in rules])
+    weights = np.array([rule[2] for rule in rules], dtype=np.float64)
+    
+    # 고객별 조건 조합을 비트 코드로 만들고 고유 조합만 남김 (규칙 수가 적어 조합 수는 고객 수보다 훨씬 작음)
+    bits = np.arange(len(rules), dtype=np.int64)
+    codes = (np.int64(1) << bits) @ customer_conditions
+    unique_codes, inverse = np.unique(codes, return_inverse=True)
+    unique_conditions = ((unique_codes[None, :] >> bits[:, None]) & 1).astype(bool)
+    
+    return _score_table(unique_conditions, product_conditions, weights)[inverse]
+
+def _top_n_positions(scores: np.ndarray, top_n: int) -> np.ndarray:
+    """
+    행별 점수 상위 N개 위치를 내림차순으로 반환 (argpartition으로 후보만 고른 뒤 후보만 정렬)
+    
+    Args:
+        scores: (고객 수, 상품 수) 점수 행렬
+        top_n: 추천할 상품 수
+        
+    Returns:
+        np.ndarray: (고객 수, N) 상품 위치 배열 (같은 점수면 뒤쪽 상품 우선)
+    """
+    n_products = scores.shape[1]
+    if top_n <= 0 or top_n >= n_products:
+        # 전체 상품을 반환하는 경우는 전체 정렬
+        return np.argsort(scores, axis=1, kind='stable')[:, -top_n:][:, ::-1]
+    
+    candidates = np.argpartition(scores, n_products - top_n, axis=1)[:, -top_n:]
+    candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+    order = np.lexsort((-candidates, -candidate_scores), axis=-1)
+    return np.take_along_axis(candidates, order, axis=1)
+
 class FinancialRecommender:
     """금융 상품 추천 엔진 클래스"""
     
-    def __init__(self, model_dir: str = "models", product_db_path: str = "data/financial_products.csv"):
+    def __init__(
+        self, 
+        model_dir: str = "models", 
+        product_db_path: str = "data/financial_products.csv",
+        preload_models: Optional[List[Tuple[str, str]]] = None
+    ):
         """
         금융 상품 추천 엔진 초기화
         
         Args:
             model_dir: 모델 디렉토리 경로
             product_db_path: 금융 상품 데이터베이스 경로
+            preload_models: 초기화 시 미리 로드할 (상품 유형, 모델 유형) 목록 (나머지 모델은 처음 요청될 때 로드)
         """
         self.model_dir = model_dir
         self.product_db_path = product_db_path
-        self.models = {}
+        
+        # 모델 키 -> 모델 정보 (LRU 순서, 캐시 조회/갱신만 잠금 안에서 수행)
+        self.models: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._model_lock = threading.RLock()
+        
+        # 모델 키 -> 로드 잠금 (같은 모델의 중복 로드만 막고, 다른 모델 조회/로드는 막지 않음)
+        self._load_locks: Dict[str, threading.Lock] = {}
+        
         self.products = self._load_products()
         
+        # (상품 유형 조합, 모델 유형) -> 합친 특성 컬럼 목록과 모델별 열 위치
+        self._feature_layouts: Dict[Tuple[Tuple[str, ...], str], Tuple[List[str], Dict[str, np.ndarray]]] = {}
+        
+        # 상품 유형별 점수 계산용 조건 마스크 (상품 로드 시 한 번만 계산)
+        self.product_masks = {
+            product_type: self._build_product_masks(product_type, products_df)
+            for product_type, products_df in self.products.items()
+        }
+        
+        # 상품 유형별 컬럼 배열 (컬럼 이름 -> NumPy 배열, 추천 결과 조립 시 데이터프레임 행 접근 생략)
+        self._product_arrays: Dict[str, Dict[str, np.ndarray]] = {
+            product_type: {column: products_df[column].to_numpy() for column in products_df.columns}
+            for product_type, products_df in self.products.items()
+        }
+        
+        # 자주 쓰는 모델은 첫 요청 지연을 줄이도록 미리 로드
+        for product_type, model_type in preload_models or []:
+            self.load_model(product_type, model_type)
+        
     def _load_products(self) -> Dict[str, pd.DataFrame]:
         """
         금융 상품 데이터 로드
@@ -40,7 +201,12 @@ class FinancialRecommender:
         try:
             # 상품 데이터베이스 로드
             if os.path.exists(self.product_db_path):
-                df = pd.read_csv(self.product_db_path)
+                df = self._read_product_db()
+                
+                # 숫자 컬럼은 로드 시 한 번만 변환 (변환할 수 없는 값은 NaN)
+                for column in _NUMERIC_PRODUCT_COLUMNS:
+                    if column in df.columns:
+                        df[column] = pd.to_numeric(df[column], errors='coerce').astype(float)
                 
                 # 상품 유형별로 분류
                 products = {}
@@ -73,6 +239,35 @@ class FinancialRecommender:
             logger.error(f"상품 데이터 로드 중 오류 발생: {str(e)}")
             return {}
     
+    def _read_product_db(self) -> pd.DataFrame:
+        """
+        상품 데이터베이스 CSV 읽기 (파싱 결과는 Parquet 캐시에 저장해 CSV가 바뀌지 않으면 다음 로드부터 재사용)
+        
+        Returns:
+            pd.DataFrame: 상품 데이터프레임
+        """
+        # 파일 경로, 수정 시각, 크기로 캐시 파일 결정
+        stat = os.stat(self.product_db_path)
+        cache_key = (os.path.abspath(self.product_db_path), stat.st_mtime_ns, stat.st_size)
+        digest = hashlib.sha1(repr(cache_key).encode()).hexdigest()
+        cache_path = os.path.join(os.path.dirname(self.product_db_path), FILE_CACHE_DIR, f"products_{digest}.parquet")
+        
+        if os.path.exists(cache_path):
+            try:
+                return pd.read_parquet(cache_path, engine='pyarrow')
+            except Exception as e:
+                logger.warning(f"상품 Parquet 캐시 로드 중 오류 발생: {cache_path}, {str(e)}")
+        
+        df = pd.read_csv(self.product_db_path)
+        
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            df.to_parquet(cache_path, engine='pyarrow', compression='zstd')
+        except Exception as e:
+            logger.warning(f"상품 Parquet 캐시 저장 중 오류 발생: {cache_path}, {str(e)}")
+        
+        return df
+    
     def load_model(self, product_type: str, model_type: str = 'lightgbm') -> bool:
         """
         추천 모델 로드
@@ -84,23 +279,83 @@ class FinancialRecommender:
         Returns:
             bool: 모델 로드 성공 여부
         """
+        return self._load_model_info(product_type, model_type) is not None
+    
+    def _load_model_info(self, product_type: str, model_type: str) -> Optional[Dict[str, Any]]:
+        """
+        모델 파일을 로드해 캐시에 추가 (파일 로드는 잠금 밖에서 수행)
+        
+        Args:
+            product_type: 상품 유형
+            model_type: 모델 유형
+            
+        Returns:
+            Optional[Dict[str, Any]]: 로드한 모델 정보 (실패 시 None)
+        """
         model_key = f"{product_type}_{model_type}"
         model_path = os.path.join(self.model_dir, f"{model_key}.joblib")
         
         try:
             if os.path.exists(model_path):
-                # 모델 로드
-                model_info = joblib.load(model_path)
-                self.models[model_key] = model_info
+                # 모델 로드 (LightGBM/XGBoost는 네이티브 부스터 파일에서 복원)
+                model_info = load_model_info(self.model_dir, model_key)
+                
+                with self._model_lock:
+                    self.models[model_key] = model_info
+                    self.models.move_to_end(model_key)
+                    while len(self.models) > _MODEL_CACHE_SIZE:
+                        self.models.popitem(last=False)
+                    self._feature_layouts.clear()
+                
                 logger.info(f"모델 로드 성공: {model_path}")
-                return True
+                return model_info
             else:
                 logger.warning(f"모델 파일이 존재하지 않습니다: {model_path}")
-                return False
+                return None
                 
         except Exception as e:
             logger.error(f"모델 로드 중 오류 발생: {str(e)}")
-            return False
+            return None
+    
+    def _cached_model(self, model_key: str) -> Optional[Dict[str, Any]]:
+        """캐시된 모델 정보 조회 (있으면 LRU 순서 갱신)"""
+        with self._model_lock:
+            model_info = self.models.get(model_key)
+            if model_info is not None:
+                self.models.move_to_end(model_key)
+            return model_info
+    
+    def get_model(self, product_type: str, model_type: str = 'lightgbm') -> Optional[Dict[str, Any]]:
+        """
+        추천 모델 조회 (로드되지 않은 모델은 처음 요청될 때 로드)
+        
+        캐시 조회는 짧게 잠금을 잡고, 파일 로드는 모델별 로드 잠금 안에서만 수행하므로
+        한 모델을 로드하는 동안에도 다른 모델의 캐시 조회와 로드가 막히지 않습니다.
+        모델 객체는 예측 시 상태를 바꾸지 않으므로 별도의 예측기 풀 없이 요청 간에 공유합니다.
+        
+        Args:
+            product_type: 상품 유형 ('deposit', 'fund', 'loan')
+            model_type: 모델 유형 ('lightgbm', 'xgboost', 'random_forest', 'gradient_boosting', 'logistic_regression')
+            
+        Returns:
+            Optional[Dict[str, Any]]: 모델 정보 (로드할 수 없으면 None)
+        """
+        model_key = f"{product_type}_{model_type}"
+        
+        model_info = self._cached_model(model_key)
+        if model_info is not None:
+            return model_info
+        
+        with self._model_lock:
+            load_lock = self._load_locks.setdefault(model_key, threading.Lock())
+        
+        # 같은 모델을 기다린 요청은 먼저 로드한 결과를 재사용
+        with load_lock:
+            model_info = self._cached_model(model_key)
+            if model_info is None:
+                model_info = self._load_model_info(product_type, model_type)
+        
+        return model_info
     
     def recommend_products(
         self, 
@@ -123,288 +378,490 @@ class FinancialRecommender:
         Returns:
             List[Dict[str, Any]]: 추천 상품 목록
         """
-        model_key = f"{product_type}_{model_type}"
+        return self.recommend_all(
+            customer_data, product_types=(product_type,), model_type=model_type, top_n=top_n, threshold=threshold
+        )[product_type]
+    
+    def recommend_all(
+        self, 
+        customer_data: pd.DataFrame, 
+        product_types: Tuple[str, ...] = ('deposit', 'loan', 'fund'), 
+        model_type: str = 'lightgbm',
+        top_n: int = 5,
+        threshold: float = 0.5
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        같은 고객 배치에 여러 상품 유형을 한 번에 추천
         
-        # 모델이 로드되어 있지 않으면 로드
-        if model_key not in self.models:
-            if not self.load_model(product_type, model_type):
-                logger.error(f"모델을 로드할 수 없습니다: {model_key}")
-                return []
+        모든 모델의 특성을 합친 컬럼을 float32 행렬로 한 번만 변환하고 모델마다 필요한 열만 잘라 예측합니다.
         
-        model_info = self.models[model_key]
-        model = model_info['model']
-        feature_names = model_info['feature_names']
+        Args:
+            customer_data: 고객 데이터
+            product_types: 상품 유형 목록
+            model_type: 모델 유형 ('lightgbm', 'xgboost', 'random_forest', 'gradient_boosting', 'logistic_regression')
+            top_n: 추천할 상품 수
+            threshold: 추천 확률 임계값
+            
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: 상품 유형별 추천 상품 목록 (상품이 없거나 모델을 로드할 수 없으면 빈 목록)
+        """
+        recommendations = {product_type: [] for product_type in product_types}
         
-        # 고객 데이터에서 모델에 필요한 특성만 선택
-        customer_features = customer_data[feature_names].copy()
+        # 모델이 로드되어 있지 않으면 로드 (상품이 없는 유형은 모델 로드와 예측을 모두 생략)
+        model_infos = {}
+        for product_type in product_types:
+            if product_type not in self.products:
+                logger.warning(f"상품 데이터베이스에 '{product_type}' 유형의 상품이 없습니다.")
+                continue
+            
+            model_info = self.get_model(product_type, model_type)
+            if model_info is None:
+                logger.error(f"모델을 로드할 수 없습니다: {product_type}_{model_type}")
+                continue
+            model_infos[product_type] = model_info
+        
+        if not model_infos:
+            return recommendations
+        
+        # 특성 행렬은 한 번만 변환하고 모델별 열 위치는 캐시에서 재사용
+        feature_columns, feature_positions = self._feature_layout(model_infos, model_type)
+        feature_matrix = customer_data.loc[:, feature_columns].to_numpy(dtype=np.float32, na_value=np.nan)
+        
+        for product_type, model_info in model_infos.items():
+            customer_features = feature_matrix[:, feature_positions[product_type]]
+            
+            # 예측 확률 계산
+            proba = self._predict_proba(model_info['model'], customer_features, model_info['feature_names'])
+            
+            recommendations[product_type] = self._recommend_for_proba(
+                customer_data, proba, product_type, top_n, threshold
+            )
+        
+        return recommendations
+    
+    def _feature_layout(
+        self, 
+        model_infos: Dict[str, Dict[str, Any]], 
+        model_type: str
+    ) -> Tuple[List[str], Dict[str, np.ndarray]]:
+        """
+        여러 모델의 특성 이름을 합친 컬럼 목록과 모델별 열 위치 (상품 유형 조합별로 캐시)
+        
+        Args:
+            model_infos: 상품 유형별 모델 정보
+            model_type: 모델 유형
+            
+        Returns:
+            Tuple[List[str], Dict[str, np.ndarray]]: 합친 특성 컬럼 목록, 상품 유형별 열 위치
+        """
+        layout_key = (tuple(model_infos), model_type)
+        layout = self._feature_layouts.get(layout_key)
+        if layout is None:
+            feature_names = {
+                product_type: model_info['feature_names']
+                for product_type, model_info in model_infos.items()
+            }
+            columns = list(dict.fromkeys(name for names in feature_names.values() for name in names))
+            column_index = {name: i for i, name in enumerate(columns)}
+            positions = {
+                product_type: np.array([column_index[name] for name in names], dtype=np.intp)
+                for product_type, names in feature_names.items()
+            }
+            layout = (columns, positions)
+            self._feature_layouts[layout_key] = layout
+        return layout
+    
+    def _predict_proba(self, model: Any, customer_features: np.ndarray, feature_names: List[str]) -> np.ndarray:
+        """
+        특성 행렬로 양성 클래스 확률 예측
+        
+        Args:
+            model: 추천 모델
+            customer_features: (고객 수, 특성 수) float32 특성 행렬 (모델 특성 순서)
+            feature_names: 모델 특성 이름
+            
+        Returns:
+            np.ndarray: 고객별 예측 확률
+        """
+        # 특성 이름으로 학습된 scikit-learn 모델은 같은 이름의 데이터프레임으로 감싸 전달 (복사 없음)
+        if hasattr(model, 'feature_names_in_'):
+            customer_features = pd.DataFrame(customer_features, columns=feature_names, copy=False)
         
-        # 예측 확률 계산
         if hasattr(model, 'predict_proba'):
-            proba = model.predict_proba(customer_features)[:, 1]
-        else:
-            # predict_proba가 없는 경우 predict 결과 사용
-            proba = model.predict(customer_features)
+            return model.predict_proba(customer_features)[:, 1]
         
-        # 임계값 이상인 고객만 선택
-        eligible_customers = customer_data[proba >= threshold].copy()
-        eligible_proba = proba[proba >= threshold]
+        # predict_proba가 없는 경우 predict 결과 사용
+        return model.predict(customer_features)
+    
+    def _recommend_for_proba(
+        self, 
+        customer_data: pd.DataFrame, 
+        proba: np.ndarray, 
+        product_type: str, 
+        top_n: int, 
+        threshold: float
+    ) -> List[Dict[str, Any]]:
+        """
+        예측 확률이 임계값 이상인 고객에게 상위 N개 상품 추천
+        
+        Args:
+            customer_data: 고객 데이터
+            proba: 고객별 예측 확률
+            product_type: 상품 유형
+            top_n: 추천할 상품 수
+            threshold: 추천 확률 임계값
+            
+        Returns:
+            List[Dict[str, Any]]: 추천 상품 목록
+        """
+        # 임계값 이상인 고객만 선택 (마스크는 한 번만 계산, 전체 컬럼 복사 없이 사용하는 컬럼만 잘라냄)
+        eligible_mask = proba >= threshold
+        used_columns = [column for column in _CUSTOMER_COLUMNS if column in customer_data.columns]
+        eligible_customers = customer_data.loc[eligible_mask, used_columns]
+        eligible_proba = proba[eligible_mask]
         
         if eligible_customers.empty:
             logger.info(f"임계값({threshold}) 이상인 고객이 없습니다.")
             return []
         
-        # 상품 추천
-        recommendations = []
+        products_df = self.products[product_type]
         
-        # 상품 데이터베이스에서 해당 유형의 상품 가져오기
-        if product_type in self.products:
-            products_df = self.products[product_type]
-            
-            # 각 고객에 대해 상품 점수 계산
-            for i, (_, customer) in enumerate(eligible_customers.iterrows()):
-                customer_proba = eligible_proba[i]
-                
-                # 고객 특성에 따른 상품 점수 계산
-                product_scores = self._calculate_product_scores(customer, products_df, product_type)
-                
-                # 최종 점수 = 모델 예측 확률 * 상품 점수
-                final_scores = product_scores * customer_proba
-                
-                # 점수가 높은 상위 N개 상품 선택
-                top_products = products_df.iloc[final_scores.argsort()[-top_n:][::-1]]
-                
-                # 추천 이유 생성
-                for _, product in top_products.iterrows():
-                    recommendation = {
-                        'customer_id': customer.get('member_no', 'unknown'),
-                        'product_id': product.get('상품코드', 'unknown'),
-                        'product_name': product.get('상품명', 'unknown'),
-                        'product_type': product_type,
-                        'score': float(final_scores.loc[product.name]),
-                        'probability': float(customer_proba),
-                        'reasons': self._generate_recommendation_reasons(customer, product, product_type)
-                    }
-                    recommendations.append(recommendation)
+        # 고객 x 상품 점수 행렬을 한 번에 계산
+        score_matrix = self._calculate_product_score_matrix(
+            eligible_customers, self.product_masks[product_type], len(products_df), product_type
+        )
+        
+        # 최종 점수 = 모델 예측 확률 * 상품 점수
+        final_scores = score_matrix * eligible_proba[:, None]
+        
+        # 고객별 점수가 높은 상위 N개 상품 위치
+        top_positions = _top_n_positions(final_scores, top_n)
+        
+        # 상위 상품의 점수/코드/이름을 배열에서 한 번에 추출 (tolist로 파이썬 값 변환)
+        product_arrays = self._product_arrays[product_type]
+        top_scores = np.take_along_axis(final_scores, top_positions, axis=1).tolist()
+        top_ids = self._take_product_values(product_arrays, '상품코드', top_positions)
+        top_names = self._take_product_values(product_arrays, '상품명', top_positions)
+        
+        # 고객 코드/확률/레코드도 배치 단위로 한 번에 변환 (고객별 iterrows 없이 마지막에 결과만 조립)
+        if 'member_no' in eligible_customers.columns:
+            customer_ids = eligible_customers['member_no'].tolist()
         else:
-            logger.warning(f"상품 데이터베이스에 '{product_type}' 유형의 상품이 없습니다.")
+            customer_ids = ['unknown'] * len(eligible_customers)
+        customer_probas = eligible_proba.astype(float).tolist()
+        
+        # 추천 이유 생성 (고객 x 상위 상품 조합 전체를 조건 행렬로 한 번에 계산)
+        top_reasons = self._generate_recommendation_reasons(eligible_customers, products_df, product_type, top_positions)
+        
+        # 고객별 상위 상품 값 목록을 zip으로 묶어 추천 결과 조립 (행 단위 데이터프레임 접근 없음)
+        recommendations = [
+            {
+                'customer_id': customer_id,
+                'product_id': product_id,
+                'product_name': product_name,
+                'product_type': product_type,
+                'score': score,
+                'probability': customer_proba,
+                'reasons': product_reasons
+            }
+            for customer_id, customer_proba, ids, names, scores, reasons in zip(
+                customer_ids, customer_probas, top_ids, top_names, top_scores, top_reasons
+            )
+            for product_id, product_name, score, product_reasons in zip(ids, names, scores, reasons)
+        ]
         
         return recommendations
     
-    def _calculate_product_scores(
+    def _take_product_values(
         self, 
-        customer: pd.Series, 
-        products_df: pd.DataFrame, 
-        product_type: str
-    ) -> pd.Series:
+        product_arrays: Dict[str, np.ndarray], 
+        column: str, 
+        positions: np.ndarray
+    ) -> List[List[Any]]:
+        """
+        상품 컬럼 배열에서 고객별 상위 상품 위치의 값 추출
+        
+        Args:
+            product_arrays: 상품 컬럼 배열
+            column: 컬럼 이름
+            positions: (고객 수, N) 상품 위치 배열
+            
+        Returns:
+            List[List[Any]]: 고객별 상품 값 목록 (컬럼이 없으면 'unknown')
         """
-        고객 특성에 따른 상품 점수 계산
+        if column not in product_arrays:
+            return np.full(positions.shape, 'unknown', dtype=object).tolist()
+        return np.take(product_arrays[column], positions).tolist()
+    
+    def _build_product_masks(self, product_type: str, products_df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        점수 계산에 쓰는 상품 조건 마스크를 상품 로드 시 한 번만 계산 (정규식/형 변환을 추천 요청마다 반복하지 않음)
         
         Args:
-            customer: 고객 데이터
+            product_type: 상품 유형
             products_df: 상품 데이터프레임
+            
+        Returns:
+            Dict[str, np.ndarray]: 조건 이름 -> 상품별 bool 배열 (필요한 컬럼이 없는 조건은 제외)
+        """
+        masks = {}
+        columns = products_df.columns
+        
+        if product_type == 'deposit':
+            if '최고금리' in columns:
+                masks['high_rate'] = (products_df['최고금리'] > products_df['최고금리'].median()).to_numpy()
+            if '계약기간개월수_최대구간' in columns:
+                masks['short_term'] = (products_df['계약기간개월수_최대구간'] <= 12).to_numpy()
+            if '가입금액_최소구간' in columns:
+                masks['high_min_amount'] = (products_df['가입금액_최소구간'] > 1000000).to_numpy()
+            if '상품명' in columns:
+                masks['premium'] = products_df['상품명'].str.contains('프리미엄|VIP|골드|플래티넘', case=False, na=False).to_numpy(dtype=bool)
+        
+        elif product_type == 'loan':
+            if '기본금리' in columns:
+                masks['low_rate'] = (products_df['기본금리'] < products_df['기본금리'].median()).to_numpy()
+            if '대출기간' in columns:
+                masks['short_term'] = products_df['대출기간'].astype(str).str.contains('1년|12개월', case=False).to_numpy(dtype=bool)
+        
+        elif product_type == 'fund':
+            if '펀드유형' in columns:
+                masks['stock'] = products_df['펀드유형'].str.contains('주식형|혼합형', case=False, na=False).to_numpy(dtype=bool)
+                masks['bond'] = products_df['펀드유형'].str.contains('채권형|MMF', case=False, na=False).to_numpy(dtype=bool)
+            if '위험등급' in columns:
+                risk_grade = products_df['위험등급'].astype(str)
+                masks['high_risk'] = risk_grade.str.contains('1등급|2등급', case=False).to_numpy(dtype=bool)
+                masks['low_risk'] = risk_grade.str.contains('4등급|5등급', case=False).to_numpy(dtype=bool)
+        
+        return masks
+    
+    def _calculate_product_score_matrix(
+        self, 
+        customers: pd.DataFrame, 
+        product_masks: Dict[str, np.ndarray], 
+        n_products: int,
+        product_type: str
+    ) -> np.ndarray:
+        """
+        고객 특성에 따른 상품 점수 행렬 계산
+        
+        점수 규칙을 (고객 조건, 상품 조건, 가산점) 목록으로 만든 뒤 한 번에 평가
+        (큰 행렬은 numba 커널로 셀마다 한 번에 누적, 그 외에는 NumPy 브로드캐스트)
+        
+        Args:
+            customers: 고객 데이터프레임
+            product_masks: 상품 조건 마스크 (_build_product_masks 결과)
+            n_products: 상품 수
             product_type: 상품 유형
             
         Returns:
-            pd.Series: 상품별 점수
+            np.ndarray: (고객 수, 상품 수) 점수 행렬
         """
-        scores = pd.Series(0.5, index=products_df.index)  # 기본 점수 0.5
+        rules = []
+        customer_columns = customers.columns
         
         if product_type == 'deposit':
             # 예금 상품 점수 계산
             
             # 1. 금융 건강 점수에 따른 점수 조정
-            if 'financial_health_score' in customer:
-                health_score = customer['financial_health_score']
+            if 'financial_health_score' in customer_columns:
+                health_score = _customer_values(customers, 'financial_health_score')
                 
                 # 금융 건강 점수가 높은 고객에게는 고금리 상품 추천
-                if '최고금리' in products_df.columns:
-                    high_rate_products = products_df['최고금리'] > products_df['최고금리'].median()
-                    if health_score > 70:
-                        scores.loc[high_rate_products] += 0.2
-                    elif health_score < 40:
-                        scores.loc[~high_rate_products] += 0.1
+                if 'high_rate' in product_masks:
+                    high_rate_products = product_masks['high_rate']
+                    rules.append((health_score > 70, high_rate_products, 0.2))
+                    rules.append((health_score < 40, ~high_rate_products, 0.1))
                 
                 # 금융 건강 점수가 낮은 고객에게는 단기 상품 추천
-                if '계약기간개월수_최대구간' in products_df.columns:
-                    short_term_products = products_df['계약기간개월수_최대구간'].astype(float) <= 12
-                    if health_score < 40:
-                        scores.loc[short_term_products] += 0.2
-                    elif health_score > 70:
-                        scores.loc[~short_term_products] += 0.1
+                if 'short_term' in product_masks:
+                    short_term_products = product_masks['short_term']
+                    rules.append((health_score < 40, short_term_products, 0.2))
+                    rules.append((health_score > 70, ~short_term_products, 0.1))
             
             # 2. 잔액에 따른 점수 조정
-            if 'bal_B0M' in customer:
-                balance = customer['bal_B0M']
+            if 'bal_B0M' in customer_columns:
+                balance = _customer_values(customers, 'bal_B0M')
                 
-                if '가입금액_최소구간' in products_df.columns:
+                if 'high_min_amount' in product_masks:
                     # 잔액이 많은 고객에게는 최소 가입금액이 높은 상품 추천
-                    high_min_amount_products = products_df['가입금액_최소구간'].astype(float) > 1000000
-                    if balance > 10000000:
-                        scores.loc[high_min_amount_products] += 0.2
-                    elif balance < 1000000:
-                        scores.loc[~high_min_amount_products] += 0.2
+                    high_min_amount_products = product_masks['high_min_amount']
+                    rules.append((balance > 10000000, high_min_amount_products, 0.2))
+                    rules.append((balance < 1000000, ~high_min_amount_products, 0.2))
             
             # 3. VIP 등급에 따른 점수 조정
-            if 'vip_score' in customer:
-                vip_score = customer['vip_score']
+            if 'vip_score' in customer_columns:
+                vip_score = _customer_values(customers, 'vip_score')
                 
                 # VIP 고객에게는 프리미엄 상품 추천
-                if '상품명' in products_df.columns:
-                    premium_products = products_df['상품명'].str.contains('프리미엄|VIP|골드|플래티넘', case=False)
-                    if vip_score > 7:
-                        scores.loc[premium_products] += 0.3
+                if 'premium' in product_masks:
+                    rules.append((vip_score > 7, product_masks['premium'], 0.3))
         
         elif product_type == 'loan':
             # 대출 상품 점수 계산
             
             # 1. 신용 리스크 점수에 따른 점수 조정
-            if 'credit_risk_score' in customer:
-                risk_score = customer['credit_risk_score']
+            if 'credit_risk_score' in customer_columns:
+                risk_score = _customer_values(customers, 'credit_risk_score')
                 
                 # 리스크가 낮은 고객에게는 저금리 상품 추천
-                if '기본금리' in products_df.columns:
-                    low_rate_products = products_df['기본금리'] < products_df['기본금리'].median()
-                    if risk_score < 0.3:
-                        scores.loc[low_rate_products] += 0.2
-                    elif risk_score > 0.7:
-                        scores.loc[~low_rate_products] += 0.1
+                if 'low_rate' in product_masks:
+                    low_rate_products = product_masks['low_rate']
+                    rules.append((risk_score < 0.3, low_rate_products, 0.2))
+                    rules.append((risk_score > 0.7, ~low_rate_products, 0.1))
             
             # 2. 현금서비스 선호도에 따른 점수 조정
-            if 'cash_advance_preference' in customer:
-                ca_pref = customer['cash_advance_preference']
+            if 'cash_advance_preference' in customer_columns:
+                ca_pref = _customer_values(customers, 'cash_advance_preference')
                 
                 # 현금서비스 선호도가 높은 고객에게는 단기 대출 상품 추천
-                if '대출기간' in products_df.columns:
-                    short_term_loans = products_df['대출기간'].astype(str).str.contains('1년|12개월', case=False)
-                    if ca_pref > 0.5:
-                        scores.loc[short_term_loans] += 0.2
+                if 'short_term' in product_masks:
+                    rules.append((ca_pref > 0.5, product_masks['short_term'], 0.2))
         
         elif product_type == 'fund':
             # 펀드 상품 점수 계산
             
             # 1. 금융 건강 점수에 따른 점수 조정
-            if 'financial_health_score' in customer:
-                health_score = customer['financial_health_score']
+            if 'financial_health_score' in customer_columns:
+                health_score = _customer_values(customers, 'financial_health_score')
                 
                 # 금융 건강 점수가 높은 고객에게는 주식형 펀드 추천
-                if '펀드유형' in products_df.columns:
-                    stock_funds = products_df['펀드유형'].str.contains('주식형|혼합형', case=False)
-                    bond_funds = products_df['펀드유형'].str.contains('채권형|MMF', case=False)
-                    
-                    if health_score > 70:
-                        scores.loc[stock_funds] += 0.3
-                    elif health_score < 40:
-                        scores.loc[bond_funds] += 0.3
+                if 'stock' in product_masks:
+                    rules.append((health_score > 70, product_masks['stock'], 0.3))
+                    rules.append((health_score < 40, product_masks['bond'], 0.3))
             
             # 2. 나이에 따른 점수 조정
-            if 'age' in customer:
-                age = int(customer['age'])
+            if 'age' in customer_columns:
+                # 나이는 정수로 내림해 비교
+                age = np.trunc(_customer_values(customers, 'age'))
                 
                 # 젊은 고객에게는 공격적인 펀드, 고령 고객에게는 안정적인 펀드 추천
-                if '위험등급' in products_df.columns:
-                    high_risk_funds = products_df['위험등급'].astype(str).str.contains('1등급|2등급', case=False)
-                    low_risk_funds = products_df['위험등급'].astype(str).str.contains('4등급|5등급', case=False)
-                    
-                    if age < 40:
-                        scores.loc[high_risk_funds] += 0.2
-                    elif age > 60:
-                        scores.loc[low_risk_funds] += 0.3
+                if 'high_risk' in product_masks:
+                    rules.append((age < 40, product_masks['high_risk'], 0.2))
+                    rules.append((age > 60, product_masks['low_risk'], 0.3))
         
-        return scores
+        return _apply_score_rules(rules, len(customers), n_products)
     
     def _generate_recommendation_reasons(
         self, 
-        customer: pd.Series, 
-        product: pd.Series, 
-        product_type: str
-    ) -> List[str]:
+        customers: pd.DataFrame, 
+        products_df: pd.DataFrame, 
+        product_type: str,
+        top_positions: np.ndarray
+    ) -> List[List[List[str]]]:
         """
         추천 이유 생성
         
+        이유 규칙마다 (고객 수, N) 조건 행렬을 만들고, 충족한 규칙 조합과 상품이 같은 칸은 같은 이유 목록을 공유하도록
+        조합별로 한 번만 문자열을 조립합니다.
+        
         Args:
-            customer: 고객 데이터
-            product: 상품 데이터
+            customers: 추천 대상 고객 데이터프레임
+            products_df: 상품 데이터프레임
             product_type: 상품 유형
+            top_positions: (고객 수, N) 고객별 상위 상품 위치 배열
             
         Returns:
-            List[str]: 추천 이유 목록
+            List[List[List[str]]]: 고객별, 상위 상품별 추천 이유 목록
         """
-        reasons = []
+        # (조건 행렬, 이유) 목록 - 이유는 고정 문자열 또는 상품 위치별 문자열 배열, 목록 순서가 이유 순서
+        rules = []
+        customer_columns = customers.columns
+        product_columns = products_df.columns
+        
+        def add_rule(customer_condition, product_condition, reason):
+            condition = customer_condition[:, None]
+            if product_condition is not None:
+                condition = condition & product_condition[top_positions]
+            rules.append((np.broadcast_to(condition, top_positions.shape), reason))
         
         if product_type == 'deposit':
             # 예금 상품 추천 이유
             
             # 1. 금융 건강 점수 관련 이유
-            if 'financial_health_score' in customer:
-                health_score = customer['financial_health_score']
+            if 'financial_health_score' in customer_columns:
+                health_score = _customer_values(customers, 'financial_health_score')
                 
-                if health_score > 70:
-                    if '최고금리' in product and product['최고금리'] > 2.5:
-                        reasons.append(f"고객님의 우수한 금융 건강 상태에 적합한 고금리({product['최고금리']}%) 상품입니다.")
-                elif health_score < 40:
-                    if '계약기간개월수_최대구간' in product and float(product['계약기간개월수_최대구간']) <= 12:
-                        reasons.append("단기 저축으로 유동성을 확보하면서 금융 건강을 개선할 수 있는 상품입니다.")
+                if '최고금리' in product_columns:
+                    max_rate = products_df['최고금리'].to_numpy()
+                    add_rule(health_score > 70, max_rate > 2.5, np.array(
+                        [f"고객님의 우수한 금융 건강 상태에 적합한 고금리({rate}%) 상품입니다." for rate in max_rate], dtype=object
+                    ))
+                if '계약기간개월수_최대구간' in product_columns:
+                    add_rule(health_score < 40, (products_df['계약기간개월수_최대구간'] <= 12).to_numpy(),
+                             "단기 저축으로 유동성을 확보하면서 금융 건강을 개선할 수 있는 상품입니다.")
             
             # 2. 잔액 관련 이유
-            if 'bal_B0M' in customer:
-                balance = customer['bal_B0M']
+            if 'bal_B0M' in customer_columns and '가입금액_최소구간' in product_columns:
+                balance = _customer_values(customers, 'bal_B0M')
+                min_amount = products_df['가입금액_최소구간']
                 
-                if '가입금액_최소구간' in product:
-                    min_amount = float(product['가입금액_최소구간'])
-                    if balance > 10000000 and min_amount > 1000000:
-                        reasons.append("고객님의 잔액 수준에 적합한 고액 예금 상품입니다.")
-                    elif balance < 1000000 and min_amount < 100000:
-                        reasons.append("소액으로 시작할 수 있는 부담 없는 예금 상품입니다.")
+                add_rule(balance > 10000000, (min_amount > 1000000).to_numpy(), "고객님의 잔액 수준에 적합한 고액 예금 상품입니다.")
+                add_rule(balance < 1000000, (min_amount < 100000).to_numpy(), "소액으로 시작할 수 있는 부담 없는 예금 상품입니다.")
             
             # 3. VIP 등급 관련 이유
-            if 'vip_score' in customer:
-                vip_score = customer['vip_score']
-                
-                if vip_score > 7 and '상품명' in product and any(keyword in product['상품명'] for keyword in ['프리미엄', 'VIP', '골드', '플래티넘']):
-                    reasons.append("고객님의 VIP 등급에 맞는 프리미엄 예금 상품입니다.")
+            if 'vip_score' in customer_columns and '상품명' in product_columns:
+                premium = products_df['상품명'].str.contains('프리미엄|VIP|골드|플래티넘', na=False).to_numpy(dtype=bool)
+                add_rule(_customer_values(customers, 'vip_score') > 7, premium, "고객님의 VIP 등급에 맞는 프리미엄 예금 상품입니다.")
         
         elif product_type == 'loan':
             # 대출 상품 추천 이유
             
             # 1. 신용 리스크 관련 이유
-            if 'credit_risk_score' in customer:
-                risk_score = customer['credit_risk_score']
+            if 'credit_risk_score' in customer_columns:
+                risk_score = _customer_values(customers, 'credit_risk_score')
                 
-                if risk_score < 0.3 and '기본금리' in product and product['기본금리'] < 5:
-                    reasons.append(f"고객님의 우수한 신용 상태에 적합한 저금리({product['기본금리']}%) 대출 상품입니다.")
-                elif risk_score > 0.7:
-                    reasons.append("신용 개선에 도움이 될 수 있는 대출 상품입니다.")
+                if '기본금리' in product_columns:
+                    base_rate = products_df['기본금리'].to_numpy()
+                    add_rule(risk_score < 0.3, base_rate < 5, np.array(
+                        [f"고객님의 우수한 신용 상태에 적합한 저금리({rate}%) 대출 상품입니다." for rate in base_rate], dtype=object
+                    ))
+                add_rule(risk_score > 0.7, None, "신용 개선에 도움이 될 수 있는 대출 상품입니다.")
             
             # 2. 현금서비스 선호도 관련 이유
-            if 'cash_advance_preference' in customer:
-                ca_pref = customer['cash_advance_preference']
-                
-                if ca_pref > 0.5 and '대출기간' in product and '1년' in str(product['대출기간']):
-                    reasons.append("단기 자금 필요 시 현금서비스보다 유리한 금리 조건의 대출 상품입니다.")
+            if 'cash_advance_preference' in customer_columns and '대출기간' in product_columns:
+                one_year = products_df['대출기간'].astype(str).str.contains('1년', regex=False).to_numpy(dtype=bool)
+                add_rule(_customer_values(customers, 'cash_advance_preference') > 0.5, one_year,
+                         "단기 자금 필요 시 현금서비스보다 유리한 금리 조건의 대출 상품입니다.")
         
         elif product_type == 'fund':
             # 펀드 상품 추천 이유
             
             # 1. 금융 건강 점수 관련 이유
-            if 'financial_health_score' in customer:
-                health_score = customer['financial_health_score']
+            if 'financial_health_score' in customer_columns and '펀드유형' in product_columns:
+                health_score = _customer_values(customers, 'financial_health_score')
+                fund_type = products_df['펀드유형']
                 
-                if health_score > 70 and '펀드유형' in product and '주식형' in product['펀드유형']:
-                    reasons.append("고객님의 우수한 금융 상태에 적합한 성장형 펀드 상품입니다.")
-                elif health_score < 40 and '펀드유형' in product and '채권형' in product['펀드유형']:
-                    reasons.append("안정적인 수익을 추구하는 저위험 펀드 상품입니다.")
+                add_rule(health_score > 70, fund_type.str.contains('주식형', regex=False, na=False).to_numpy(dtype=bool),
+                         "고객님의 우수한 금융 상태에 적합한 성장형 펀드 상품입니다.")
+                add_rule(health_score < 40, fund_type.str.contains('채권형', regex=False, na=False).to_numpy(dtype=bool),
+                         "안정적인 수익을 추구하는 저위험 펀드 상품입니다.")
             
-            # 2. 나이 관련 이유
-            if 'age' in customer:
-                age = int(customer['age'])
+            # 2. 나이 관련 이유 (나이는 정수로 내림해 비교)
+            if 'age' in customer_columns and '위험등급' in product_columns:
+                age = np.trunc(_customer_values(customers, 'age'))
+                risk_grade = products_df['위험등급']
                 
-                if age < 40 and '위험등급' in product and product['위험등급'] in ['1등급', '2등급']:
-                    reasons.append("장기 투자를 통한 높은 수익을 기대할 수 있는 펀드 상품입니다.")
-                elif age > 60 and '위험등급' in product and product['위험등급'] in ['4등급', '5등급']:
-                    reasons.append("원금 보존을 중시하는 안정적인 펀드 상품입니다.")
+                add_rule(age < 40, risk_grade.isin(['1등급', '2등급']).to_numpy(),
+                         "장기 투자를 통한 높은 수익을 기대할 수 있는 펀드 상품입니다.")
+                add_rule(age > 60, risk_grade.isin(['4등급', '5등급']).to_numpy(),
+                         "원금 보존을 중시하는 안정적인 펀드 상품입니다.")
+        
+        # 칸마다 충족한 규칙을 비트로 표시하고 (규칙 조합, 상품 위치)가 같은 칸은 이유 목록을 한 번만 조립
+        n_products = len(products_df)
+        codes = np.zeros(top_positions.shape, dtype=np.int64)
+        for bit, (condition, _) in enumerate(rules):
+            codes |= condition.astype(np.int64) << bit
+        unique_keys, inverse = np.unique(codes * n_products + top_positions, return_inverse=True)
         
-        # 공통 이유 (상품 유형에 관계없이)
-        if not reasons:
-            reasons.append(f"고객님의 금융 프로필에 적합한 {product_type} 상품입니다.")
+        # 공통 이유 (상품 유형에 관계없이, 충족한 규칙이 없는 경우)
+        default_reasons = [f"고객님의 금융 프로필에 적합한 {product_type} 상품입니다."]
+        reason_table = []
+        for key in unique_keys.tolist():
+            code, position = divmod(key, n_products)
+            reasons = [
+                reason if isinstance(reason, str) else reason[position]
+                for bit, (_, reason) in enumerate(rules) if code >> bit & 1
+            ]
+            reason_table.append(reasons or default_reasons)
         
-        return reasons
+        return [[list(reason_table[index]) for index in row] for row in inverse.reshape(top_positions.shape).tolist()]
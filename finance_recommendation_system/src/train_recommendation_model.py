@@ -40,8 +40,8 @@ def setup_directories():
         os.makedirs(directory, exist_ok=True)
         logger.info(f"디렉토리 생성: {directory}")
 
-def load_and_preprocess_data(data_dir):
-    """데이터 로드 및 전처리"""
+def load_and_preprocess_data(data_dir, model_dir=None):
+    """데이터 로드 및 전처리 (model_dir가 주어지면 학습된 전처리기 저장, 데이터프레임과 범주형 인코더 범주 목록 반환)"""
     logger.info("데이터 로드 및 전처리 시작")
     
     # 데이터 로더 초기화
@@ -53,17 +53,21 @@ def load_and_preprocess_data(data_dir):
     
     if df.empty:
         logger.error("데이터가 비어 있습니다.")
-        return None
+        return None, {}
     
     # 데이터 전처리
-    preprocessor = FinancialDataPreprocessor()
+    # 학습 모델이 모두 트리 기반이므로 스케일링 생략
+    preprocessor = FinancialDataPreprocessor(for_tree_model=True)
     df = preprocessor.preprocess_data(df)
     logger.info(f"데이터 전처리 완료: {df.shape[0]} 행, {df.shape[1]} 열")
     
-    return df
+    if model_dir:
+        preprocessor.save(os.path.join(model_dir, 'preprocessor.joblib'))
+    
+    return df, preprocessor.encoders
 
-def generate_features(df):
-    """특성 생성"""
+def generate_features(df, category_encoders=None):
+    """특성 생성 (category_encoders는 라벨 인코딩된 범주형 코드를 원본 값으로 되돌릴 때 사용)"""
     logger.info("특성 생성 시작")
     
     if df is None or df.empty:
@@ -71,7 +75,7 @@ def generate_features(df):
         return None, []
     
     # 특성 생성기 초기화
-    feature_generator = FinancialFeatureGenerator()
+    feature_generator = FinancialFeatureGenerator(category_encoders=category_encoders)
     
     # 금융 건강 특성 생성
     df = feature_generator.generate_financial_health_features(df)
@@ -118,68 +122,52 @@ def create_target_variables(df, model_trainer):
     
     return targets
 
-def train_models(df, selected_features, targets, model_dir):
-    """모델 학습"""
+def train_models(df, selected_features, targets, model_trainer):
+    """모델 학습 (타겟 변수 생성에 사용한 학습기를 그대로 사용)"""
     logger.info("모델 학습 시작")
     
     if df is None or df.empty or not targets:
         logger.error("모델 학습을 위한 데이터가 없습니다.")
         return {}
     
-    # 모델 학습기 초기화
-    model_trainer = FinancialModelTrainer(model_dir=model_dir)
-    
     # 학습 결과 저장
     results = {}
     
     # 모델 유형
     model_types = ['lightgbm', 'random_forest', 'xgboost']
     
-    # 각 상품 유형별 모델 학습
-    for product_type, target in targets.items():
-        logger.info(f"{product_type} 상품 모델 학습 시작")
-        
-        # 특성 데이터 준비
-        X = df[selected_features].copy()
-        y = target
-        
+    # 특성 데이터 준비 (학습기가 내부적으로 쓰는 float32로 한 번만 변환해 작업 프로세스 전달/튜닝 데이터 크기 절반으로)
+    X = df[selected_features].astype(np.float32)
+    
+    # 기본 모델은 상품 유형 x 모델 유형 조합별로 CPU 코어에 나누어 병렬 학습
+    logger.info(f"기본 모델 병렬 학습 시작: {len(targets)}개 상품 x {len(model_types)}개 모델")
+    trained_models = model_trainer.train_many(X, targets, model_types)
+    
+    # 대표 모델(LightGBM)의 상품 유형별 튜닝과 재학습도 병렬 수행
+    tuned_model_type = 'lightgbm'
+    logger.info(f"{tuned_model_type} 하이퍼파라미터 병렬 튜닝 시작: {len(targets)}개 상품")
+    tuned_models = model_trainer.tune_many(X, targets, model_type=tuned_model_type, cv=5, n_iter=20)
+    
+    # 각 상품 유형별 튜닝 및 결과 정리
+    for product_type in targets:
         product_results = {}
         
-        # 각 모델 유형별 학습
-        for model_type in model_types:
-            logger.info(f"{product_type} {model_type} 모델 학습 시작")
-            
+        # 각 모델 유형별 결과 (학습에 실패한 모델은 제외됨)
+        for model_type, model_info in trained_models[product_type].items():
             try:
-                # 기본 모델 학습
-                model_info = model_trainer.train_model(
-                    X=X,
-                    y=y,
-                    model_type=model_type,
-                    product_type=product_type
-                )
-                
-                # 하이퍼파라미터 튜닝 (선택적)
-                if model_type == 'lightgbm':  # 대표 모델만 튜닝
-                    logger.info(f"{product_type} {model_type} 하이퍼파라미터 튜닝 시작")
-                    tuning_result = model_trainer.tune_hyperparameters(
-                        X=X,
-                        y=y,
-                        model_type=model_type,
-                        cv=5,
-                        n_iter=20
-                    )
-                    
-                    # 튜닝된 파라미터로 모델 재학습
-                    model_info = model_trainer.train_model(
-                        X=X,
-                        y=y,
-                        model_type=model_type,
-                        product_type=product_type,
-                        hyperparams=tuning_result['best_params']
-                    )
+                # 대표 모델은 튜닝된 파라미터로 재학습한 결과 사용 (튜닝에 실패한 상품은 제외)
+                if model_type == tuned_model_type:
+                    if product_type not in tuned_models:
+                        continue
+                    tuning_result = tuned_models[product_type]['tuning_result']
+                    model_info = tuned_models[product_type]['model_info']
                     
                     logger.info(f"{product_type} {model_type} 튜닝 완료: {tuning_result['best_score']:.4f}")
                 
+                # 최종 LightGBM/XGBoost 모델은 추천 시 예측 지연을 줄이도록 Treelite로 컴파일
+                if model_type in ('lightgbm', 'xgboost'):
+                    model_trainer.compile_model(f"{product_type}_{model_type}")
+                
                 # 모델 성능 출력
                 metrics = model_info['metrics']
                 logger.info(f"{product_type} {model_type} 모델 성능:")
@@ -188,7 +176,8 @@ def train_models(df, selected_features, targets, model_dir):
                 
                 # 특성 중요도 출력
                 importances = model_info['feature_importances']
-                top_features = sorted(importances.items(), key=lambda x: x[1], reverse=True)[:10]
+                top_idx = np.argsort(-importances['values'], kind='stable')[:10]
+                top_features = [(importances['names'][i], float(importances['values'][i])) for i in top_idx]
                 logger.info(f"{product_type} {model_type} 주요 특성:")
                 for feature, importance in top_features:
                     logger.info(f"  - {feature}: {importance:.4f}")
@@ -211,6 +200,7 @@ def main():
     parser = argparse.ArgumentParser(description="금융 상품 추천 모델 학습")
     parser.add_argument('--data_dir', type=str, default='data', help='데이터 디렉토리 경로')
     parser.add_argument('--model_dir', type=str, default='models', help='모델 저장 디렉토리 경로')
+    parser.add_argument('--use_gpu', action='store_true', help='LightGBM/XGBoost GPU(CUDA) 학습 사용')
     
     args = parser.parse_args()
     
@@ -223,22 +213,23 @@ def main():
         setup_directories()
         
         # 데이터 로드 및 전처리
-        df = load_and_preprocess_data(args.data_dir)
+        df, category_encoders = load_and_preprocess_data(args.data_dir, args.model_dir)
         
         if df is not None and not df.empty:
             # 특성 생성
-            df, selected_features = generate_features(df)
+            df, selected_features = generate_features(df, category_encoders)
             
             if df is not None and not df.empty:
-                # 모델 학습기 초기화 (타겟 변수 생성용)
-                model_trainer = FinancialModelTrainer(model_dir=args.model_dir)
+                # 모델 학습기 초기화 (타겟 변수 생성과 모델 학습에 함께 사용,
+                # use_gpu가 True이면 대용량 데이터의 LightGBM/XGBoost를 GPU로 학습)
+                model_trainer = FinancialModelTrainer(model_dir=args.model_dir, use_gpu=args.use_gpu)
                 
                 # 타겟 변수 생성
                 targets = create_target_variables(df, model_trainer)
                 
                 if targets:
                     # 모델 학습
-                    results = train_models(df, selected_features, targets, args.model_dir)
+                    results = train_models(df, selected_features, targets, model_trainer)
                     
                     # 결과 요약
                     logger.info("모델 학습 결과 요약:")